@@ -0,0 +1 @@
+"""Rendering, rerendering and binding benchmarks of wxviews"""
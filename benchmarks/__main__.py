@@ -0,0 +1,65 @@
+"""
+Runs benchmarks and compares results with baseline.
+Times are compared relative to reference workload measured in the same run.
+Headless wx backend is used unless WXVIEWS_BACKEND is set.
+"""
+
+from argparse import ArgumentParser
+from os import environ
+from os.path import dirname, join
+from sys import exit as sys_exit
+from typing import List, Optional
+
+environ.setdefault('WXVIEWS_BACKEND', 'headless')
+
+# pylint: disable=wrong-import-position,unused-import
+import wxviews # installs headless backend before wx is imported
+from benchmarks import cases
+from benchmarks.suite import (BENCHMARKS, REFERENCE, compare, format_result, load_baseline, run_benchmarks,
+                              save_baseline, save_results)
+
+BASELINE_PATH = join(dirname(__file__), 'baseline.json')
+
+
+def main(args: Optional[List[str]] = None) -> int:
+    """Runs benchmarks. Returns 1 if any benchmark is slower than baseline"""
+    parser = ArgumentParser(prog = 'python -m benchmarks', description = 'wxviews benchmarks')
+    parser.add_argument('names', nargs = '*', help = 'benchmarks to run, all by default')
+    parser.add_argument('--rounds', type = int, default = 5, help = 'measured rounds')
+    parser.add_argument('--output', help = 'path to write results json')
+    parser.add_argument('--baseline', default = BASELINE_PATH, help = 'path to baseline json')
+    parser.add_argument('--tolerance', type = float, default = 0.3, help = 'allowed slowdown, 0.3 is 30%%')
+    parser.add_argument('--save-baseline', action = 'store_true', help = 'write results as new baseline')
+    parser.add_argument('--list', action = 'store_true', help = 'list benchmarks')
+    options = parser.parse_args(args)
+
+    if options.list:
+        print('\n'.join(BENCHMARKS.keys()))
+        return 0
+    unknown = [name for name in options.names if name not in BENCHMARKS]
+    if unknown:
+        parser.error(f'unknown benchmarks: {", ".join(unknown)}')
+
+    names = [name for name in options.names or BENCHMARKS.keys() if name != REFERENCE]
+    names = [REFERENCE, *names, REFERENCE] # reference is measured before and after benchmarks to reduce drift
+    results = run_benchmarks(names, options.rounds, lambda result: print(format_result(result)))
+    if options.output:
+        save_results(options.output, results)
+    if options.save_baseline:
+        save_baseline(options.baseline, results)
+        return 0
+
+    try:
+        baseline = load_baseline(options.baseline)
+    except FileNotFoundError:
+        print(f'baseline {options.baseline} is not found')
+        return 0
+    regressions = [item for item in compare(results, baseline) if item.is_regression(options.tolerance)]
+    for regression in regressions:
+        print(f'REGRESSION {regression.name}: {regression.baseline:.3f} -> '
+              f'{regression.current:.3f} of reference time ({regression.ratio:.2f}x)')
+    return 1 if regressions else 0
+
+
+if __name__ == '__main__':
+    sys_exit(main())
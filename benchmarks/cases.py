@@ -0,0 +1,200 @@
+"""Rendering, rerendering and binding benchmarks"""
+
+from os.path import join
+from tempfile import mkdtemp
+from typing import Dict, List
+
+import wx
+from injectool import Container, add_singleton, set_default_container
+from pyviews.core.binding import BindableEntity
+from pyviews.core.rendering import Node, NodeGlobals
+from pyviews.rendering.pipeline import render_view
+
+from wxviews.app import register_dependencies
+from wxviews.core.rendering import WxRenderingContext
+from wxviews.widgets.rendering import WxNode
+
+try:
+    from wxviews.inspection import ViewInspectionTree
+except ImportError:
+    ViewInspectionTree = None
+
+from benchmarks.suite import Run, benchmark
+
+NAMESPACES = ("xmlns='wx' xmlns:wxv='wxviews' xmlns:init='init' xmlns:sizer='wxviews.set_sizer' "
+              "xmlns:style='wxviews.style' xmlns:import='wxviews.import_global' import:wx='wx' "
+              "xmlns:binding='binding'")
+NODES_COUNT = 1000
+NESTING_DEPTH = 50
+SWITCHES_COUNT = 100
+ROUND_TRIPS_COUNT = 1000
+
+_VIEWS_FOLDER: List[str] = []
+
+
+class ViewModel(BindableEntity):
+    """Benchmark view model"""
+
+    def __init__(self):
+        super().__init__()
+        self.visible = True
+        self.view = 'page_a'
+        self.text = ''
+
+
+def _use_views(views: Dict[str, str]):
+    if not _VIEWS_FOLDER:
+        _VIEWS_FOLDER.append(mkdtemp(prefix = 'wxviews_benchmarks_'))
+        set_default_container(Container())
+        register_dependencies()
+        add_singleton('views_folder', _VIEWS_FOLDER[0])
+    for name, content in views.items():
+        with open(join(_VIEWS_FOLDER[0], f'{name}.xml'), 'w', encoding = 'utf-8') as view_file:
+            view_file.write(content)
+
+
+def _container(content: str, attrs: str = '') -> str:
+    return (f"<wxv:Container {NAMESPACES} {attrs}>"
+            f"<Panel><BoxSizer init:orient='{{wx.VERTICAL}}'>{content}</BoxSizer></Panel>"
+            f"</wxv:Container>")
+
+
+def _labels(count: int, attrs: str = '') -> str:
+    return ''.join(f"<StaticText Label='label {index}' sizer:flag='{{wx.EXPAND}}' {attrs}/>" for index in range(count))
+
+
+def _render(view_name: str, parent: wx.Window, **node_globals) -> Node:
+    context = WxRenderingContext({'node_globals': NodeGlobals(node_globals), 'parent': parent})
+    return render_view(view_name, context)
+
+
+def _render_and_destroy(view_name: str, **node_globals) -> Run:
+    frame = wx.Frame(None)
+
+    def _run():
+        _render(view_name, frame, **node_globals).destroy()
+
+    return _run
+
+
+@benchmark('render_flat_1k')
+def render_flat() -> Run:
+    """Renders 1k sibling widgets"""
+    _use_views({'flat': _container(_labels(NODES_COUNT))})
+    return _render_and_destroy('flat')
+
+
+@benchmark('render_nested_50')
+def render_nested() -> Run:
+    """Renders panels nested 50 levels deep"""
+    content = _labels(1)
+    for _ in range(NESTING_DEPTH):
+        content = (f"<Panel sizer:flag='{{wx.EXPAND}}'><BoxSizer init:orient='{{wx.VERTICAL}}'>"
+                   f"{_labels(1)}{content}</BoxSizer></Panel>")
+    _use_views({'nested': _container(content)})
+    return _render_and_destroy('nested')
+
+
+def _render_for(count: int) -> Run:
+    _use_views({'for': _container("<wxv:For items='{items}'><StaticText Label='{item}' /></wxv:For>")})
+    return _render_and_destroy('for', items = [str(index) for index in range(count)])
+
+
+@benchmark('for_1k')
+def render_for_1k() -> Run:
+    """Renders For with 1k items"""
+    return _render_for(1000)
+
+
+@benchmark('for_10k', rounds = 3)
+def render_for_10k() -> Run:
+    """Renders For with 10k items"""
+    return _render_for(10000)
+
+
+@benchmark('if_toggle', operations = SWITCHES_COUNT)
+def toggle_if() -> Run:
+    """Toggles If condition rerendering 10 widgets"""
+    _use_views({'if': _container(f"<wxv:If condition='{{vm.visible}}'>{_labels(10)}</wxv:If>")})
+    view_model = ViewModel()
+    _render('if', wx.Frame(None), vm = view_model)
+
+    def _run():
+        for _ in range(SWITCHES_COUNT):
+            view_model.visible = not view_model.visible
+
+    return _run
+
+
+@benchmark('view_switch', operations = SWITCHES_COUNT)
+def switch_view() -> Run:
+    """Switches View between two views with 10 widgets"""
+    _use_views({
+        'view': _container("<wxv:View name='{vm.view}' />"),
+        'page_a': _container(_labels(10)),
+        'page_b': _container(_labels(10))
+    })
+    view_model = ViewModel()
+    _render('view', wx.Frame(None), vm = view_model)
+
+    def _run():
+        for _ in range(SWITCHES_COUNT):
+            view_model.view = 'page_b' if view_model.view == 'page_a' else 'page_a'
+
+    return _run
+
+
+@benchmark('shared_binding_1k', operations = SWITCHES_COUNT)
+def update_shared_binding() -> Run:
+    """Updates 1k widgets bound to the same expression"""
+    labels = _labels(NODES_COUNT, "Enabled='{vm.visible and vm.view == \"page_a\"}' binding:share='true'")
+    _use_views({'shared': _container(labels)})
+    view_model = ViewModel()
+    _render('shared', wx.Frame(None), vm = view_model)
+
+    def _run():
+        for _ in range(SWITCHES_COUNT):
+            view_model.visible = not view_model.visible
+
+    return _run
+
+
+@benchmark('styles_1k')
+def apply_styles() -> Run:
+    """Renders 1k widgets with applied style"""
+    styles = "<wxv:Style name='label' BackgroundColour='white' ForegroundColour='black' />"
+    _use_views({'styles': _container(styles + _labels(NODES_COUNT, "style:_='label'"))})
+    return _render_and_destroy('styles')
+
+
+@benchmark('text_binding_round_trip', operations = ROUND_TRIPS_COUNT)
+def bind_text_round_trip() -> Run:
+    """Updates TextCtrl from view model and view model from TextCtrl"""
+    _use_views({'text': _container("<TextCtrl Value='{{vm.text}}' />")})
+    view_model = ViewModel()
+    node = _render('text', wx.Frame(None), vm = view_model)
+    text_ctrl = node.children[0].children[0].children[0].instance
+
+    def _run():
+        for index in range(ROUND_TRIPS_COUNT):
+            view_model.text = f'model {index}'
+            text_ctrl.SetValue(f'control {index}')
+
+    return _run
+
+
+if ViewInspectionTree is not None:
+
+    @benchmark('inspection_tree_1k')
+    def build_inspection_tree() -> Run:
+        """Builds inspection tree of 1k widgets"""
+        _use_views({'app': f"<App {NAMESPACES}><Frame>{_container(_labels(NODES_COUNT))}</Frame></App>"})
+        render_view('app', WxRenderingContext({'node_globals': NodeGlobals()}))
+        frame = wx.Frame(None)
+        tree = ViewInspectionTree(frame)
+        root = WxNode.Root
+
+        def _run():
+            tree.build_node_tree(root)
+
+        return _run
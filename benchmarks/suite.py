@@ -0,0 +1,154 @@
+"""Benchmark registry, measurement and baseline comparison"""
+
+from gc import collect, disable, enable, isenabled
+from json import dump, load
+from statistics import mean, median
+from time import perf_counter
+from typing import Callable, Dict, Iterable, List, NamedTuple, Optional
+
+Run = Callable[[], None]
+Setup = Callable[[], Run]
+
+
+class Benchmark(NamedTuple):
+    """Benchmark case"""
+    name: str
+    setup: Setup
+    operations: int = 1
+    rounds: Optional[int] = None
+
+
+class Result(NamedTuple):
+    """Measured wall time of benchmark round in seconds"""
+    name: str
+    min: float
+    median: float
+    mean: float
+    rounds: int
+    operations: int
+
+    @property
+    def ops_per_second(self) -> float:
+        """Operations per second of fastest round"""
+        return self.operations / self.min if self.min else 0.0
+
+    def to_dict(self) -> dict:
+        """Returns result as dictionary"""
+        return {**self._asdict(), 'ops_per_second': self.ops_per_second} # pylint: disable=no-member
+
+
+class Comparison(NamedTuple):
+    """Benchmark time relative to reference workload compared to baseline"""
+    name: str
+    baseline: float
+    current: float
+
+    @property
+    def ratio(self) -> float:
+        """Current relative time to baseline relative time"""
+        return self.current / self.baseline if self.baseline else 0.0
+
+    def is_regression(self, tolerance: float) -> bool:
+        """Returns True if current time exceeds baseline more than tolerance"""
+        return self.ratio > 1 + tolerance
+
+
+BENCHMARKS: Dict[str, Benchmark] = {}
+REFERENCE = 'reference'
+REFERENCE_SIZE = 100_000
+
+
+def benchmark(name: str, operations: int = 1, rounds: Optional[int] = None) -> Callable[[Setup], Setup]:
+    """Registers benchmark setup. Setup prepares state and returns measured function"""
+
+    def _decorate(setup: Setup) -> Setup:
+        BENCHMARKS[name] = Benchmark(name, setup, operations, rounds)
+        return setup
+
+    return _decorate
+
+
+@benchmark(REFERENCE)
+def _reference() -> Run:
+    """Plain python workload measuring speed of interpreter and machine"""
+
+    def _run():
+        items = [{'index': index, 'name': str(index)} for index in range(REFERENCE_SIZE)]
+        sorted(items, key = lambda item: item['name'])
+
+    return _run
+
+
+def measure(bench: Benchmark, rounds: int = 5, timer: Callable[[], float] = perf_counter) -> Result:
+    """Runs benchmark warmup and measured rounds. Garbage collection is disabled while round is measured"""
+    rounds = bench.rounds if bench.rounds else rounds
+    run = bench.setup()
+    run()
+    times = []
+    gc_enabled = isenabled()
+    try:
+        for _ in range(rounds):
+            collect()
+            disable()
+            start = timer()
+            run()
+            times.append(timer() - start)
+            if gc_enabled:
+                enable()
+    finally:
+        if gc_enabled:
+            enable()
+    return Result(bench.name, min(times), median(times), mean(times), rounds, bench.operations)
+
+
+def run_benchmarks(names: Optional[Iterable[str]] = None,
+                   rounds: int = 5,
+                   report: Callable[[Result], None] = lambda result: None) -> List[Result]:
+    """Measures registered benchmarks"""
+    names = BENCHMARKS.keys() if names is None else names
+    results = []
+    for name in names:
+        result = measure(BENCHMARKS[name], rounds)
+        report(result)
+        results.append(result)
+    return results
+
+
+def get_relative_times(results: Iterable[Result]) -> Dict[str, float]:
+    """Returns fastest round time relative to fastest reference workload by benchmark name"""
+    results = list(results)
+    reference = min((result.min for result in results if result.name == REFERENCE), default = None)
+    if not reference:
+        raise ValueError(f'"{REFERENCE}" benchmark result is required')
+    return {result.name: result.min / reference for result in results if result.name != REFERENCE}
+
+
+def save_results(path: str, results: Iterable[Result]):
+    """Writes results json"""
+    with open(path, 'w', encoding = 'utf-8') as results_file:
+        dump({'benchmarks': [result.to_dict() for result in results]}, results_file, indent = 2)
+
+
+def save_baseline(path: str, results: Iterable[Result]):
+    """Writes baseline json with times relative to reference workload"""
+    relative = get_relative_times(results)
+    with open(path, 'w', encoding = 'utf-8') as baseline_file:
+        dump({'relative': relative}, baseline_file, indent = 2)
+
+
+def load_baseline(path: str) -> Dict[str, float]:
+    """Returns baseline time relative to reference workload by benchmark name"""
+    with open(path, encoding = 'utf-8') as baseline_file:
+        return load(baseline_file)['relative']
+
+
+def compare(results: Iterable[Result], baseline: Dict[str, float]) -> List[Comparison]:
+    """Compares times relative to reference workload measured in the same run with baseline"""
+    relative = get_relative_times(results)
+    return [Comparison(name, baseline[name], time) for name, time in relative.items() if name in baseline]
+
+
+def format_result(result: Result) -> str:
+    """Returns result line"""
+    return (f'{result.name:<32} {result.min * 1000:>10.3f} ms {result.median * 1000:>10.3f} ms '
+            f'{result.ops_per_second:>12.1f} ops/s')
@@ -0,0 +1,95 @@
+from itertools import count
+from json import loads
+from unittest.mock import Mock
+
+from pytest import mark, raises
+
+from benchmarks.suite import (REFERENCE, Benchmark, Comparison, Result, compare, get_relative_times, load_baseline,
+                              measure, save_baseline, save_results)
+
+
+class MeasureTests:
+    """measure() tests"""
+
+    @staticmethod
+    def test_runs_warmup_and_rounds():
+        """should run setup once, warmup round and measured rounds"""
+        run = Mock()
+        setup = Mock(return_value = run)
+
+        result = measure(Benchmark('name', setup, operations = 10), rounds = 3, timer = count().__next__)
+
+        assert setup.call_count == 1
+        assert run.call_count == 4
+        assert result == Result('name', 1, 1, 1, 3, 10)
+        assert result.ops_per_second == 10
+
+    @staticmethod
+    def test_uses_benchmark_rounds():
+        """should use rounds of benchmark"""
+        result = measure(Benchmark('name', Mock(), rounds = 2), rounds = 5, timer = count().__next__)
+
+        assert result.rounds == 2
+
+
+class ComparisonTests:
+    """Comparison tests"""
+
+    @staticmethod
+    @mark.parametrize('baseline, current, tolerance, expected', [
+        (1.0, 1.0, 0.25, False),
+        (1.0, 1.25, 0.25, False),
+        (1.0, 1.3, 0.25, True),
+        (1.0, 0.5, 0.0, False)
+    ]) # yapf: disable
+    def test_is_regression(baseline, current, tolerance, expected):
+        """is_regression() should return True if current time exceeds baseline more than tolerance"""
+        assert Comparison('name', baseline, current).is_regression(tolerance) == expected
+
+
+def test_get_relative_times():
+    """get_relative_times() should divide fastest times by fastest reference time"""
+    results = [
+        Result(REFERENCE, 2.5, 2.5, 2.5, 1, 1),
+        Result('one', 3.0, 4.0, 4.0, 1, 1),
+        Result(REFERENCE, 2.0, 2.0, 2.0, 1, 1)
+    ]
+
+    assert get_relative_times(results) == {'one': 1.5}
+
+
+def test_get_relative_times_raises():
+    """get_relative_times() should raise ValueError if reference is not measured"""
+    with raises(ValueError):
+        get_relative_times([Result('one', 1.0, 1.0, 1.0, 1, 1)])
+
+
+def test_compare():
+    """compare() should compare relative times of results that have baseline"""
+    results = [
+        Result(REFERENCE, 0.5, 0.5, 0.5, 1, 1),
+        Result('one', 2.0, 2.0, 2.0, 1, 1),
+        Result('new', 1.0, 1.0, 1.0, 1, 1)
+    ]
+
+    actual = compare(results, {'one': 2.0, 'removed': 1.0})
+
+    assert actual == [Comparison('one', 2.0, 4.0)]
+
+
+def test_save_and_load_baseline(tmp_path):
+    """load_baseline() should read relative times saved by save_baseline()"""
+    path = str(tmp_path / 'baseline.json')
+
+    save_baseline(path, [Result(REFERENCE, 0.5, 0.5, 0.5, 3, 1), Result('one', 1.5, 2.0, 2.5, 3, 1)])
+
+    assert load_baseline(path) == {'one': 3.0}
+
+
+def test_save_results(tmp_path):
+    """save_results() should write measured times"""
+    path = tmp_path / 'results.json'
+
+    save_results(str(path), [Result('one', 1.5, 2.0, 2.5, 3, 1)])
+
+    assert loads(path.read_text(encoding = 'utf-8'))['benchmarks'][0]['min'] == 1.5
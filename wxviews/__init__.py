@@ -1,13 +1,17 @@
 """Package adapts pyviews for using with wxpython"""
 
+__version__ = '0.8.0'
+
 from pyviews.setters import import_global, inject_global, set_global, call, call_args
 from pyviews.code import Code
-from pyviews.containers import Container, View, For, If
+from pyviews.containers import Container
 from pyviews.presenter import Presenter, PresenterNode, add_reference
 
+# backend should be installed before wx is imported by other wxviews modules
+from wxviews import backend # pylint: disable=unused-import
+from wxviews.containers import For, If, Lazy, View, VirtualFor
+from wxviews.notebook import Page
 from wxviews.sizers import GrowableCol, GrowableRow, set_sizer
 from wxviews.widgets.rendering import get_root
 from wxviews.widgets.setters import bind, show
 from wxviews.styles import Style, StylesView, style
-
-__version__ = '0.8.0'
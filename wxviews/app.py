@@ -1,6 +1,6 @@
 """wxviews application entry point"""
 
-from typing import cast
+from typing import Dict, Optional, cast
 
 from injectool import add_singleton
 from pyviews.binding.config import use_binding
@@ -10,9 +10,14 @@ from pyviews.rendering.context import get_child_context
 from pyviews.rendering.pipeline import RenderingPipeline, render_view, use_pipeline
 from pyviews.rendering.config import use_rendering
 
-from wxviews.containers import get_container_pipeline, get_for_pipeline, get_if_pipeline, get_view_pipeline
+from wxviews.containers import (get_container_pipeline, get_for_pipeline, get_if_pipeline, get_lazy_pipeline,
+                                get_view_pipeline, get_virtual_for_pipeline)
+from wxviews.core.expressions import use_code_cache
+from wxviews.core.plan import use_render_plans
+from wxviews.core.progressive import ProgressiveRenderer
 from wxviews.core.rendering import WxRenderingContext, get_wx_child_context
 from wxviews.menus import get_menu_bar_pipeline, get_menu_item_pipeline, get_menu_pipeline
+from wxviews.notebook import get_notebook_pipeline, get_page_pipeline
 from wxviews.sizers import get_growable_col_pipeline, get_growable_row_pipeline, get_sizer_pipeline
 from wxviews.styles import get_style_pipeline, get_styles_view_pipeline
 from wxviews.widgets.binding import use_events_binding
@@ -22,6 +27,8 @@ from wxviews.widgets.rendering import WxNode, get_app_pipeline, get_frame_pipeli
 def register_dependencies():
     """Registers all dependencies needed for application"""
     use_rendering()
+    use_code_cache()
+    use_render_plans()
     use_binding()
     use_events_binding()
     use_wx_pipelines()
@@ -30,37 +37,54 @@ def register_dependencies():
 def use_wx_pipelines():
     """Returns resolver for RenderingPipeline"""
     add_singleton(get_child_context, get_wx_child_context)
+    for class_path, pipeline in get_wx_pipelines().items():
+        use_pipeline(pipeline, class_path)
 
-    use_pipeline(get_wx_pipeline(), 'wx')
-    use_pipeline(get_app_pipeline(), 'wx.App')
-    use_pipeline(get_frame_pipeline(), 'wx.Frame')
 
-    use_pipeline(get_container_pipeline(), 'wxviews.Container')
-    use_pipeline(get_view_pipeline(), 'wxviews.View')
-    use_pipeline(get_for_pipeline(), 'wxviews.For')
-    use_pipeline(get_if_pipeline(), 'wxviews.If')
+def get_wx_pipelines() -> Dict[str, RenderingPipeline]:
+    """Returns wxviews rendering pipelines by class path"""
+    return {
+        'wx': get_wx_pipeline(),
+        'wx.App': get_app_pipeline(),
+        'wx.Frame': get_frame_pipeline(),
 
-    use_pipeline(get_sizer_pipeline(), 'wx.GridSizer')
-    use_pipeline(get_sizer_pipeline(), 'wx.FlexGridSizer')
-    use_pipeline(get_sizer_pipeline(), 'wx.GridBagSizer')
-    use_pipeline(get_sizer_pipeline(), 'wx.BoxSizer')
-    use_pipeline(get_sizer_pipeline(), 'wx.StaticBoxSizer')
-    use_pipeline(get_growable_row_pipeline(), 'wxviews.GrowableRow')
-    use_pipeline(get_growable_col_pipeline(), 'wxviews.GrowableCol')
+        'wxviews.Container': get_container_pipeline(),
+        'wxviews.View': get_view_pipeline(),
+        'wxviews.For': get_for_pipeline(),
+        'wxviews.VirtualFor': get_virtual_for_pipeline(),
+        'wxviews.If': get_if_pipeline(),
+        'wxviews.Lazy': get_lazy_pipeline(),
 
-    use_pipeline(get_menu_bar_pipeline(), 'wx.MenuBar')
-    use_pipeline(get_menu_pipeline(), 'wx.Menu')
-    use_pipeline(get_menu_item_pipeline(), 'wx.MenuItem')
+        'wx.GridSizer': get_sizer_pipeline(),
+        'wx.FlexGridSizer': get_sizer_pipeline(),
+        'wx.GridBagSizer': get_sizer_pipeline(),
+        'wx.BoxSizer': get_sizer_pipeline(),
+        'wx.StaticBoxSizer': get_sizer_pipeline(),
+        'wxviews.GrowableRow': get_growable_row_pipeline(),
+        'wxviews.GrowableCol': get_growable_col_pipeline(),
 
-    use_pipeline(get_style_pipeline(), 'wxviews.Style')
-    use_pipeline(get_styles_view_pipeline(), 'wxviews.StylesView')
-    use_pipeline(RenderingPipeline(pipes = [run_code]), 'wxviews.Code')
+        'wx.MenuBar': get_menu_bar_pipeline(),
+        'wx.Menu': get_menu_pipeline(),
+        'wx.MenuItem': get_menu_item_pipeline(),
 
-    use_pipeline(get_presenter_pipeline(), 'wxviews.PresenterNode')
+        'wx.Notebook': get_notebook_pipeline(),
+        'wx.aui.AuiNotebook': get_notebook_pipeline(),
+        'wxviews.Page': get_page_pipeline(),
 
+        'wxviews.Style': get_style_pipeline(),
+        'wxviews.StylesView': get_styles_view_pipeline(),
+        'wxviews.Code': RenderingPipeline(pipes = [run_code]),
 
-def launch(context: WxRenderingContext, root_view = None):
+        'wxviews.PresenterNode': get_presenter_pipeline()
+    } # yapf: disable
+
+
+def launch(context: WxRenderingContext, root_view = None, renderer: Optional[ProgressiveRenderer] = None):
     """Runs application. Widgets are created from passed xml_files"""
     root_view = 'root' if root_view is None else root_view
+    if renderer is not None:
+        renderer.begin()
     root = cast(WxNode, render_view(root_view, context))
+    if renderer is not None:
+        renderer.start(root.instance)
     root.instance.MainLoop()
@@ -0,0 +1,6 @@
+"""Installs wx backend selected by WXVIEWS_BACKEND environment variable. Imported for side effect"""
+
+from wxviews import headless
+
+if headless.is_requested():
+    headless.install()
@@ -1,19 +1,605 @@
 """Contains methods for node setups creation"""
+from collections import OrderedDict, deque
 from functools import partial
+from typing import Any, Callable, Deque, Dict, Hashable, Iterator, List, Optional, Tuple
 
-from pyviews.containers import (render_container_children, render_for_items, render_if, render_view_content,
-                                rerender_on_condition_change, rerender_on_items_change, rerender_on_view_change)
+from pyviews import containers
+from pyviews.containers import render_container_children, render_for_items, render_if, render_view_content
+from pyviews.containers import _on_items_changed as _update_items # pylint: disable=protected-access
 from pyviews.core.binding import Bindable
-from pyviews.rendering.pipeline import RenderingPipeline
+from pyviews.core.rendering import Node, NodeGlobals
+from pyviews.core.xml import XmlNode
+from pyviews.rendering.context import get_child_context
+from pyviews.rendering.pipeline import RenderingPipeline, render
+from wx import EVT_SCROLLWIN, EVT_SHOW, EVT_SIZE, CallAfter, Event, Sizer, SizerItem, ShowEvent, Window
 
+from wxviews.core.layout import layout, render_transaction
+from wxviews.core.node import Sizerable
 from wxviews.core.pipes import apply_attributes
-from wxviews.core.rendering import WxRenderingContext
+from wxviews.core.progressive import complete
+from wxviews.core.rendering import WxRenderingContext, to_bool
+
+
+class KeptSubtree:
+    """Hidden subtree detached from sizer"""
+
+    def __init__(self, children: List[Node], shown: List[Tuple[Window, bool]]):
+        self.children: List[Node] = children
+        self.shown: List[Tuple[Window, bool]] = shown
+
+
+class SubtreeCache:
+    """LRU cache of hidden subtrees"""
+
+    def __init__(self, max_size: int = 0):
+        self._max_size: int = max_size
+        self._subtrees: 'OrderedDict[Hashable, KeptSubtree]' = OrderedDict()
+
+    @property
+    def max_size(self) -> int:
+        """Max count of kept subtrees"""
+        return self._max_size
+
+    @max_size.setter
+    def max_size(self, value: int):
+        self._max_size = value
+        self._trim()
+
+    def put(self, key: Hashable, subtree: KeptSubtree):
+        """Stores subtree. Subtree stored with the same key is destroyed"""
+        stored = self._subtrees.get(key)
+        if stored is not None and stored is not subtree:
+            _destroy_nodes(stored.children)
+        self._subtrees[key] = subtree
+        self._subtrees.move_to_end(key)
+        self._trim()
+
+    def pop(self, key: Hashable) -> Optional[KeptSubtree]:
+        """Removes and returns subtree"""
+        return self._subtrees.pop(key, None)
+
+    def clear(self):
+        """Destroys kept subtrees"""
+        subtrees, self._subtrees = self._subtrees, OrderedDict()
+        for subtree in subtrees.values():
+            _destroy_nodes(subtree.children)
+
+    def _trim(self):
+        while len(self._subtrees) > self._max_size:
+            _, subtree = self._subtrees.popitem(last = False)
+            _destroy_nodes(subtree.children)
+
+
+def _destroy_nodes(nodes: List[Node]):
+    for node in nodes:
+        node.destroy()
+
+
+class View(containers.View):
+    """Loads xml from another file. Previous views are kept hidden if keep_alive is set"""
+
+    def __init__(self, xml_node: XmlNode, node_globals: Optional[NodeGlobals] = None):
+        super().__init__(xml_node, node_globals = node_globals)
+        self._kept: SubtreeCache = SubtreeCache()
+
+    @property
+    def keep_alive(self) -> int:
+        """Count of kept hidden views"""
+        return self._kept.max_size
+
+    @keep_alive.setter
+    def keep_alive(self, value: int):
+        self._kept.max_size = int(value)
+
+    @property
+    def kept(self) -> SubtreeCache:
+        """Kept hidden views"""
+        return self._kept
+
+    def destroy(self):
+        super().destroy()
+        self._kept.clear()
+
+
+class If(containers.If):
+    """Renders children if condition is True. Children are kept hidden if keep_alive is set"""
+
+    def __init__(self, xml_node: XmlNode, node_globals: Optional[NodeGlobals] = None):
+        super().__init__(xml_node, node_globals = node_globals)
+        self._kept: SubtreeCache = SubtreeCache()
+
+    @property
+    def keep_alive(self) -> bool:
+        """Keep hidden children"""
+        return self._kept.max_size > 0
+
+    @keep_alive.setter
+    def keep_alive(self, value: bool):
+        self._kept.max_size = 1 if to_bool(value) else 0
+
+    @property
+    def kept(self) -> SubtreeCache:
+        """Kept hidden children"""
+        return self._kept
+
+    def destroy(self):
+        super().destroy()
+        self._kept.clear()
+
+
+class Lazy(containers.Container, Bindable):
+    """Renders children when trigger becomes true or parent window is shown"""
+
+    def __init__(self, xml_node: XmlNode, node_globals: Optional[NodeGlobals] = None):
+        Bindable.__init__(self)
+        containers.Container.__init__(self, xml_node, node_globals = node_globals)
+        self._trigger: bool = False
+        self._rendered: bool = False
+        self._placeholder: Optional[SizerItem] = None
+
+    @property
+    def trigger(self) -> bool:
+        """Children are rendered when trigger is true"""
+        return self._trigger
+
+    @trigger.setter
+    def trigger(self, value: bool):
+        old_value = self._trigger
+        self._trigger = to_bool(value)
+        self._notify('trigger', self._trigger, old_value)
+
+    @property
+    def rendered(self) -> bool:
+        """Are children rendered"""
+        return self._rendered
+
+    @rendered.setter
+    def rendered(self, value: bool):
+        self._rendered = value
+
+    @property
+    def placeholder(self) -> Optional[SizerItem]:
+        """Spacer keeping children position in sizer"""
+        return self._placeholder
+
+    @placeholder.setter
+    def placeholder(self, value: Optional[SizerItem]):
+        self._placeholder = value
+
+
+class For(containers.For):
+    """Renders children for every item in items collection. Children are reused by item key if key is set"""
+
+    def __init__(self, xml_node: XmlNode, node_globals: Optional[NodeGlobals] = None):
+        super().__init__(xml_node, node_globals = node_globals)
+        self._key: Optional[Callable[[Any], Hashable]] = None
+
+    @property
+    def key(self) -> Optional[Callable[[Any], Hashable]]:
+        """Returns item key function"""
+        return self._key
+
+    @key.setter
+    def key(self, value: Optional[Callable[[Any], Hashable]]):
+        self._key = value
+
+
+DEFAULT_ROW_HEIGHT = 24
+DEFAULT_OVERSCAN = 5
+
+
+class VirtualFor(For):
+    """Renders children only for items visible in scrolled parent"""
+
+    def __init__(self, xml_node: XmlNode, node_globals: Optional[NodeGlobals] = None):
+        super().__init__(xml_node, node_globals = node_globals)
+        self._row_height: int = DEFAULT_ROW_HEIGHT
+        self._overscan: int = DEFAULT_OVERSCAN
+        self._spacers: Optional[Tuple[SizerItem, SizerItem]] = None
+        self._update_scheduled: bool = False
+
+    @property
+    def row_height(self) -> int:
+        """Height of item row in pixels"""
+        return self._row_height
+
+    @row_height.setter
+    def row_height(self, value: int):
+        old_value = self._row_height
+        self._row_height = int(value)
+        self._notify('row_height', self._row_height, old_value)
+
+    @property
+    def overscan(self) -> int:
+        """Count of rows rendered above and below visible rows"""
+        return self._overscan
+
+    @overscan.setter
+    def overscan(self, value: int):
+        self._overscan = int(value)
+
+    @property
+    def spacers(self) -> Optional[Tuple[SizerItem, SizerItem]]:
+        """Spacers replacing rows above and below rendered rows"""
+        return self._spacers
+
+    @spacers.setter
+    def spacers(self, value: Optional[Tuple[SizerItem, SizerItem]]):
+        self._spacers = value
+
+    @property
+    def update_scheduled(self) -> bool:
+        """Is rows update scheduled"""
+        return self._update_scheduled
+
+    @update_scheduled.setter
+    def update_scheduled(self, value: bool):
+        self._update_scheduled = value
 
 
 def layout_parent_on_change(changed_property: str, container: Bindable, context: WxRenderingContext):
     """Call parent.Layout() on property change"""
     if context.parent:
-        container.observe(changed_property, lambda _, __: context.parent.Layout())
+        container.observe(changed_property, lambda _, __: layout(context.parent))
+
+
+def _rerender(rerender: Callable, node: Bindable, context: WxRenderingContext, *args):
+    with render_transaction(context.parent):
+        rerender(node, context, *args)
+
+
+def _rerender_view(node: View, context: WxRenderingContext, old_name: Optional[str] = None):
+    _switch_subtree(node, context, old_name, node.name, render_view_content)
+
+
+def _rerender_if(node: If, context: WxRenderingContext, old_condition: Any = None):
+    _switch_subtree(node, context, bool(old_condition), bool(node.condition), render_if)
+
+
+def _switch_subtree(node: Node, context: WxRenderingContext, old_key: Hashable, key: Hashable,
+                    render_subtree: Callable):
+    if old_key == key:
+        return
+    kept: Optional[SubtreeCache] = getattr(node, 'kept', None)
+    start = _get_sizer_start(context.sizer, list(_get_sizer_nodes(node.children)))
+    subtree = kept.pop(key) if kept is not None and key else None
+    if kept is not None and kept.max_size > 0 and node.children and old_key:
+        complete(node)
+        kept.put(old_key, _detach_subtree(node.children, context.sizer))
+        node._children = [] # pylint: disable=protected-access
+    else:
+        node.destroy_children()
+
+    if subtree is None:
+        render_subtree(node, context)
+    else:
+        _attach_subtree(subtree, context.sizer)
+        node.add_children(subtree.children)
+
+    if context.sizer is not None and start is not None:
+        _reorder_sizer(context.sizer, list(_get_sizer_nodes(node.children)), start)
+
+
+def _get_sizer_nodes(nodes: List[Node]) -> Iterator[Node]:
+    for node in nodes:
+        if isinstance(node, Sizerable):
+            yield node
+        else:
+            yield from _get_sizer_nodes(node.children)
+
+
+def _get_windows(nodes: List[Node]) -> Iterator[Window]:
+    for node in nodes:
+        instance = getattr(node, 'instance', None)
+        if isinstance(instance, Window):
+            yield instance
+        else:
+            yield from _get_windows(node.children)
+
+
+def _detach_subtree(children: List[Node], sizer: Optional[Sizer]) -> KeptSubtree:
+    shown = [(window, window.IsShown()) for window in _get_windows(children)]
+    for window, _ in shown:
+        window.Hide()
+    if sizer is not None:
+        for node in _get_sizer_nodes(children):
+            sizer.Detach(node.sizer_item)
+    return KeptSubtree(children, shown)
+
+
+def _attach_subtree(subtree: KeptSubtree, sizer: Optional[Sizer]):
+    if sizer is not None:
+        for node in _get_sizer_nodes(subtree.children):
+            sizer.Add(node.sizer_item, **node.sizer_args)
+    for window, shown in subtree.shown:
+        window.Show(shown)
+
+
+def rerender_on_view_change(node: View, context: WxRenderingContext):
+    """Subscribes to name change and renders new view in render transaction"""
+    node.observe('name', lambda _, old_name: _rerender(_rerender_view, node, context, old_name))
+
+
+def rerender_on_condition_change(node: If, context: WxRenderingContext):
+    """Rerenders if on condition change in render transaction"""
+    node.observe('condition', lambda _, old_condition: _rerender(_rerender_if, node, context, old_condition))
+
+
+def rerender_on_items_change(node: For, context: WxRenderingContext):
+    """Subscribes to items change and updates children in render transaction"""
+    node.observe('items', lambda *_: _rerender(_update_for_items, node, context))
+
+
+def _update_for_items(node: For, context: WxRenderingContext):
+    if getattr(node, 'key', None) is None:
+        _update_items(node, context)
+    else:
+        _update_keyed_items(node, context)
+
+
+def _update_keyed_items(node: For, context: WxRenderingContext):
+    group_size = len(node.xml_node.children)
+    if group_size == 0:
+        return
+    start = _get_sizer_start(context.sizer, list(_get_sizer_nodes(node.children)))
+    groups = _get_item_groups(node, group_size)
+    matched = [(index, item, _pop_group(groups, node.key(item))) for index, item in enumerate(node.items)]
+    for group in groups.values():
+        for children in group:
+            for child in children:
+                child.destroy()
+
+    children = []
+    for index, item, group in matched:
+        if group is None:
+            group = _render_item(node, index, item, context)
+        else:
+            for child in group:
+                child.node_globals['item'] = item
+                child.node_globals['index'] = index
+        children.extend(group)
+    node._children = children # pylint: disable=protected-access
+
+    if context.sizer is not None:
+        _reorder_sizer(context.sizer, list(_get_sizer_nodes(children)), start)
+
+
+def _get_groups(children: List[Node], group_size: int) -> List[List[Node]]:
+    return [children[position:position + group_size] for position in range(0, len(children), group_size)]
+
+
+def _get_item_groups(node: For, group_size: int) -> Dict[Hashable, Deque[List[Node]]]:
+    groups: Dict[Hashable, Deque[List[Node]]] = {}
+    for group in _get_groups(node.children, group_size):
+        groups.setdefault(node.key(group[0].node_globals['item']), deque()).append(group)
+    return groups
+
+
+def _pop_group(groups: Dict[Hashable, Deque[List[Node]]], key: Hashable) -> Optional[List[Node]]:
+    group = groups.get(key)
+    if not group:
+        return None
+    children = group.popleft()
+    if not group:
+        del groups[key]
+    return children
+
+
+def _render_item(node: For, index: int, item: Any, context: WxRenderingContext) -> List[Node]:
+    children = []
+    for xml_node in node.xml_node.children:
+        child_context = get_child_context(xml_node, node, context)
+        child_context.node_globals['index'] = index
+        child_context.node_globals['item'] = item
+        children.append(render(child_context))
+    return children
+
+
+def _get_sizer_items(sizer: Sizer) -> List[Any]:
+    return [
+        item.GetWindow() if item.IsWindow() else item.GetSizer() if item.IsSizer() else item
+        for item in sizer.GetChildren()
+    ]
+
+
+def _get_sizer_start(sizer: Optional[Sizer], children: List[Node]) -> Optional[int]:
+    if sizer is None:
+        return None
+    items = {id(child.sizer_item) for child in children if isinstance(child, Sizerable)}
+    return next((index for index, item in enumerate(_get_sizer_items(sizer)) if id(item) in items), None)
+
+
+def _reorder_sizer(sizer: Sizer, children: List[Node], start: Optional[int]):
+    items = _get_sizer_items(sizer)
+    nodes = [child for child in children if isinstance(child, Sizerable)]
+    position = _get_sizer_start(sizer, nodes) if start is None else start
+    if position is None:
+        return
+    for node in nodes:
+        current = next((index for index in range(position, len(items)) if items[index] is node.sizer_item), None)
+        if current is None:
+            continue
+        if current != position:
+            sizer.Detach(node.sizer_item)
+            sizer.Insert(position, node.sizer_item, **node.sizer_args)
+            items.insert(position, items.pop(current))
+        position += 1
+
+
+def render_virtual_items(node: VirtualFor, context: WxRenderingContext):
+    """Adds spacers to sizer and renders visible rows"""
+    if context.sizer is None:
+        msg = f'sizer is missing for VirtualFor {node.xml_node.view_info}'
+        raise ValueError(msg)
+    node.spacers = (context.sizer.Add(0, 0), context.sizer.Add(0, 0))
+    update_virtual_items(node, context)
+
+
+def update_virtual_items(node: VirtualFor, context: WxRenderingContext):
+    """Renders visible rows reusing rendered ones"""
+    node.update_scheduled = False
+    group_size = len(node.xml_node.children)
+    if node.spacers is None or group_size == 0:
+        return
+    first, last = _get_visible_range(node, context.parent)
+    with render_transaction(context.parent):
+        groups = _get_groups(node.children, group_size)
+        for group in groups[last - first:]:
+            for child in group:
+                child.destroy()
+        children = []
+        for position, index in enumerate(range(first, last)):
+            item = node.items[index]
+            if position < len(groups):
+                for child in groups[position]:
+                    child.node_globals['item'] = item
+                    child.node_globals['index'] = index
+                children.extend(groups[position])
+            else:
+                children.extend(_render_item(node, index, item, context))
+        node._children = children # pylint: disable=protected-access
+
+        top, bottom = node.spacers
+        top.AssignSpacer((0, first * node.row_height))
+        bottom.AssignSpacer((0, (len(node.items) - last) * node.row_height))
+        start = _get_sizer_index(context.sizer, top)
+        if start is not None:
+            _reorder_sizer(context.sizer, children, start + 1)
+        layout(context.sizer)
+    if hasattr(context.parent, 'FitInside'):
+        context.parent.FitInside()
+
+
+def _get_visible_range(node: VirtualFor, parent: Any) -> Tuple[int, int]:
+    row_height = max(node.row_height, 1)
+    try:
+        view_top = parent.GetViewStart()[1] * parent.GetScrollPixelsPerUnit()[1]
+        view_height = parent.GetClientSize()[1]
+        rows_top = node.spacers[0].GetPosition()[1]
+    except AttributeError:
+        view_top, view_height, rows_top = 0, 0, 0
+    count = len(node.items)
+    visible_count = -(-view_height // row_height) + 2 * node.overscan
+    first = max(0, min((view_top - rows_top) // row_height - node.overscan, count - visible_count))
+    return first, min(count, first + visible_count)
+
+
+def _get_sizer_index(sizer: Sizer, item: Any) -> Optional[int]:
+    return next((index for index, sizer_item in enumerate(_get_sizer_items(sizer)) if sizer_item is item), None)
+
+
+def update_virtual_items_on_scroll(node: VirtualFor, context: WxRenderingContext):
+    """Updates rendered rows on parent scroll and resize"""
+    handler = partial(_on_view_changed, node, context)
+    for event in [EVT_SCROLLWIN, EVT_SIZE]:
+        context.parent.Bind(event, handler)
+
+    def _unbind(destroyed: VirtualFor):
+        for unbind_event in [EVT_SCROLLWIN, EVT_SIZE]:
+            context.parent.Unbind(unbind_event, handler = handler)
+        destroyed.spacers = None
+
+    _add_on_destroy(node, _unbind)
+
+
+def _add_on_destroy(node: Node, callback: Callable[[Node], None]):
+    on_destroy = node.on_destroy
+
+    def _on_destroy(destroyed: Node):
+        callback(destroyed)
+        on_destroy(destroyed)
+
+    node.on_destroy = _on_destroy
+
+
+def _on_view_changed(node: VirtualFor, context: WxRenderingContext, event: Event):
+    event.Skip()
+    if not node.update_scheduled:
+        node.update_scheduled = True
+        CallAfter(update_virtual_items, node, context)
+
+
+def rerender_virtual_items_on_change(node: VirtualFor, context: WxRenderingContext):
+    """Updates rendered rows on items or row height change"""
+    node.observe('items', lambda *_: update_virtual_items(node, context))
+    node.observe('row_height', lambda *_: update_virtual_items(node, context))
+
+
+def render_lazy(node: Lazy, context: WxRenderingContext):
+    """Renders children if trigger is true or parent is shown, otherwise adds placeholder to sizer"""
+    if node.trigger or _is_shown_on_screen(context.parent):
+        _render_lazy_children(node, context)
+    elif context.sizer is not None:
+        node.placeholder = context.sizer.Add(0, 0)
+
+
+def _is_shown_on_screen(window: Optional[Window]) -> bool:
+    return window is None or window.IsShownOnScreen()
+
+
+def _render_lazy_children(node: Lazy, context: WxRenderingContext):
+    node.rendered = True
+    with render_transaction(context.parent):
+        render_container_children(node, context)
+        if context.sizer is not None and node.placeholder is not None:
+            index = _get_sizer_index(context.sizer, node.placeholder)
+            node.placeholder = None
+            if index is not None:
+                context.sizer.Remove(index)
+                _reorder_sizer(context.sizer, list(_get_sizer_nodes(node.children)), index)
+    if context.parent is not None:
+        layout(context.parent)
+
+
+def render_lazy_on_trigger(node: Lazy, context: WxRenderingContext):
+    """Renders Lazy children once trigger becomes true or parent window is shown"""
+    if node.rendered:
+        return
+    windows = _get_ancestors(context.parent)
+    released = False
+
+    def _render(*_):
+        if not node.rendered:
+            _release()
+            _render_lazy_children(node, context)
+
+    def _on_trigger(value: bool, _):
+        if value:
+            _render()
+
+    def _on_show(event: ShowEvent):
+        event.Skip()
+        if event.IsShown():
+            CallAfter(_render_if_shown)
+
+    def _render_if_shown():
+        if not released and not node.rendered and _is_shown_on_screen(context.parent):
+            _render()
+
+    def _release(*_):
+        nonlocal released
+        released = True
+        node.release('trigger', _on_trigger)
+        for window in windows:
+            try:
+                window.Unbind(EVT_SHOW, handler = _on_show)
+            except RuntimeError:
+                pass
+
+    node.observe('trigger', _on_trigger)
+    for window in windows:
+        window.Bind(EVT_SHOW, _on_show)
+    _add_on_destroy(node, _release)
+
+
+def _get_ancestors(window: Optional[Window]) -> List[Window]:
+    ancestors = []
+    while window is not None:
+        ancestors.append(window)
+        if window.IsTopLevel():
+            break
+        window = window.GetParent()
+    return ancestors
 
 
 def get_container_pipeline() -> RenderingPipeline:
@@ -52,3 +638,22 @@ def get_if_pipeline() -> RenderingPipeline:
         rerender_on_condition_change,
         partial(layout_parent_on_change, 'condition')
     ], name='if pipeline') # yapf: disable
+
+
+def get_virtual_for_pipeline() -> RenderingPipeline:
+    """Returns setup for VirtualFor node"""
+    return RenderingPipeline(pipes=[
+        apply_attributes,
+        render_virtual_items,
+        update_virtual_items_on_scroll,
+        rerender_virtual_items_on_change
+    ], name='virtual for pipeline') # yapf: disable
+
+
+def get_lazy_pipeline() -> RenderingPipeline:
+    """Returns setup for Lazy node"""
+    return RenderingPipeline(pipes=[
+        apply_attributes,
+        render_lazy,
+        render_lazy_on_trigger
+    ], name='lazy pipeline') # yapf: disable
@@ -0,0 +1,136 @@
+"""Cache of compiled expressions"""
+
+from collections import OrderedDict
+from functools import lru_cache
+from threading import Lock
+from types import CodeType
+from typing import Any, FrozenSet, NamedTuple, Optional, Set, Union
+
+from injectool import add_singleton
+from pyviews.core.error import error_handling
+from pyviews.core.expression import Expression, ExpressionError, execute
+
+DEFAULT_CACHE_SIZE = 1024
+
+
+class CacheInfo(NamedTuple):
+    """Code cache statistics"""
+    hits: int
+    misses: int
+    max_size: int
+    size: int
+
+
+class CodeCache:
+    """Bounded LRU cache of code objects compiled from expression bodies"""
+
+    def __init__(self, max_size: int = DEFAULT_CACHE_SIZE):
+        self._max_size: int = max_size
+        self._codes: 'OrderedDict[str, CodeType]' = OrderedDict()
+        self._hits: int = 0
+        self._misses: int = 0
+        self._lock: Lock = Lock()
+
+    @property
+    def hits(self) -> int:
+        """Count of found code objects"""
+        return self._hits
+
+    @property
+    def misses(self) -> int:
+        """Count of compiled code objects"""
+        return self._misses
+
+    @property
+    def max_size(self) -> int:
+        """Max count of stored code objects"""
+        return self._max_size
+
+    @max_size.setter
+    def max_size(self, value: int):
+        with self._lock:
+            self._max_size = value
+            self._trim()
+
+    def get(self, body: str) -> CodeType:
+        """Returns compiled code for expression body"""
+        with self._lock:
+            try:
+                code = self._codes[body]
+                self._codes.move_to_end(body)
+                self._hits += 1
+                return code
+            except KeyError:
+                self._misses += 1
+        code = _compile(body)
+        with self._lock:
+            self._codes[body] = code
+            self._trim()
+        return code
+
+    def _trim(self):
+        while len(self._codes) > self._max_size:
+            self._codes.popitem(last = False)
+
+    def info(self) -> CacheInfo:
+        """Returns cache statistics"""
+        return CacheInfo(self._hits, self._misses, self._max_size, len(self._codes))
+
+    def clear(self):
+        """Removes all code objects and resets counters"""
+        with self._lock:
+            self._codes.clear()
+            self._hits = 0
+            self._misses = 0
+
+
+def _compile(body: str) -> CodeType:
+    try:
+        return compile(body if body.strip(' ') else 'None', '<string>', 'eval')
+    except SyntaxError as syntax_error:
+        error = ExpressionError(syntax_error.msg, body)
+        error.cause_error = syntax_error
+        raise error from syntax_error
+
+
+_CODE_CACHE = CodeCache()
+
+
+def get_code_cache() -> CodeCache:
+    """Returns code cache shared by wxviews pipes"""
+    return _CODE_CACHE
+
+
+def evaluate(body: str, parameters: Optional[dict] = None) -> Any:
+    """Evaluates expression body by pyviews execute() dependency"""
+    return execute(body, parameters)
+
+
+def execute_code(expression: Union[Expression, str], parameters: Optional[dict] = None) -> Any:
+    """Executes expression using compiled code of Expression or cached code object of expression body"""
+    if isinstance(expression, Expression):
+        body, code = expression.code, expression.compiled_code
+    else:
+        body, code = expression, _CODE_CACHE.get(expression)
+    parameters = {} if parameters is None else parameters
+    with error_handling(ExpressionError('Error occurred in expression execution', body)):
+        return eval(code, parameters, parameters) # pylint: disable=eval-used
+
+
+def use_code_cache():
+    """Uses code cache to execute expressions"""
+    add_singleton(execute, execute_code)
+
+
+@lru_cache(maxsize = DEFAULT_CACHE_SIZE)
+def get_names(body: str) -> FrozenSet[str]:
+    """Returns names used by expression body including names of nested code"""
+    return frozenset(_get_code_names(_CODE_CACHE.get(body), set()))
+
+
+def _get_code_names(code: CodeType, names: Set[str]) -> Set[str]:
+    names.update(code.co_names)
+    for const in code.co_consts:
+        if isinstance(const, CodeType):
+            _get_code_names(const, names)
+    return names
@@ -0,0 +1,162 @@
+"""Copy-on-write node globals"""
+
+from typing import Any, Callable, Collection, Dict, ItemsView, Iterator, KeysView, List, Union, ValuesView
+
+from pyviews.core.binding import BindableDict
+from pyviews.core.rendering import NodeGlobals
+
+NODE_KEY = 'node'
+_MISSING = object()
+_FORKS = 0
+
+
+def _add_fork():
+    global _FORKS # pylint: disable=global-statement
+    _FORKS += 1
+
+
+class ChildGlobals(NodeGlobals):
+    """
+    Node globals sharing parent globals until first own key is set.
+    Values are read from own keys, own keys of parent and nearest not shared ancestor globals.
+    Setting any key except 'node' copies inherited values and turns globals to NodeGlobals.
+    """
+
+    # pylint: disable=super-init-not-called,non-parent-init-called,protected-access
+    __getattribute__ = object.__getattribute__
+
+    def __init__(self, parent: Union[dict, BindableDict]):
+        BindableDict.__init__(self)
+        self._own_keys = set()
+        self._parent = parent
+        self._subscribed: bool = False
+        self._source: Any = None
+        self._forks: int = -1
+
+    def _get_source(self) -> dict:
+        if self._forks != _FORKS:
+            parent = self._parent
+            self._source = parent._get_source() if isinstance(parent, ChildGlobals) else parent
+            self._forks = _FORKS
+        return self._source
+
+    def _get_inherited(self, key: Any) -> Any:
+        if isinstance(self._parent, ChildGlobals):
+            value = dict.get(self._parent, key, _MISSING)
+            if value is not _MISSING:
+                return value
+        return dict.get(self._get_source(), key, _MISSING)
+
+    def _get_values(self) -> Dict[Any, Any]:
+        values = dict(dict.items(self._get_source()))
+        if isinstance(self._parent, ChildGlobals):
+            values.update(dict.items(self._parent))
+        values.update(dict.items(self))
+        return values
+
+    def _copy_inherited(self):
+        dict.update(self, self._get_values())
+        self._subscribe()
+        self.__class__ = NodeGlobals
+        _add_fork()
+
+    def _subscribe(self):
+        if not self._subscribed and isinstance(self._parent, BindableDict):
+            self._subscribed = True
+            self._parent.observe_all(self._parent_changed)
+
+    def _parent_changed(self, key: Any, value: Any, old_value: Any):
+        if not isinstance(self, ChildGlobals):
+            NodeGlobals._parent_changed(self, key, value, old_value)
+        elif key not in self._own_keys:
+            self._notify(key, value, old_value)
+
+    def observe(self, key: str, callback: Callable[[Any, Any], None]):
+        self._subscribe()
+        super().observe(key, callback)
+
+    def observe_all(self, callback: Callable[[str, Any, Any], None]):
+        self._subscribe()
+        super().observe_all(callback)
+
+    def __getitem__(self, key: Any) -> Any:
+        value = super().get(key, _MISSING)
+        if value is _MISSING:
+            value = self._get_inherited(key)
+            if value is _MISSING:
+                raise KeyError(key)
+        return value
+
+    def get(self, key: Any, default: Any = None) -> Any:
+        value = super().get(key, _MISSING)
+        if value is _MISSING:
+            value = self._get_inherited(key)
+        return default if value is _MISSING else value
+
+    def __setitem__(self, key: Any, value: Any):
+        if key == NODE_KEY:
+            super().__setitem__(key, value)
+        else:
+            self._copy_inherited()
+            NodeGlobals.__setitem__(self, key, value)
+
+    def __delitem__(self, key: Any):
+        self._copy_inherited()
+        NodeGlobals.__delitem__(self, key)
+
+    def pop(self, key: Any, default: Any = None) -> Any:
+        self._copy_inherited()
+        return NodeGlobals.pop(self, key, default)
+
+    def __contains__(self, key: object) -> bool:
+        return dict.__contains__(self, key) or self._get_inherited(key) is not _MISSING
+
+    def __iter__(self) -> Iterator[Any]:
+        return iter(self._get_values())
+
+    def __len__(self) -> int:
+        return len(self._get_values())
+
+    def keys(self) -> KeysView[Any]:
+        return self._get_values().keys()
+
+    def values(self) -> ValuesView[Any]:
+        return self._get_values().values()
+
+    def items(self) -> ItemsView[Any, Any]:
+        return self._get_values().items()
+
+    def copy(self) -> Dict[Any, Any]:
+        return self._get_values()
+
+    def __eq__(self, other: object) -> bool:
+        return self._get_values() == other
+
+    def __ne__(self, other: object) -> bool:
+        return self._get_values() != other
+
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        return f'{type(self).__name__}({self._get_values()!r})'
+
+
+def get_scope(node_globals: dict, names: Collection[str]) -> dict:
+    """
+    Returns globals that passed names are read from.
+    Shared parent globals are returned for child globals if names don't include 'node'
+    """
+    if isinstance(node_globals, ChildGlobals) and NODE_KEY not in names:
+        return node_globals._get_source() # pylint: disable=protected-access
+    return node_globals
+
+
+def get_shadowing_globals(node_globals: dict, names: Collection[str]) -> List[dict]:
+    """Returns child globals between passed globals and their scope. Keys set to them shadow scope values"""
+    shadowing = []
+    if NODE_KEY in names:
+        return shadowing
+    while isinstance(node_globals, ChildGlobals):
+        shadowing.append(node_globals)
+        node_globals = node_globals._parent # pylint: disable=protected-access
+    return shadowing
@@ -0,0 +1,154 @@
+"""Render transactions and layout"""
+
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Callable, Dict, Generator, List, Optional
+
+from wx import CallAfter, GetTopLevelParent, Sizer, Window
+
+from wxviews.core.tracing import span
+
+
+class RenderTransaction:
+    """Collects layout calls made while subtree is rendered"""
+
+    def __init__(self, window: Optional[Window] = None):
+        self._window: Optional[Window] = window
+        self._targets: List[Any] = []
+
+    @property
+    def window(self) -> Optional[Window]:
+        """Frozen top level window"""
+        return self._window
+
+    def add_layout(self, target: Any):
+        """Adds window or sizer to layout on commit"""
+        target = _get_container(target)
+        if all(target is not added for added in self._targets):
+            self._targets.append(target)
+
+    def commit(self):
+        """Calls Layout() once for every added target"""
+        targets, self._targets = self._targets, []
+        for target in targets:
+            with span('Layout', 'layout', {'target': type(target).__name__}):
+                target.Layout()
+
+
+_TRANSACTION: ContextVar[RenderTransaction] = ContextVar('render_transaction')
+
+
+def get_transaction() -> Optional[RenderTransaction]:
+    """Returns current render transaction"""
+    return _TRANSACTION.get(None)
+
+
+@contextmanager
+def render_transaction(window: Optional[Window] = None) -> Generator[RenderTransaction, None, None]:
+    """
+    Freezes top level parent of passed window until rendering is finished.
+    Layout calls are suppressed and run once on commit.
+    Nested transactions are joined to outer one.
+    """
+    current = get_transaction()
+    if current is not None:
+        yield current
+        return
+
+    transaction = RenderTransaction(_get_top_level_parent(window))
+    _freeze(transaction.window)
+    token = _TRANSACTION.set(transaction)
+    try:
+        yield transaction
+    finally:
+        _TRANSACTION.reset(token)
+        try:
+            transaction.commit()
+        finally:
+            _thaw(transaction.window)
+
+
+def _get_top_level_parent(window: Optional[Window]) -> Optional[Window]:
+    if window is None or not isinstance(window, Window):
+        return None
+    return GetTopLevelParent(window)
+
+
+def _freeze(window: Optional[Window]):
+    if window is not None:
+        window.Freeze()
+
+
+def _thaw(window: Optional[Window]):
+    if window is None:
+        return
+    try:
+        window.Thaw()
+    except RuntimeError:
+        pass
+
+
+class LayoutScheduler:
+    """Collects dirty windows and sizers and layouts them once"""
+
+    def __init__(self, call_after: Optional[Callable[[Callable], Any]] = None):
+        self._call_after: Optional[Callable[[Callable], Any]] = call_after
+        self._dirty: Dict[int, Any] = {}
+        self._scheduled: bool = False
+
+    @property
+    def dirty(self) -> List[Any]:
+        """Windows and sizers waiting for layout"""
+        return list(self._dirty.values())
+
+    def schedule(self, target: Any):
+        """Marks target as dirty and schedules layout. Sizer is replaced by containing window"""
+        target = _get_container(target)
+        self._dirty[id(target)] = target
+        if not self._scheduled:
+            self._scheduled = True
+            call_after = self._call_after if self._call_after else CallAfter
+            call_after(self.flush)
+
+    def flush(self):
+        """Calls Layout() once for every dirty target"""
+        dirty, self._dirty = self._dirty, {}
+        self._scheduled = False
+        for target in dirty.values():
+            try:
+                with span('Layout', 'layout', {'target': type(target).__name__}):
+                    target.Layout()
+            except RuntimeError:
+                pass
+
+
+def _get_container(target: Any) -> Any:
+    if not isinstance(target, Sizer):
+        return target
+    try:
+        window = target.GetContainingWindow()
+    except RuntimeError:
+        window = None
+    return target if window is None else window
+
+
+_SCHEDULER = LayoutScheduler()
+
+
+def get_layout_scheduler() -> LayoutScheduler:
+    """Returns layout scheduler shared by wxviews"""
+    return _SCHEDULER
+
+
+def layout(target: Any):
+    """Schedules Layout() for window or sizer. Inside render transaction layout is run on commit"""
+    transaction = get_transaction()
+    if transaction is None:
+        _SCHEDULER.schedule(target)
+    else:
+        transaction.add_layout(target)
+
+
+def flush_layout():
+    """Runs scheduled layouts immediately"""
+    _SCHEDULER.flush()
@@ -1,19 +1,36 @@
 """Common pipeline functionality"""
 
+from injectool import resolve
+from pyviews.binding.binder import Binder, BindingContext
 from pyviews.core.rendering import Node
-from pyviews.pipes import apply_attribute
+from pyviews.core.xml import XmlAttr
+from pyviews.pipes import get_setter
 
 from wxviews.core.node import Sizerable
+from wxviews.core.plan import get_node_plan
 from wxviews.core.rendering import WxRenderingContext
 
 
 def apply_attributes(node: Node, _: WxRenderingContext):
     """Applies attributes for node"""
-    attrs = [attr for attr in node.xml_node.attrs if attr.namespace not in ['init']]
-    for attr in attrs:
+    for attr in get_node_plan(node.xml_node).applied_attrs:
         apply_attribute(node, attr)
 
 
+def apply_attribute(node: Node, attr: XmlAttr):
+    """Maps xml attribute to node property using parsed expression from plan"""
+    setter = get_setter(attr)
+    expression = get_node_plan(node.xml_node).expressions.get(attr)
+    if expression is None:
+        setter(node, attr.name, attr.value)
+    else:
+        binder = resolve(Binder)
+        binder.bind(
+            expression.binding_type,
+            BindingContext({'node': node, 'expression_body': expression.body, 'setter': setter, 'xml_attr': attr})
+        )
+
+
 def add_to_sizer(node: Sizerable, context: WxRenderingContext):
     """Adds to wx instance to sizer"""
     if context.sizer is None:
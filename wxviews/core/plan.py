@@ -0,0 +1,505 @@
+"""Compiled render plans for xml views"""
+
+import ast
+from collections import OrderedDict
+from concurrent.futures import Executor, Future, ThreadPoolExecutor
+from contextlib import suppress
+from contextvars import copy_context
+from hashlib import sha1
+from json import dump as json_dump, load as json_load
+from os import makedirs, remove, replace, stat
+from os.path import dirname, join
+from tempfile import NamedTemporaryFile
+from threading import Lock, RLock
+from types import ModuleType
+from typing import (Any, Callable, Dict, Generic, Iterator, List, Mapping, NamedTuple, Optional, Tuple, Type,
+                    TypeVar, Union, cast)
+
+from injectool import DependencyError, add_singleton, resolve
+from pyviews.core.error import ViewInfo, error_handling
+from pyviews.core.expression import ExpressionError, ParsedExpression, is_expression, parse_expression
+from pyviews.core.reflection import import_path
+from pyviews.core.rendering import Node, NodeGlobals, RenderingContext, RenderingError
+from pyviews.core.xml import XmlAttr, XmlNode, parse
+from pyviews.rendering.pipeline import RenderingPipeline, get_pipeline, get_type, render, render_view
+from pyviews.rendering.views import ViewError
+from pyviews.setters import import_global
+
+from wxviews import __version__
+from wxviews.core.expressions import evaluate, get_names
+
+PLAN_EXT = 'plan'
+SKIPPED_NAMESPACES = ('init', 'binding')
+DEFAULT_PLANS_SIZE = 1024
+CONSTANT_TYPES = (int, float, complex, str, bytes, bool, type(None))
+PURE_BUILTINS = frozenset({
+    'abs', 'bool', 'bytes', 'chr', 'complex', 'divmod', 'float', 'frozenset', 'hex', 'int', 'len', 'max', 'min', 'oct',
+    'ord', 'pow', 'round', 'str', 'sum', 'tuple'
+})
+PURE_NODES = (ast.Expression, ast.Constant, ast.Name, ast.Attribute, ast.Load, ast.BinOp, ast.UnaryOp, ast.BoolOp,
+              ast.Compare, ast.IfExp, ast.Tuple, ast.operator, ast.unaryop, ast.boolop, ast.cmpop, ast.Call)
+
+
+class NodePlan:
+    """Precompiled rendering data for xml node"""
+
+    def __init__(
+        self,
+        xml_node: XmlNode,
+        attrs: Dict[Optional[str], List[XmlAttr]],
+        expressions: Dict[XmlAttr, ParsedExpression]
+    ):
+        self._xml_node: XmlNode = xml_node
+        self._attrs: Dict[Optional[str], List[XmlAttr]] = attrs
+        self._expressions: Dict[XmlAttr, ParsedExpression] = expressions
+        self._applied_attrs: List[XmlAttr] = [
+            attr for attr in xml_node.attrs if attr.namespace not in SKIPPED_NAMESPACES
+        ]
+        self._named_attrs: Dict[str, XmlAttr] = {}
+        for attr in xml_node.attrs:
+            self._named_attrs.setdefault(attr.name, attr)
+        self._inst_type: Optional[Type] = None
+        self._constants: Dict[XmlAttr, Any] = {}
+
+    @property
+    def xml_node(self) -> XmlNode:
+        """Compiled xml node"""
+        return self._xml_node
+
+    @property
+    def attrs(self) -> Dict[Optional[str], List[XmlAttr]]:
+        """Attributes split by namespace"""
+        return self._attrs
+
+    @property
+    def applied_attrs(self) -> List[XmlAttr]:
+        """Attributes applied to node in document order"""
+        return self._applied_attrs
+
+    @property
+    def expressions(self) -> Dict[XmlAttr, ParsedExpression]:
+        """Parsed expressions of attributes"""
+        return self._expressions
+
+    @property
+    def constants(self) -> Dict[XmlAttr, Any]:
+        """Precomputed values of pure expressions"""
+        return self._constants
+
+    @property
+    def pipeline(self) -> RenderingPipeline:
+        """Rendering pipeline resolved for xml node from current container"""
+        return get_pipeline(self._xml_node)
+
+    @property
+    def inst_type(self) -> Type:
+        """Instance type resolved for xml node"""
+        if self._inst_type is None:
+            self._inst_type = resolve_type(self._xml_node)
+        return self._inst_type
+
+    def get_attrs(self, namespace: Optional[str]) -> List[XmlAttr]:
+        """Returns attributes with passed namespace in document order"""
+        return self._attrs.get(namespace, [])
+
+    def get_attr(self, name: str) -> Optional[XmlAttr]:
+        """Returns first attribute with passed name"""
+        return self._named_attrs.get(name)
+
+    def get_value(self, attr: XmlAttr, node_globals: Optional[NodeGlobals] = None) -> Any:
+        """Evaluates attribute value using parsed expression"""
+        expression = self._expressions.get(attr)
+        if expression is None:
+            return attr.value
+        try:
+            return self._constants[attr]
+        except KeyError:
+            return evaluate(expression.body, node_globals if node_globals else {})
+
+    def evaluate_constants(self, imports: Optional[Mapping[str, ModuleType]] = None):
+        """
+        Compiles expressions and stores immutable values of pure expressions.
+        Pure expression uses only passed imported modules and pure builtins and calls only pure builtins.
+        Expressions failed to evaluate are evaluated on rendering
+        """
+        imports = imports if imports else {}
+        for attr, expression in self._expressions.items():
+            if attr in self._constants:
+                continue
+            try:
+                if not _is_pure(expression.body, imports):
+                    continue
+                value = evaluate(expression.body, dict(imports))
+            except ExpressionError:
+                continue
+            if _is_constant(value):
+                self._constants[attr] = value
+
+
+def _is_pure(body: str, imports: Mapping[str, ModuleType]) -> bool:
+    if not get_names(body):
+        return True
+    for ast_node in ast.walk(ast.parse(body.strip(' ') or 'None', mode = 'eval')):
+        if not isinstance(ast_node, PURE_NODES):
+            return False
+        if isinstance(ast_node, ast.Name) and ast_node.id not in imports and ast_node.id not in PURE_BUILTINS:
+            return False
+        if isinstance(ast_node, ast.Call) and not (isinstance(ast_node.func, ast.Name)
+                                                   and ast_node.func.id in PURE_BUILTINS
+                                                   and ast_node.func.id not in imports):
+            return False
+    return True
+
+
+def _is_constant(value: Any) -> bool:
+    if isinstance(value, (tuple, frozenset)):
+        return all(_is_constant(item) for item in value)
+    return isinstance(value, CONSTANT_TYPES)
+
+
+class PlanCache:
+    """Bounded LRU cache of plans of xml nodes that are not part of compiled views"""
+
+    def __init__(self, max_size: int = DEFAULT_PLANS_SIZE):
+        self._max_size: int = max_size
+        self._plans: 'OrderedDict[int, NodePlan]' = OrderedDict()
+        self._lock: Lock = Lock()
+
+    @property
+    def max_size(self) -> int:
+        """Max count of stored plans"""
+        return self._max_size
+
+    @max_size.setter
+    def max_size(self, value: int):
+        with self._lock:
+            self._max_size = value
+            self._trim()
+
+    def get(self, xml_node: XmlNode) -> Optional[NodePlan]:
+        """Returns stored plan of xml node"""
+        with self._lock:
+            plan = self._plans.get(id(xml_node))
+            if plan is not None:
+                self._plans.move_to_end(id(xml_node))
+            return plan
+
+    def put(self, plan: NodePlan):
+        """Stores plan. Stored plan keeps xml node alive, so node id is not reused while plan is stored"""
+        with self._lock:
+            self._plans[id(plan.xml_node)] = plan
+            self._plans.move_to_end(id(plan.xml_node))
+            self._trim()
+
+    def _trim(self):
+        while len(self._plans) > self._max_size:
+            self._plans.popitem(last = False)
+
+    def clear(self):
+        """Removes all plans"""
+        with self._lock:
+            self._plans.clear()
+
+    def __len__(self) -> int:
+        return len(self._plans)
+
+
+_PLANS = PlanCache()
+_VIEWS: Dict[str, NodePlan] = {}
+_VIEW_PLANS: Dict[int, NodePlan] = {}
+_TYPES: Dict[Tuple[str, str], Type] = {}
+_LOCK = RLock()
+
+
+def get_plan_cache() -> PlanCache:
+    """Returns cache of plans of xml nodes that are not part of compiled views"""
+    return _PLANS
+
+
+def get_node_plan(xml_node: XmlNode) -> NodePlan:
+    """
+    Returns rendering plan of xml node. Plans of compiled views are kept with views,
+    plans of other nodes are compiled on first access and stored in bounded cache
+    """
+    try:
+        return _VIEW_PLANS[id(xml_node)]
+    except KeyError:
+        plan = _PLANS.get(xml_node)
+        return compile_node(xml_node) if plan is None else plan
+
+
+def get_node_type(xml_node: XmlNode) -> Type:
+    """Returns instance type for xml node"""
+    return get_node_plan(xml_node).inst_type
+
+
+def resolve_type(xml_node: XmlNode) -> Type:
+    """Returns instance type for xml node namespace and tag. Type is imported once"""
+    key = (xml_node.namespace, xml_node.name)
+    try:
+        return _TYPES[key]
+    except KeyError:
+        inst_type = _TYPES[key] = get_type(xml_node)
+        return inst_type
+
+
+C = TypeVar('C', bound = Callable)
+
+
+class ConstructorCache(Generic[C]):
+    """Stores instance type and constructor chosen once for xml node namespace and tag"""
+
+    def __init__(self, choose: Callable[[Type], C]):
+        self._choose: Callable[[Type], C] = choose
+        self._constructors: Dict[Tuple[str, str], Tuple[Type, C]] = {}
+
+    def get(self, xml_node: XmlNode) -> Tuple[Type, C]:
+        """Returns instance type and constructor for xml node"""
+        key = (xml_node.namespace, xml_node.name)
+        try:
+            return self._constructors[key]
+        except KeyError:
+            inst_type = get_node_type(xml_node)
+            constructor = self._constructors[key] = (inst_type, self._choose(inst_type))
+            return constructor
+
+
+def compile_node(xml_node: XmlNode) -> NodePlan:
+    """Creates rendering plan for xml node"""
+    plan = _create_plan(xml_node)
+    _PLANS.put(plan)
+    return plan
+
+
+def _create_plan(xml_node: XmlNode) -> NodePlan:
+    expressions: Dict[XmlAttr, ParsedExpression] = {}
+    for attr in xml_node.attrs:
+        stripped_value = attr.value.strip() if attr.value else ''
+        if is_expression(stripped_value):
+            expressions[attr] = parse_expression(stripped_value)
+    return NodePlan(xml_node, _split_attrs(xml_node.attrs), expressions)
+
+
+def _split_attrs(xml_attrs: List[XmlAttr]) -> Dict[Optional[str], List[XmlAttr]]:
+    attrs: Dict[Optional[str], List[XmlAttr]] = {}
+    for attr in xml_attrs:
+        attrs.setdefault(attr.namespace, []).append(attr)
+    return attrs
+
+
+def compile_view(view_name: str) -> NodePlan:
+    """Returns rendering plan for view root"""
+    path = join(resolve('views_folder'), f'{view_name}.{resolve("view_ext")}')
+    try:
+        return _VIEWS[path]
+    except KeyError:
+        with _LOCK:
+            if path not in _VIEWS:
+                plans = _compile_view_file(path, view_name)
+                _VIEW_PLANS.update((id(node_plan.xml_node), node_plan) for node_plan in plans)
+                _VIEWS[path] = plans[0]
+            return _VIEWS[path]
+
+
+def _compile_view_file(path: str, view_name: str) -> List[NodePlan]:
+    try:
+        key = (path, stat(path).st_mtime_ns, __version__)
+    except FileNotFoundError as exc:
+        error = ViewError('View is not found')
+        error.add_info('View name', view_name)
+        error.add_info('Path', path)
+        raise error from exc
+
+    plan_path = _get_plan_path(path)
+    plans = _load_plans(plan_path, key) if plan_path else None
+    if plans is None:
+        with open(path, 'rb') as xml_file:
+            plans = [_create_plan(xml_node) for xml_node in _iterate_tree(parse(xml_file, view_name))]
+        if plan_path:
+            _save_plans(plan_path, key, plans)
+    return plans
+
+
+def compile_tree(xml_root: XmlNode) -> NodePlan:
+    """Creates rendering plans for all nodes in xml tree"""
+    plans = [compile_node(xml_node) for xml_node in _iterate_tree(xml_root)]
+    return plans[0]
+
+
+def _iterate_tree(xml_node: XmlNode) -> Iterator[XmlNode]:
+    yield xml_node
+    for child in xml_node.children:
+        yield from _iterate_tree(child)
+
+
+def _get_plans_folder() -> Optional[str]:
+    try:
+        return resolve('plans_folder')
+    except DependencyError:
+        return None
+
+
+def _get_plan_path(view_path: str) -> Optional[str]:
+    plans_folder = _get_plans_folder()
+    if not plans_folder:
+        return None
+    return join(plans_folder, f'{sha1(view_path.encode()).hexdigest()}.{PLAN_EXT}')
+
+
+def _load_plans(plan_path: str, key: tuple) -> Optional[List[NodePlan]]:
+    try:
+        with open(plan_path, 'r', encoding = 'utf-8') as plan_file:
+            stored_key, root_data = json_load(plan_file)
+        if tuple(stored_key) != key:
+            return None
+        plans: List[NodePlan] = []
+        _load_node(root_data, plans)
+        return plans
+    except (OSError, ValueError, TypeError, KeyError, IndexError):
+        return None
+
+
+def _load_node(data: list, plans: List[NodePlan]) -> XmlNode:
+    namespace, name, text, attrs_data, (view, line), expressions_data, children_data = data
+    attrs = [XmlAttr(*attr) for attr in attrs_data]
+    plan_index = len(plans)
+    plans.append(cast(NodePlan, None))
+    children = [_load_node(child_data, plans) for child_data in children_data]
+    xml_node = XmlNode(namespace, name, text, children, attrs, ViewInfo(view, line))
+    expressions = {attrs[index]: ParsedExpression(binding_type, body) for index, binding_type, body in expressions_data}
+    plans[plan_index] = NodePlan(xml_node, _split_attrs(attrs), expressions)
+    return xml_node
+
+
+def _dump_node(xml_node: XmlNode, plans: Dict[int, NodePlan]) -> list:
+    attrs = list(xml_node.attrs)
+    expressions = plans[id(xml_node)].expressions
+    return [
+        xml_node.namespace, xml_node.name, xml_node.text, [list(attr) for attr in attrs], list(xml_node.view_info),
+        [[attrs.index(attr), *expression] for attr, expression in expressions.items()],
+        [_dump_node(child, plans) for child in xml_node.children]
+    ]
+
+
+def _save_plans(plan_path: str, key: tuple, plans: List[NodePlan]):
+    plans_folder = dirname(plan_path)
+    temp_path = None
+    try:
+        makedirs(plans_folder, exist_ok = True)
+        with NamedTemporaryFile('w', encoding = 'utf-8', dir = plans_folder, suffix = '.tmp',
+                                delete = False) as plan_file:
+            temp_path = plan_file.name
+            json_dump([list(key), _dump_node(plans[0].xml_node, {id(plan.xml_node): plan for plan in plans})],
+                      plan_file)
+        replace(temp_path, plan_path)
+    except (OSError, TypeError, ValueError):
+        if temp_path is not None:
+            with suppress(OSError):
+                remove(temp_path)
+
+
+class PreparedView(NamedTuple):
+    """View plans prepared for rendering"""
+    name: str
+    root: NodePlan
+
+
+def get_prepared_view(view_name: str) -> PreparedView:
+    """Compiles view plans, resolves types and evaluates constant expressions"""
+    root = compile_view(view_name)
+    _prepare_tree(root.xml_node, {})
+    return PreparedView(view_name, root)
+
+
+def _prepare_tree(xml_node: XmlNode, imports: Dict[str, ModuleType]):
+    node_plan = get_node_plan(xml_node)
+    imports, child_imports = _get_imports(node_plan, imports)
+    node_plan.evaluate_constants(imports)
+    try:
+        _ = node_plan.inst_type
+    except RenderingError:
+        pass
+    for child in xml_node.children:
+        _prepare_tree(child, child_imports)
+
+
+def _get_imports(node_plan: NodePlan,
+                 imports: Dict[str, ModuleType]) -> Tuple[Dict[str, ModuleType], Dict[str, ModuleType]]:
+    setter_attrs = [
+        attr for attr in node_plan.xml_node.attrs if attr.namespace and attr.namespace not in SKIPPED_NAMESPACES
+    ]
+    if not setter_attrs:
+        return imports, imports
+    node_imports = {name: module for name, module in imports.items() if node_plan.get_attr(name) is None}
+    child_imports = dict(node_imports)
+    for attr in setter_attrs:
+        if attr in node_plan.expressions or not _is_import_namespace(attr.namespace):
+            continue
+        try:
+            module = import_path(attr.value)
+        except ImportError:
+            continue
+        if isinstance(module, ModuleType):
+            child_imports[attr.name] = module
+    return node_imports, child_imports
+
+
+_IMPORT_NAMESPACES: Dict[str, bool] = {}
+
+
+def _is_import_namespace(namespace: str) -> bool:
+    try:
+        return _IMPORT_NAMESPACES[namespace]
+    except KeyError:
+        try:
+            is_import = import_path(namespace) is import_global
+        except ImportError:
+            is_import = False
+        _IMPORT_NAMESPACES[namespace] = is_import
+        return is_import
+
+
+_EXECUTOR: Optional[Executor] = None
+
+
+def _get_executor() -> Executor:
+    global _EXECUTOR # pylint: disable=global-statement
+    with _LOCK:
+        if _EXECUTOR is None:
+            _EXECUTOR = ThreadPoolExecutor(max_workers = 1, thread_name_prefix = 'wxviews')
+        return _EXECUTOR
+
+
+def prepare_view(view_name: str, executor: Optional[Executor] = None) -> 'Future[PreparedView]':
+    """
+    Prepares view in background thread. Widgets are not created.
+    Prepared view can be passed to render_view() on main thread if render plans are used.
+    """
+    executor = executor if executor else _get_executor()
+    return executor.submit(copy_context().run, get_prepared_view, view_name)
+
+
+def render_view_plan(view: Union[str, PreparedView], context: RenderingContext) -> Node:
+    """Renders view using compiled plan. Accepts view name or prepared view"""
+    view_name = view.name if isinstance(view, PreparedView) else view
+    with error_handling(ViewError, lambda e: e.add_view_info(ViewInfo(view_name, None))):
+        root = view.root if isinstance(view, PreparedView) else compile_view(view_name)
+        context.xml_node = root.xml_node
+        return render(context)
+
+
+def render_plan(context: RenderingContext) -> Node:
+    """Renders node using pipeline from compiled plan"""
+    with error_handling(RenderingError, lambda e: e.add_view_info(context.xml_node.view_info)):
+        return get_node_plan(context.xml_node).pipeline.run(context)
+
+
+def use_render_plans(plans_folder: Optional[str] = None):
+    """
+    Uses compiled plans for views rendering.
+    Plans are cached on disk only if plans folder is passed.
+    """
+    if plans_folder is not None:
+        add_singleton('plans_folder', plans_folder)
+    add_singleton(render_view, render_view_plan)
+    add_singleton(render, render_plan)
@@ -0,0 +1,237 @@
+"""Progressive rendering of child subtrees on idle"""
+
+from collections import Counter, deque
+from time import perf_counter
+from typing import Any, Callable, Deque, Iterator, Optional, Set
+
+from pyviews.core.rendering import Node, RenderingContext
+from pyviews.core.xml import XmlNode
+from pyviews.pipes import render_children
+from pyviews.rendering.pipeline import render
+from wx import EVT_IDLE, EvtHandler, IdleEvent
+
+from wxviews.core.layout import layout, render_transaction
+
+DEFAULT_SLICE_TIME = 0.008
+DEFAULT_INITIAL_TIME = 0.05
+
+GetChildContext = Callable[[XmlNode, Node, RenderingContext], RenderingContext]
+
+
+class RenderTask:
+    """Deferred rendering of child subtree"""
+
+    def __init__(self, node: Node, xml_node: XmlNode, context: RenderingContext, get_child_context: GetChildContext):
+        self.node: Node = node
+        self.xml_node: XmlNode = xml_node
+        self.context: RenderingContext = context
+        self.get_child_context: GetChildContext = get_child_context
+
+    def run(self) -> Optional[Node]:
+        """Renders child and adds it to parent node"""
+        child_context = self.get_child_context(self.xml_node, self.node, self.context)
+        parent = getattr(child_context, 'parent', None)
+        if not _is_alive(parent):
+            return None
+        child = render(child_context)
+        self.node.add_child(child)
+        target = getattr(child_context, 'sizer', None) or parent
+        if target is not None:
+            layout(target)
+        return child
+
+
+def _is_alive(window: Any) -> bool:
+    if window is None:
+        return True
+    try:
+        return not window.IsBeingDeleted()
+    except AttributeError:
+        return True
+    except RuntimeError:
+        return False
+
+
+class RenderQueue:
+    """Queue of render tasks counting queued tasks per parent node"""
+
+    def __init__(self):
+        self._tasks: Deque[RenderTask] = deque()
+        self._counts: Counter = Counter()
+
+    def __len__(self) -> int:
+        return len(self._tasks)
+
+    def __iter__(self) -> Iterator[RenderTask]:
+        return iter(self._tasks)
+
+    def has_tasks(self, node: Node) -> bool:
+        """Returns True if there are queued tasks of passed node"""
+        return bool(self._counts[id(node)])
+
+    def append(self, task: RenderTask):
+        """Adds task to the end of queue"""
+        self._tasks.append(task)
+        self._counts[id(task.node)] += 1
+
+    def pop(self, task: Optional[RenderTask] = None) -> RenderTask:
+        """Removes passed task or first task from queue and returns it"""
+        if task is None:
+            task = self._tasks.popleft()
+        else:
+            self._tasks.remove(task)
+        self._counts[id(task.node)] -= 1
+        if not self._counts[id(task.node)]:
+            del self._counts[id(task.node)]
+        return task
+
+    def discard(self, node: Node):
+        """Removes all tasks of passed node"""
+        if not self._counts[id(node)]:
+            return
+        self._tasks = deque(task for task in self._tasks if task.node is not node)
+        del self._counts[id(node)]
+
+
+class ProgressiveRenderer:
+    """Renders child subtrees queued after initial time in slices on idle"""
+
+    def __init__(self,
+                 on_complete: Optional[Callable[[], None]] = None,
+                 slice_time: float = DEFAULT_SLICE_TIME,
+                 initial_time: float = DEFAULT_INITIAL_TIME,
+                 timer: Callable[[], float] = perf_counter):
+        self._on_complete: Optional[Callable[[], None]] = on_complete
+        self._slice_time: float = slice_time
+        self._initial_time: float = initial_time
+        self._timer: Callable[[], float] = timer
+        self._queue: RenderQueue = RenderQueue()
+        self._deadline: Optional[float] = None
+        self._evt_handler: Optional[EvtHandler] = None
+
+    @property
+    def pending(self) -> int:
+        """Count of queued subtrees"""
+        return len(self._queue)
+
+    def begin(self):
+        """Starts initial rendering. Subtrees are queued after initial time"""
+        _set_renderer(self)
+        self._deadline = self._timer() + self._initial_time
+
+    def start(self, evt_handler: EvtHandler):
+        """Finishes initial rendering and renders queued subtrees on idle"""
+        self._deadline = None
+        if not self._queue:
+            self._finish()
+            return
+        self._evt_handler = evt_handler
+        evt_handler.Bind(EVT_IDLE, self._on_idle)
+
+    def render_children(self, node: Node, context: RenderingContext, get_child_context: GetChildContext):
+        """Renders node children or queues them if time is over"""
+        for xml_node in node.xml_node.children:
+            task = RenderTask(node, xml_node, context, get_child_context)
+            if self._queue.has_tasks(node) or self._is_time_over():
+                self._queue.append(task)
+            else:
+                task.run()
+
+    def _is_time_over(self) -> bool:
+        return self._deadline is not None and self._timer() > self._deadline
+
+    def run_slice(self, window: Any = None) -> bool:
+        """Renders queued subtrees until slice time is over. Returns True if there are queued subtrees"""
+        self._deadline = self._timer() + self._slice_time
+        try:
+            with render_transaction(window):
+                while self._queue and not self._is_time_over():
+                    self._queue.pop().run()
+        finally:
+            self._deadline = None
+        if not self._queue:
+            self._finish()
+        return bool(self._queue)
+
+    def complete(self, node: Node):
+        """Renders queued subtrees of passed node synchronously"""
+        nodes = _get_subtree(node, set())
+        found = True
+        while found:
+            found = False
+            for task in list(self._queue):
+                if id(task.node) not in nodes:
+                    continue
+                child = self._queue.pop(task).run()
+                if child is not None:
+                    _get_subtree(child, nodes)
+                found = True
+                break
+        if not self._queue and self._deadline is None:
+            self._finish()
+
+    def cancel(self, node: Node):
+        """Removes queued subtrees of passed node"""
+        if not self._queue.has_tasks(node):
+            return
+        self._queue.discard(node)
+        if not self._queue and self._deadline is None:
+            self._finish()
+
+    def _on_idle(self, event: IdleEvent):
+        event.Skip()
+        if self.run_slice(self._evt_handler):
+            event.RequestMore()
+
+    def _finish(self):
+        if self._evt_handler is not None:
+            self._evt_handler.Unbind(EVT_IDLE, handler = self._on_idle)
+            self._evt_handler = None
+        if get_renderer() is self:
+            _set_renderer(None)
+        if self._on_complete is not None:
+            on_complete, self._on_complete = self._on_complete, None
+            on_complete()
+
+
+def _get_subtree(node: Node, nodes: Set[int]) -> Set[int]:
+    nodes.add(id(node))
+    for child in node.children:
+        _get_subtree(child, nodes)
+    return nodes
+
+
+_RENDERER: Optional[ProgressiveRenderer] = None
+
+
+def get_renderer() -> Optional[ProgressiveRenderer]:
+    """Returns active progressive renderer"""
+    return _RENDERER
+
+
+def _set_renderer(renderer: Optional[ProgressiveRenderer]):
+    global _RENDERER # pylint: disable=global-statement
+    _RENDERER = renderer
+
+
+def render_children_progressively(node: Node, context: RenderingContext, get_child_context: GetChildContext):
+    """Renders node children using active progressive renderer"""
+    renderer = get_renderer()
+    if renderer is None:
+        render_children(node, context, get_child_context)
+    else:
+        renderer.render_children(node, context, get_child_context)
+
+
+def complete(node: Node):
+    """Renders queued subtrees of node synchronously"""
+    renderer = get_renderer()
+    if renderer is not None:
+        renderer.complete(node)
+
+
+def cancel(node: Node):
+    """Removes queued subtrees of node. Should be called when node is destroyed"""
+    renderer = get_renderer()
+    if renderer is not None:
+        renderer.cancel(node)
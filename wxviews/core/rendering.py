@@ -1,51 +1,224 @@
 """Common"""
 
-from typing import Any, Optional
+from typing import Any, ItemsView, Iterator, KeysView, Mapping, Optional, ValuesView
 
-from pyviews.core.expression import execute, is_expression, parse_expression
+from pyviews.core.expression import is_expression, parse_expression
 from pyviews.core.rendering import NodeGlobals
 from pyviews.core.xml import XmlAttr, XmlNode
 from pyviews.rendering.context import Node, RenderingContext
 from wx import Sizer
 
+from wxviews.core.expressions import evaluate
+from wxviews.core.globals import ChildGlobals
+from wxviews.core.plan import get_node_plan
+
+
+_MISSING = object()
+_KEEP = object()
+_new_context = dict.__new__
+_FIELDS = {
+    'parent': '_parent',
+    'parent_node': '_parent_node',
+    'sizer': '_sizer',
+    'node_globals': '_node_globals',
+    'xml_node': '_xml_node',
+    'node_styles': '_node_styles'
+} # yapf: disable
+
 
 class WxRenderingContext(RenderingContext):
-    """wxviews rendering context"""
+    """wxviews rendering context. Known fields are stored in slots, other keys in dictionary"""
+
+    __slots__ = tuple(_FIELDS.values())
+
+    def __init__(self, values: Optional[Mapping[str, Any]] = None, **kwargs):
+        super().__init__()
+        self._parent: Any = _MISSING
+        self._parent_node: Any = _MISSING
+        self._sizer: Any = _MISSING
+        self._node_globals: Any = _MISSING
+        self._xml_node: Any = _MISSING
+        self._node_styles: Any = _MISSING
+        if values:
+            self.update(values)
+        if kwargs:
+            self.update(kwargs)
 
     @property
     def parent(self) -> Any:
         """parent control"""
-        return self.get('parent')
+        return None if self._parent is _MISSING else self._parent
 
     @parent.setter
     def parent(self, value: Any):
-        self['parent'] = value
+        self._parent = value
+
+    @property
+    def parent_node(self) -> Node:
+        """Parent node"""
+        return None if self._parent_node is _MISSING else self._parent_node
+
+    @parent_node.setter
+    def parent_node(self, value: Node):
+        self._parent_node = value
 
     @property
     def sizer(self) -> Sizer:
         """Current sizer"""
-        return self.get('sizer')
+        return None if self._sizer is _MISSING else self._sizer
 
     @sizer.setter
     def sizer(self, value: Sizer):
-        self['sizer'] = value
+        self._sizer = value
+
+    @property
+    def node_globals(self) -> NodeGlobals:
+        """Node globals"""
+        return None if self._node_globals is _MISSING else self._node_globals
+
+    @node_globals.setter
+    def node_globals(self, value: NodeGlobals):
+        self._node_globals = value
+
+    @property
+    def xml_node(self) -> XmlNode:
+        """xml node"""
+        return None if self._xml_node is _MISSING else self._xml_node
+
+    @xml_node.setter
+    def xml_node(self, value: XmlNode):
+        self._xml_node = value
 
     @property
     def node_styles(self) -> NodeGlobals:
         """Node styles"""
-        return self.get('node_styles')
+        return None if self._node_styles is _MISSING else self._node_styles
 
     @node_styles.setter
     def node_styles(self, value: NodeGlobals):
-        self['node_styles'] = value
+        self._node_styles = value
+
+    def derive(self,
+               *,
+               parent: Any = _KEEP,
+               parent_node: Any = _MISSING,
+               sizer: Any = _MISSING,
+               node_globals: Any = _MISSING,
+               xml_node: Any = _MISSING,
+               node_styles: Any = _MISSING) -> 'WxRenderingContext':
+        """Returns child context with parent copied from current context and passed fields"""
+        # pylint: disable=protected-access,too-many-arguments
+        context = _new_context(WxRenderingContext)
+        context._parent = self._parent if parent is _KEEP else parent
+        context._parent_node = parent_node
+        context._sizer = sizer
+        context._node_globals = node_globals
+        context._xml_node = xml_node
+        context._node_styles = node_styles
+        return context
+
+    def __getitem__(self, key: str) -> Any:
+        slot = _FIELDS.get(key)
+        if slot is None:
+            return super().__getitem__(key)
+        value = getattr(self, slot)
+        if value is _MISSING:
+            raise KeyError(key)
+        return value
+
+    def __setitem__(self, key: str, value: Any):
+        slot = _FIELDS.get(key)
+        if slot is None:
+            super().__setitem__(key, value)
+        else:
+            setattr(self, slot, value)
+
+    def __delitem__(self, key: str):
+        slot = _FIELDS.get(key)
+        if slot is None:
+            super().__delitem__(key)
+        elif getattr(self, slot) is _MISSING:
+            raise KeyError(key)
+        else:
+            setattr(self, slot, _MISSING)
+
+    def __contains__(self, key: object) -> bool:
+        slot = _FIELDS.get(key) if isinstance(key, str) else None
+        return super().__contains__(key) if slot is None else getattr(self, slot) is not _MISSING
+
+    def __iter__(self) -> Iterator[str]:
+        yield from (key for key, slot in _FIELDS.items() if getattr(self, slot) is not _MISSING)
+        yield from super().__iter__()
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self.__iter__())
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Mapping):
+            return NotImplemented
+        return dict(self.items()) == dict(other.items())
+
+    def __ne__(self, other: object) -> bool:
+        equal = self.__eq__(other)
+        return equal if equal is NotImplemented else not equal
+
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        return f'{type(self).__name__}({dict(self.items())!r})'
+
+    def get(self, key: str, default: Any = None) -> Any:
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def keys(self) -> KeysView[str]:
+        return KeysView(self)
+
+    def values(self) -> ValuesView[Any]:
+        return ValuesView(self)
+
+    def items(self) -> ItemsView[str, Any]:
+        return ItemsView(self)
+
+    def update(self, *args, **kwargs):
+        for key, value in dict(*args, **kwargs).items():
+            self[key] = value
+
+    def setdefault(self, key: str, default: Any = None) -> Any:
+        if key not in self:
+            self[key] = default
+        return self[key]
+
+    def pop(self, key: str, *default) -> Any:
+        try:
+            value = self[key]
+        except KeyError:
+            if default:
+                return default[0]
+            raise
+        del self[key]
+        return value
+
+    def clear(self):
+        for slot in _FIELDS.values():
+            setattr(self, slot, _MISSING)
+        super().clear()
+
+    def copy(self) -> 'WxRenderingContext':
+        return WxRenderingContext(self)
+
+    def __reduce__(self):
+        return WxRenderingContext, (dict(self.items()), )
 
 
 def get_attr_args(xml_node, namespace: str, node_globals: Optional[NodeGlobals] = None) -> dict:
     """Returns args from attributes with provided namespace"""
-    init_attrs = [attr for attr in xml_node.attrs if attr.namespace == namespace]
+    plan = get_node_plan(xml_node)
     args = {}
-    for attr in init_attrs:
-        value = get_init_value(attr, node_globals)
+    for attr in plan.get_attrs(namespace):
+        value = plan.get_value(attr, node_globals)
         if attr.name == '':
             args = {**args, **value}
         else:
@@ -59,16 +232,22 @@ def get_init_value(attr: XmlAttr, node_globals: Optional[NodeGlobals]) -> Any:
     if is_expression(stripped_value):
         body = parse_expression(stripped_value)[1]
         parameters = node_globals if node_globals else {}
-        return execute(body, parameters)
+        return evaluate(body, parameters)
     return attr.value
 
 
+def to_bool(value: Any) -> bool:
+    """Converts attribute value to bool. Strings should be 'true' or 'false'"""
+    if isinstance(value, str):
+        if value.lower() not in ('true', 'false'):
+            raise ValueError(f'"{value}" is not boolean')
+        return value.lower() == 'true'
+    return bool(value)
+
+
 def get_wx_child_context(xml_node: XmlNode, parent_node: Node, context: WxRenderingContext) -> WxRenderingContext:
     """Return child node context"""
-    return WxRenderingContext({
-        'parent_node': parent_node,
-        'parent': context.parent,
-        'node_globals': NodeGlobals(parent_node.node_globals),
-        'sizer': context.sizer,
-        'xml_node': xml_node
-    })
+    return context.derive(parent_node = parent_node,
+                          node_globals = ChildGlobals(parent_node.node_globals),
+                          sizer = context.sizer,
+                          xml_node = xml_node)
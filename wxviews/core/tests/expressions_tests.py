@@ -0,0 +1,133 @@
+from unittest.mock import Mock
+
+from injectool import add_singleton
+from pytest import mark, raises
+from pyviews.core.expression import Expression, ExpressionError, execute
+
+from wxviews.core.expressions import (CacheInfo, CodeCache, evaluate, execute_code, get_code_cache, get_names,
+                                      use_code_cache)
+
+
+class CodeCacheTests:
+    """CodeCache tests"""
+
+    @staticmethod
+    def test_compiles_once():
+        """should return same code object for same body"""
+        cache = CodeCache()
+
+        first, second = cache.get('1 + 1'), cache.get('1 + 1')
+
+        assert first is second
+        assert cache.info() == CacheInfo(hits = 1, misses = 1, max_size = cache.max_size, size = 1)
+
+    @staticmethod
+    def test_evicts_least_recently_used():
+        """should remove least recently used code when max size is exceeded"""
+        cache = CodeCache(max_size = 2)
+        one = cache.get('1')
+        cache.get('2')
+        cache.get('1')
+        cache.get('3')
+
+        assert cache.get('1') is one
+        assert cache.misses == 3
+        cache.get('2')
+        assert cache.misses == 4
+
+    @staticmethod
+    def test_max_size_trims_cache():
+        """should remove codes above new max size"""
+        cache = CodeCache()
+        for body in ['1', '2', '3']:
+            cache.get(body)
+
+        cache.max_size = 1
+
+        assert cache.info().size == 1
+
+    @staticmethod
+    def test_clear():
+        """should remove codes and reset counters"""
+        cache = CodeCache()
+        cache.get('1')
+        cache.get('1')
+
+        cache.clear()
+
+        assert cache.info() == CacheInfo(hits = 0, misses = 0, max_size = cache.max_size, size = 0)
+
+    @staticmethod
+    def test_raises_expression_error_for_invalid_body():
+        """should raise ExpressionError for syntax error"""
+        with raises(ExpressionError):
+            CodeCache().get('1 +')
+
+
+@mark.parametrize('body, parameters, expected', [
+    ('1 + 1', None, 2),
+    ('key', {'key': 'value'}, 'value'),
+    (' ', None, None),
+    ('[item for item in items]', {'items': [1, 2]}, [1, 2])
+]) # yapf: disable
+@mark.parametrize('use_cache', [True, False])
+@mark.usefixtures('container_fixture')
+def test_evaluate(body, parameters, expected, use_cache):
+    """evaluate() should return expression result"""
+    if use_cache:
+        use_code_cache()
+
+    assert evaluate(body, parameters) == expected
+
+
+@mark.usefixtures('container_fixture')
+def test_evaluate_uses_shared_cache():
+    """evaluate() should use shared code cache if it is used for execute(), Expression uses own compiled code"""
+    use_code_cache()
+    get_code_cache().clear()
+
+    evaluate('"shared" + " cache"')
+    evaluate('"shared" + " cache"')
+    execute(Expression('"own" + " code"'))
+
+    assert get_code_cache().info()[:2] == (1, 1)
+
+
+@mark.usefixtures('container_fixture')
+def test_evaluate_uses_execute_dependency():
+    """evaluate() should call implementation registered for execute()"""
+    use_code_cache()
+    implementation = Mock(return_value = 'value')
+    add_singleton(execute, implementation)
+
+    actual = evaluate('key', {'key': 1})
+
+    assert actual == 'value'
+    assert implementation.call_args[0] == ('key', {'key': 1})
+
+
+def test_execute_code_executes_statement():
+    """execute_code() should execute Expression compiled in exec mode"""
+    target = Mock()
+
+    execute_code(Expression('target.value = value', 'exec'), {'target': target, 'value': 1})
+
+    assert target.value == 1
+
+
+@mark.parametrize('body', ['missing_key', '1 +'])
+def test_execute_code_raises_expression_error(body):
+    """execute_code() should wrap execution error"""
+    with raises(ExpressionError):
+        execute_code(body, {})
+
+
+@mark.parametrize('body, expected', [
+    ('1 + 1', set()),
+    ('vm.value', {'vm', 'value'}),
+    ('[item.name for item in node.items if item.visible]', {'node', 'items', 'name', 'visible'}),
+    ('sum(value for value in vm.values)', {'sum', 'vm', 'values'})
+]) # yapf: disable
+def test_get_names(body, expected):
+    """should return names used by expression including nested code"""
+    assert get_names(body) == expected
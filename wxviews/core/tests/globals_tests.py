@@ -0,0 +1,163 @@
+from unittest.mock import Mock, call
+
+from pytest import mark, raises
+from pyviews.core.rendering import Node, NodeGlobals
+
+from wxviews.core.expressions import evaluate
+from wxviews.core.globals import ChildGlobals, get_scope, get_shadowing_globals
+
+
+def _get_globals(**values) -> ChildGlobals:
+    parent = ChildGlobals(NodeGlobals(values))
+    Node(Mock(), parent)
+    child = ChildGlobals(parent)
+    Node(Mock(), child)
+    return child
+
+
+class ChildGlobalsTests:
+    """ChildGlobals tests"""
+
+    @staticmethod
+    def test_shares_parent_values():
+        """should read parent values without copying them"""
+        node_globals = _get_globals(one = 1, two = 2)
+
+        assert isinstance(node_globals, ChildGlobals)
+        assert dict(dict.items(node_globals)) == {'node': node_globals['node']}
+        assert node_globals['one'] == 1
+        assert node_globals.get('two') == 2
+        assert node_globals.get('three', 3) == 3
+        assert 'one' in node_globals
+        assert 'three' not in node_globals
+
+    @staticmethod
+    def test_raises_key_error():
+        """should raise KeyError for missing key"""
+        with raises(KeyError):
+            _ = _get_globals()['key']
+
+    @staticmethod
+    def test_node_key():
+        """should store node without copying parent values"""
+        parent = ChildGlobals(NodeGlobals({'one': 1}))
+        parent_node = Node(Mock(), parent)
+        node_globals = ChildGlobals(parent)
+
+        assert node_globals['node'] is parent_node
+
+        node = Node(Mock(), node_globals)
+
+        assert node_globals['node'] is node
+        assert parent['node'] is parent_node
+        assert isinstance(node_globals, ChildGlobals)
+
+    @staticmethod
+    @mark.parametrize('key, value', [
+        ('one', 'value'),
+        ('key', 'value')
+    ]) # yapf: disable
+    def test_copies_on_write(key, value):
+        """should copy parent values and become NodeGlobals when own key is set"""
+        node_globals = _get_globals(one = 1, two = 2)
+        node = node_globals['node']
+
+        node_globals[key] = value
+
+        assert type(node_globals) is NodeGlobals # pylint: disable=unidiomatic-typecheck
+        assert dict(dict.items(node_globals)) == {'one': 1, 'two': 2, 'node': node, key: value}
+
+    @staticmethod
+    def test_children_read_forked_parent():
+        """should read values set by parent after it is forked"""
+        root = NodeGlobals({'one': 1})
+        parent = ChildGlobals(root)
+        child = ChildGlobals(ChildGlobals(parent))
+        assert child['one'] == 1
+
+        parent['one'] = 2
+        parent['two'] = 3
+
+        assert child['one'] == 2
+        assert child['two'] == 3
+        assert root['one'] == 1
+
+    @staticmethod
+    @mark.parametrize('copy', [False, True])
+    def test_notifies_about_parent_changes(copy: bool):
+        """should notify about changed inherited values"""
+        root = NodeGlobals({'one': 1})
+        node_globals = ChildGlobals(ChildGlobals(root))
+        callback = Mock()
+        node_globals.observe('one', callback)
+        if copy:
+            node_globals['key'] = 'value'
+
+        root['one'] = 2
+
+        assert callback.call_args == call(2, 1)
+        assert node_globals['one'] == 2
+
+    @staticmethod
+    def test_own_keys_are_not_overridden():
+        """should keep own value when parent value is changed"""
+        root = NodeGlobals({'one': 1})
+        node_globals = ChildGlobals(root)
+        node_globals['one'] = 'own'
+
+        root['one'] = 2
+
+        assert node_globals['one'] == 'own'
+
+    @staticmethod
+    def test_dictionary_api():
+        """should expose inherited values as dictionary"""
+        node_globals = _get_globals(one = 1)
+        expected = {'one': 1, 'node': node_globals['node']}
+
+        assert node_globals == expected
+        assert node_globals.copy() == expected
+        assert dict(node_globals.items()) == expected
+        assert set(node_globals) == set(expected)
+        assert len(node_globals) == len(expected)
+
+    @staticmethod
+    def test_evaluates_expressions():
+        """should be used as expression globals"""
+        node_globals = _get_globals(one = 1, two = 2)
+
+        assert evaluate('one + len([i for i in range(two)])', node_globals) == 3
+
+
+@mark.parametrize('names, use_source', [
+    ({'vm', 'value'}, True),
+    ({'node', 'vm'}, False)
+]) # yapf: disable
+def test_get_scope(names, use_source):
+    """should return globals that names are read from"""
+    source = NodeGlobals({'vm': Mock()})
+    node_globals = ChildGlobals(ChildGlobals(source))
+
+    assert get_scope(node_globals, names) is (source if use_source else node_globals)
+
+
+def test_get_scope_of_copied_globals():
+    """should return globals that own inherited values"""
+    node_globals = ChildGlobals(NodeGlobals({'vm': Mock()}))
+    node_globals['key'] = 'value'
+
+    assert get_scope(node_globals, {'vm'}) is node_globals
+
+
+@mark.parametrize('names, shadowing', [
+    ({'vm', 'value'}, True),
+    ({'node', 'vm'}, False)
+]) # yapf: disable
+def test_get_shadowing_globals(names, shadowing):
+    """should return child globals between globals and scope"""
+    parent = ChildGlobals(NodeGlobals({'vm': Mock()}))
+    node_globals = ChildGlobals(parent)
+
+    expected = [node_globals, parent] if shadowing else []
+
+    assert [id(item) for item in get_shadowing_globals(node_globals, names)] == [id(item) for item in expected]
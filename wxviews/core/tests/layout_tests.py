@@ -0,0 +1,174 @@
+from itertools import count
+from unittest.mock import Mock, call, patch
+
+from pytest import fixture, mark, raises
+from wx import Sizer, Window
+
+from wxviews.core import layout as layout_module
+from wxviews.core.layout import (LayoutScheduler, flush_layout, get_layout_scheduler, get_transaction, layout,
+                                  render_transaction)
+from wxviews.core.tracing import tracing
+
+
+@fixture
+def transaction_fixture(request):
+    top_window = Mock()
+    with patch(layout_module.__name__ + '.GetTopLevelParent') as get_top_level_parent:
+        get_top_level_parent.return_value = top_window
+        request.cls.top_window = top_window
+        request.cls.window = Mock(spec = Window)
+        yield get_top_level_parent
+
+
+@mark.usefixtures('transaction_fixture')
+class RenderTransactionTests:
+    """render_transaction() tests"""
+
+    top_window: Mock
+    window: Mock
+
+    def test_freezes_top_level_parent(self):
+        """should freeze top level window while rendering"""
+        with render_transaction(self.window):
+            assert self.top_window.Freeze.call_count == 1
+            assert not self.top_window.Thaw.called
+
+        assert self.top_window.Thaw.call_count == 1
+
+    def test_joins_nested_transactions(self):
+        """should freeze and thaw once for nested transactions"""
+        with render_transaction(self.window) as outer:
+            with render_transaction(self.window) as inner:
+                assert inner is outer
+
+        assert self.top_window.Freeze.call_count == 1
+        assert self.top_window.Thaw.call_count == 1
+        assert get_transaction() is None
+
+    def test_defers_layout(self):
+        """should call Layout() once per target on commit before thaw"""
+        target = Mock()
+        calls = Mock()
+        calls.attach_mock(target.Layout, 'layout')
+        calls.attach_mock(self.top_window.Thaw, 'thaw')
+
+        with render_transaction(self.window):
+            layout(target)
+            layout(target)
+            assert not target.Layout.called
+
+        assert calls.mock_calls == [call.layout(), call.thaw()]
+
+    @mark.usefixtures('container_fixture')
+    def test_traces_layout(self):
+        """should record span of Layout() call on commit"""
+        target = Mock()
+        with tracing(timer = count().__next__) as tracer:
+            with render_transaction(self.window):
+                layout(target)
+                assert not tracer.events
+
+        assert [(event['name'], event['dur']) for event in tracer.events] == [('Layout', 1_000_000)]
+
+    def test_thaws_on_error(self):
+        """should thaw top level window if rendering failed"""
+        with raises(ValueError):
+            with render_transaction(self.window):
+                raise ValueError()
+
+        assert self.top_window.Thaw.call_count == 1
+        assert get_transaction() is None
+
+    @staticmethod
+    @mark.parametrize('window', [None, Mock()])
+    def test_does_not_freeze_not_windows(window):
+        """should not freeze if passed value is not a window"""
+        with patch(layout_module.__name__ + '.GetTopLevelParent') as get_top_level_parent:
+            with render_transaction(window) as transaction:
+                assert transaction.window is None
+
+        assert not get_top_level_parent.called
+
+
+class LayoutSchedulerTests:
+    """LayoutScheduler tests"""
+
+    @staticmethod
+    def test_schedules_flush_once():
+        """should schedule flush once until scheduled layouts are run"""
+        call_after = Mock()
+        scheduler = LayoutScheduler(call_after)
+
+        scheduler.schedule(Mock())
+        scheduler.schedule(Mock())
+        scheduler.flush()
+        scheduler.schedule(Mock())
+
+        assert call_after.call_args_list == [call(scheduler.flush), call(scheduler.flush)]
+
+    @staticmethod
+    def test_layouts_target_once():
+        """should call Layout() once for target scheduled several times"""
+        scheduler = LayoutScheduler(Mock())
+        target = Mock()
+
+        for _ in range(3):
+            scheduler.schedule(target)
+        scheduler.flush()
+        scheduler.flush()
+
+        assert target.Layout.call_count == 1
+
+    @staticmethod
+    def test_replaces_sizer_with_containing_window():
+        """should layout containing window instead of its sizers"""
+        scheduler = LayoutScheduler(Mock())
+        window = Mock()
+        sizers = [Mock(spec = Sizer), Mock(spec = Sizer)]
+        for sizer in sizers:
+            sizer.GetContainingWindow.return_value = window
+            scheduler.schedule(sizer)
+
+        scheduler.flush()
+
+        assert window.Layout.call_count == 1
+        assert not any(sizer.Layout.called for sizer in sizers)
+
+    @staticmethod
+    def test_layouts_sizer_without_window():
+        """should layout sizer that is not set to window"""
+        scheduler = LayoutScheduler(Mock())
+        sizer = Mock(spec = Sizer)
+        sizer.GetContainingWindow.return_value = None
+
+        scheduler.schedule(sizer)
+        scheduler.flush()
+
+        assert sizer.Layout.called
+
+    @staticmethod
+    def test_skips_deleted_targets():
+        """should ignore deleted windows"""
+        scheduler = LayoutScheduler(Mock())
+        deleted, target = Mock(), Mock()
+        deleted.Layout.side_effect = RuntimeError()
+        scheduler.schedule(deleted)
+        scheduler.schedule(target)
+
+        scheduler.flush()
+
+        assert target.Layout.called
+
+
+def test_layout_without_transaction():
+    """layout() should schedule Layout() outside of render transaction"""
+    target = Mock()
+    with patch(layout_module.__name__ + '.CallAfter') as call_after:
+        layout(target)
+
+        assert not target.Layout.called
+        assert call_after.called
+        assert target in get_layout_scheduler().dirty
+
+    flush_layout()
+    assert target.Layout.called
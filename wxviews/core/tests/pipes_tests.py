@@ -1,11 +1,14 @@
 from typing import Tuple
 from unittest.mock import Mock, call, patch
 
+from injectool import add_singleton
 from pytest import fail, fixture, mark
-from pyviews.core.xml import XmlAttr
+from pyviews.binding.binder import Binder
+from pyviews.core.xml import XmlAttr, XmlNode
 
 from wxviews.core import pipes
-from wxviews.core.pipes import add_to_sizer, apply_attributes
+from wxviews.core.pipes import add_to_sizer, apply_attribute, apply_attributes
+from wxviews.core.plan import compile_node
 from wxviews.core.rendering import WxRenderingContext
 from wxviews.widgets.rendering import WxNode
 
@@ -61,6 +64,36 @@ class ApplyAttributesTests:
         assert self.apply_attribute.call_args_list == [call(node, attr) for attr in attrs]
 
 
+@mark.usefixtures('container_fixture')
+class ApplyAttributeTests:
+    """apply_attribute() tests"""
+
+    @staticmethod
+    def test_binds_parsed_expression():
+        """should bind expression parsed by plan"""
+        binder = Mock()
+        add_singleton(Binder, binder)
+        attr = XmlAttr('key', 'once:{value}')
+        node = Mock(xml_node = compile_node(XmlNode('wx', 'Button', attrs = [attr])).xml_node)
+
+        apply_attribute(node, attr)
+
+        binding_type, binding_context = binder.bind.call_args[0]
+        assert binding_type == 'once'
+        assert binding_context.expression_body == 'value'
+        assert binding_context.xml_attr == attr
+
+    @staticmethod
+    def test_sets_plain_value():
+        """should call setter for value that is not expression"""
+        attr = XmlAttr('key', 'value')
+        node = Mock(xml_node = compile_node(XmlNode('wx', 'Button', attrs = [attr])).xml_node)
+
+        apply_attribute(node, attr)
+
+        assert node.set_attr.call_args == call('key', 'value')
+
+
 class AddToSizerTests:
     """add_to_sizer() step tests"""
 
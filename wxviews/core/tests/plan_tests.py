@@ -0,0 +1,472 @@
+import collections
+import json
+import pickle
+from concurrent.futures import ThreadPoolExecutor
+from os import listdir, utime
+from os.path import join
+from unittest.mock import Mock, patch
+
+from injectool import add_singleton, use_container
+from pytest import fixture, mark, raises
+from pyviews.core.expression import ParsedExpression
+from pyviews.core.xml import XmlAttr, XmlNode
+from pyviews.rendering.pipeline import RenderingPipeline, use_pipeline
+from pyviews.rendering.views import ViewError
+from wx import VERTICAL
+
+from wxviews.core import plan
+from wxviews.core.plan import (ConstructorCache, NodePlan, PlanCache, PreparedView, compile_node, compile_tree,
+                               compile_view, get_node_plan, get_node_type, get_plan_cache, prepare_view,
+                               render_view_plan, resolve_type)
+
+VIEW = '''<Container xmlns='pyviews.containers'
+           xmlns:init='init'
+           init:key='value'
+           name='{"some" + " name"}'>
+    <Container key='once:{1}' />
+</Container>'''
+
+IMPORTS_VIEW = '''<Container xmlns='pyviews.containers'
+           xmlns:init='init'
+           xmlns:import='wxviews.import_global'
+           xmlns:global='wxviews.set_global'
+           import:wx='wx'
+           init:orient='{wx.VERTICAL}'>
+    <Container init:orient='{wx.VERTICAL}' />
+    <Container global:wx='{None}' init:orient='{wx.VERTICAL}' />
+</Container>'''
+
+
+class NodePlanTests:
+    """NodePlan tests"""
+
+    @staticmethod
+    def test_splits_attributes_by_namespace():
+        """should group attributes by namespace in document order"""
+        attrs = [XmlAttr('one', '1', 'init'), XmlAttr('two', '2'), XmlAttr('three', '3', 'init')]
+
+        node_plan = compile_node(XmlNode('wx', 'Button', attrs = attrs))
+
+        assert node_plan.get_attrs('init') == [attrs[0], attrs[2]]
+        assert node_plan.get_attrs(None) == [attrs[1]]
+        assert node_plan.get_attrs('sizer') == []
+
+    @staticmethod
+    def test_skips_init_attributes():
+        """applied_attrs should not contain init attributes"""
+        attrs = [XmlAttr('one', '1', 'init'), XmlAttr('two', '2'), XmlAttr('three', '3', 'sizer')]
+
+        node_plan = compile_node(XmlNode('wx', 'Button', attrs = attrs))
+
+        assert node_plan.applied_attrs == [attrs[1], attrs[2]]
+
+    @staticmethod
+    def test_get_attr():
+        """get_attr() should return first attribute with passed name"""
+        attrs = [XmlAttr('one', '1', 'init'), XmlAttr('two', '2'), XmlAttr('one', '3')]
+
+        node_plan = compile_node(XmlNode('wx', 'Button', attrs = attrs))
+
+        assert node_plan.get_attr('one') == attrs[0]
+        assert node_plan.get_attr('two') == attrs[1]
+        assert node_plan.get_attr('three') is None
+
+    @staticmethod
+    @mark.parametrize('value, expected', [
+        ('{1}', ParsedExpression('oneway', '1')),
+        (' once:{key} ', ParsedExpression('once', 'key')),
+        ('{{vm.value}}', ParsedExpression('twoways', 'vm.value')),
+        ('value', None),
+        (None, None)
+    ]) # yapf: disable
+    def test_parses_expressions(value, expected):
+        """should store parsed expressions"""
+        attr = XmlAttr('key', value)
+
+        node_plan = compile_node(XmlNode('wx', 'Button', attrs = [attr]))
+
+        assert node_plan.expressions.get(attr) == expected
+
+    @staticmethod
+    @mark.parametrize('value, node_globals, expected', [
+        ('value', None, 'value'),
+        ('{1 + 1}', None, 2),
+        ('{key}', {'key': 'value'}, 'value')
+    ]) # yapf: disable
+    def test_get_value(value, node_globals, expected):
+        """get_value() should evaluate expression"""
+        attr = XmlAttr('key', value)
+        node_plan = compile_node(XmlNode('wx', 'Button', attrs = [attr]))
+
+        actual = node_plan.get_value(attr, node_globals)
+
+        assert actual == expected
+
+    @staticmethod
+    @mark.parametrize('value, constant', [
+        ('{1 + 1}', True),
+        ('{("one", 2)}', True),
+        ('{key}', False),
+        ('{[1]}', False),
+        ('{(lambda: key)()}', False),
+        ('{1 / 0}', False),
+        ('{ordered.__name__}', True),
+        ('{len("one") + 1}', True),
+        ('{ordered.OrderedDict()}', False),
+        ('{ordered.OrderedDict(one = 1)["one"]}', False),
+        ('{unknown.VALUE}', False),
+        ('{print("one")}', False)
+    ]) # yapf: disable
+    def test_evaluate_constants(value, constant):
+        """evaluate_constants() should store immutable values of pure expressions"""
+        attr = XmlAttr('key', value)
+        node_plan = compile_node(XmlNode('wx', 'Button', attrs = [attr]))
+
+        node_plan.evaluate_constants({'ordered': collections})
+
+        assert (attr in node_plan.constants) == constant
+
+    @staticmethod
+    def test_get_value_returns_constant():
+        """get_value() should return precomputed constant"""
+        attr = XmlAttr('key', '{1 + 1}')
+        node_plan = compile_node(XmlNode('wx', 'Button', attrs = [attr]))
+        node_plan.evaluate_constants()
+
+        with patch(plan.__name__ + '.evaluate') as evaluate:
+            actual = node_plan.get_value(attr)
+
+        assert actual == 2
+        assert not evaluate.called
+
+    @staticmethod
+    def test_resolves_pipeline_from_current_container():
+        """should resolve pipeline from current container on every access"""
+        node_plan = NodePlan(XmlNode('plan.namespace', 'Tag'), {}, {})
+        first, second = RenderingPipeline(), RenderingPipeline()
+
+        with use_container():
+            use_pipeline(first, 'plan.namespace')
+            assert node_plan.pipeline is first
+            use_pipeline(second, 'plan.namespace.Tag')
+            assert node_plan.pipeline is second
+
+        with use_container():
+            use_pipeline(first, 'plan.namespace')
+            assert node_plan.pipeline is first
+
+    @staticmethod
+    def test_resolves_type_once():
+        """should resolve instance type once"""
+        node_plan = NodePlan(XmlNode('plan.namespace', 'Tag'), {}, {})
+        with patch(plan.__name__ + '.get_type') as get_type:
+            first, second = node_plan.inst_type, node_plan.inst_type
+
+        assert first is second
+        assert get_type.call_count == 1
+
+
+def test_compile_tree():
+    """should create plans for all nodes in tree"""
+    child = XmlNode('wx', 'Button')
+    root = XmlNode('wx', 'Panel', children = [child])
+
+    root_plan = compile_tree(root)
+
+    assert root_plan.xml_node is root
+    assert get_node_plan(root) is root_plan
+    assert get_node_plan(child).xml_node is child
+
+
+def test_get_node_plan_compiles_once():
+    """get_node_plan() should compile not compiled xml node once"""
+    xml_node = XmlNode('wx', 'Button', attrs = [XmlAttr('key', 'value')])
+
+    first, second = get_node_plan(xml_node), get_node_plan(xml_node)
+
+    assert first is second
+    assert first.applied_attrs == xml_node.attrs
+
+
+class PlanCacheTests:
+    """PlanCache tests"""
+
+    @staticmethod
+    def test_evicts_least_recently_used_plan():
+        """should remove least recently used plan above max size"""
+        cache = PlanCache(2)
+        first, second, third = [compile_node(XmlNode('wx', 'Button')) for _ in range(3)]
+        cache.put(first)
+        cache.put(second)
+        cache.get(first.xml_node)
+
+        cache.put(third)
+
+        assert cache.get(first.xml_node) is first
+        assert cache.get(second.xml_node) is None
+        assert cache.get(third.xml_node) is third
+
+    @staticmethod
+    def test_max_size():
+        """should remove plans above new max size"""
+        cache = PlanCache(2)
+        for _ in range(2):
+            cache.put(compile_node(XmlNode('wx', 'Button')))
+
+        cache.max_size = 1
+
+        assert len(cache) == 1
+
+
+def test_get_node_plan_is_bounded():
+    """get_node_plan() should not keep plans of rendered xml nodes above cache size"""
+    cache = get_plan_cache()
+    max_size = cache.max_size
+    cache.max_size = 10
+    try:
+        for _ in range(20):
+            get_node_plan(XmlNode('wx', 'Button'))
+
+        assert len(cache) == 10
+    finally:
+        cache.max_size = max_size
+
+
+def test_get_node_type():
+    """get_node_type() should resolve type for xml node"""
+    actual = get_node_type(XmlNode('pyviews.containers', 'Container'))
+
+    assert actual.__name__ == 'Container'
+
+
+def test_resolve_type_imports_once_per_tag():
+    """resolve_type() should resolve type once for namespace and tag"""
+    with patch(plan.__name__ + '.get_type') as get_type:
+        first = resolve_type(XmlNode('type.namespace', 'Tag'))
+        second = resolve_type(XmlNode('type.namespace', 'Tag'))
+
+    assert first is second
+    assert get_type.call_count == 1
+
+
+class ConstructorCacheTests:
+    """ConstructorCache tests"""
+
+    @staticmethod
+    def test_chooses_constructor_once_per_tag():
+        """should choose constructor once for namespace and tag"""
+        choose = Mock()
+        cache = ConstructorCache(choose)
+
+        first = cache.get(XmlNode('pyviews.containers', 'Container'))
+        second = cache.get(XmlNode('pyviews.containers', 'Container'))
+
+        assert first is second
+        assert first == (get_node_type(XmlNode('pyviews.containers', 'Container')), choose.return_value)
+        assert choose.call_count == 1
+
+    @staticmethod
+    def test_chooses_constructor_by_type():
+        """should pass resolved type to choose"""
+        cache = ConstructorCache(lambda inst_type: inst_type.__name__)
+
+        actual = cache.get(XmlNode('pyviews.containers', 'View'))
+
+        assert actual[1] == 'View'
+
+
+@fixture
+def views_fixture(request, tmp_path):
+    views_folder = tmp_path / 'views'
+    views_folder.mkdir()
+    (views_folder / 'view.xml').write_text(VIEW)
+    plans_folder = tmp_path / 'plans'
+    add_singleton('views_folder', str(views_folder))
+    add_singleton('view_ext', 'xml')
+    add_singleton('plans_folder', str(plans_folder))
+    plan._VIEWS.clear()
+    request.cls.views_folder = views_folder
+    request.cls.plans_folder = plans_folder
+    yield views_folder
+    plan._VIEWS.clear()
+    plan._VIEW_PLANS.clear()
+
+
+@mark.usefixtures('container_fixture', 'views_fixture')
+class CompileViewTests:
+    """compile_view() tests"""
+
+    views_folder = None
+    plans_folder = None
+
+    def test_compiles_view(self):
+        """should parse view and create plans"""
+        root_plan = compile_view('view')
+
+        assert root_plan.xml_node.name == 'Container'
+        assert root_plan.get_attrs('init') == [XmlAttr('key', 'value', 'init')]
+        child_plan = get_node_plan(root_plan.xml_node.children[0])
+        assert child_plan.expressions[XmlAttr('key', 'once:{1}')] == ParsedExpression('once', '1')
+
+    @staticmethod
+    def test_keeps_plans_with_view():
+        """should keep view plans with view instead of plan cache"""
+        get_plan_cache().clear()
+
+        root_plan = compile_view('view')
+
+        assert len(get_plan_cache()) == 0
+        assert get_node_plan(root_plan.xml_node) is root_plan
+
+    def test_uses_memory_cache(self):
+        """should return same plan for same view"""
+        assert compile_view('view') is compile_view('view')
+
+    def test_stores_plans_to_disk(self):
+        """should save plans to plans folder"""
+        compile_view('view')
+
+        assert [path.suffix for path in self.plans_folder.iterdir()] == ['.plan']
+        assert listdir(self.views_folder) == ['view.xml']
+
+    def test_loads_plans_from_disk(self):
+        """should load plans from disk without parsing"""
+        compile_view('view')
+        plan._VIEWS.clear()
+        with patch(plan.__name__ + '.parse') as parse:
+            root_plan = compile_view('view')
+
+        assert not parse.called
+        assert root_plan.xml_node.name == 'Container'
+        assert root_plan.get_attrs('init') == [XmlAttr('key', 'value', 'init')]
+        child_plan = get_node_plan(root_plan.xml_node.children[0])
+        assert child_plan.expressions[XmlAttr('key', 'once:{1}')] == ParsedExpression('once', '1')
+        assert child_plan.xml_node.view_info.view == 'view'
+
+    def test_does_not_execute_plan_file(self):
+        """should store plans as json data and parse view again if plan file is not valid"""
+        compile_view('view')
+        plan._VIEWS.clear()
+        plan_path = next(self.plans_folder.iterdir())
+        assert json.loads(plan_path.read_text())
+        plan_path.write_bytes(pickle.dumps(('code', 'data')))
+
+        root_plan = compile_view('view')
+
+        assert root_plan.get_attrs('init') == [XmlAttr('key', 'value', 'init')]
+        assert json.loads(plan_path.read_text())
+
+    def test_writes_plans_through_temp_file(self):
+        """should write plans to unique temp file and replace plan file with it"""
+        with patch(plan.__name__ + '.replace') as replace:
+            compile_view('view')
+
+        temp_path, plan_path = replace.call_args[0]
+        assert temp_path != f'{plan_path}.tmp'
+        assert temp_path.endswith('.tmp')
+
+    def test_recompiles_changed_view(self):
+        """should parse view again if file is modified"""
+        compile_view('view')
+        plan._VIEWS.clear()
+        view_path = join(self.views_folder, 'view.xml')
+        with open(view_path, 'w') as view_file:
+            view_file.write(VIEW.replace('value', 'changed'))
+        utime(view_path, ns = (0, 0))
+
+        root_plan = compile_view('view')
+
+        assert root_plan.get_attrs('init') == [XmlAttr('key', 'changed', 'init')]
+
+    def test_does_not_store_without_plans_folder(self):
+        """should not save plans if plans folder is not set"""
+        with use_container():
+            add_singleton('views_folder', str(self.views_folder))
+            add_singleton('view_ext', 'xml')
+
+            compile_view('view')
+
+        assert listdir(self.views_folder) == ['view.xml']
+        assert not self.plans_folder.exists()
+
+    @staticmethod
+    def test_raises_for_missing_view():
+        """should raise ViewError if view is not found"""
+        with raises(ViewError):
+            compile_view('missing')
+
+
+@mark.usefixtures('container_fixture', 'views_fixture')
+class PrepareViewTests:
+    """prepare_view() tests"""
+
+    @staticmethod
+    def test_prepares_view_in_executor():
+        """should compile view plans in executor"""
+        with ThreadPoolExecutor(max_workers = 1) as executor:
+            prepared = prepare_view('view', executor).result()
+
+        assert prepared.name == 'view'
+        assert prepared.root is compile_view('view')
+
+    @staticmethod
+    def test_prepares_view_in_default_executor():
+        """should compile view plans in background thread by default"""
+        prepared = prepare_view('view').result(timeout = 5)
+
+        assert prepared.root.xml_node.name == 'Container'
+
+    @staticmethod
+    def test_evaluates_constants():
+        """should evaluate constant expressions of all nodes"""
+        prepared = prepare_view('view').result(timeout = 5)
+
+        child_plan = get_node_plan(prepared.root.xml_node.children[0])
+        assert child_plan.constants == {XmlAttr('key', 'once:{1}'): 1}
+        assert prepared.root.constants == {XmlAttr('name', '{"some" + " name"}'): 'some name'}
+
+    @staticmethod
+    def test_evaluates_imported_module_constants(views_fixture):
+        """should evaluate init expressions using modules imported by ancestors"""
+        (views_fixture / 'imports.xml').write_text(IMPORTS_VIEW)
+
+        prepared = prepare_view('imports').result(timeout = 5)
+
+        child_plan, shadowed_plan = (get_node_plan(node) for node in prepared.root.xml_node.children)
+        assert prepared.root.constants == {}
+        assert child_plan.constants == {XmlAttr('orient', '{wx.VERTICAL}', 'init'): VERTICAL}
+        assert XmlAttr('orient', '{wx.VERTICAL}', 'init') not in shadowed_plan.constants
+        with patch(plan.__name__ + '.evaluate') as evaluate:
+            assert child_plan.get_value(XmlAttr('orient', '{wx.VERTICAL}', 'init')) == VERTICAL
+        assert not evaluate.called
+
+    @staticmethod
+    def test_resolves_types():
+        """should resolve instance types"""
+        prepared = prepare_view('view').result(timeout = 5)
+
+        assert prepared.root.inst_type.__name__ == 'Container'
+
+    @staticmethod
+    def test_raises_for_missing_view():
+        """future should raise ViewError if view is not found"""
+        with raises(ViewError):
+            prepare_view('missing').result(timeout = 5)
+
+
+@mark.usefixtures('container_fixture', 'views_fixture')
+class RenderViewPlanTests:
+    """render_view_plan() tests"""
+
+    @staticmethod
+    @mark.parametrize('prepared', [True, False])
+    def test_renders_view_root(prepared):
+        """should render root of view or prepared view"""
+        root = compile_view('view')
+        view = PreparedView('view', root) if prepared else 'view'
+        context = Mock()
+        with patch(plan.__name__ + '.render') as render:
+            actual = render_view_plan(view, context)
+
+        assert actual is render.return_value
+        assert context.xml_node is root.xml_node
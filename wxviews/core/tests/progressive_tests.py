@@ -0,0 +1,196 @@
+from unittest.mock import Mock, patch
+
+from pytest import fixture, mark
+from pyviews.core.rendering import Node
+from pyviews.core.xml import XmlNode
+from wx import EVT_IDLE
+
+from wxviews.core import progressive
+from wxviews.core.progressive import (ProgressiveRenderer, RenderQueue, RenderTask, cancel, complete, get_renderer,
+                                      render_children_progressively)
+from wxviews.core.rendering import WxRenderingContext
+
+
+class Clock:
+    """Fake timer"""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class RenderQueueTests:
+    """RenderQueue tests"""
+
+    @staticmethod
+    def test_counts_tasks_per_node():
+        """should track queued tasks of every node"""
+        queue = RenderQueue()
+        one, two = Node(XmlNode('wx', 'One')), Node(XmlNode('wx', 'Two'))
+        tasks = [RenderTask(node, XmlNode('wx', 'Child'), Mock(), Mock()) for node in (one, two, one)]
+        for task in tasks:
+            queue.append(task)
+
+        assert queue.pop() is tasks[0]
+        assert queue.has_tasks(one)
+
+        queue.discard(one)
+
+        assert list(queue) == [tasks[1]]
+        assert not queue.has_tasks(one)
+        assert queue.has_tasks(two)
+
+
+def _get_child_context(xml_node, parent_node, _):
+    return WxRenderingContext({'xml_node': xml_node, 'parent_node': parent_node})
+
+
+def _create_tree(count: int, nested: int = 0) -> Node:
+    children = [XmlNode('wx', 'Child', children = [XmlNode('wx', 'Nested') for _ in range(nested)])
+                for _ in range(count)]
+    return Node(XmlNode('wx', 'Root', children = children))
+
+
+@fixture
+def progressive_fixture(request):
+    clock = Clock()
+
+    def render(context):
+        node = Node(context.xml_node)
+        clock.now += 1
+        render_children_progressively(node, context, _get_child_context)
+        return node
+
+    with patch(progressive.__name__ + '.render') as render_mock:
+        render_mock.side_effect = render
+        with patch(progressive.__name__ + '.layout'):
+            request.cls.clock = clock
+            request.cls.render = render_mock
+            yield clock
+    progressive._set_renderer(None)
+
+
+@mark.usefixtures(progressive_fixture.__name__)
+class ProgressiveRendererTests:
+    """ProgressiveRenderer tests"""
+
+    clock: Clock
+    render: Mock
+
+    def _begin(self, initial_time = 2.5, on_complete = None) -> ProgressiveRenderer:
+        renderer = ProgressiveRenderer(on_complete, slice_time = 1.5, initial_time = initial_time, timer = self.clock)
+        renderer.begin()
+        return renderer
+
+    @staticmethod
+    def test_renders_synchronously_without_renderer():
+        """should render all children if progressive rendering is not started"""
+        root = _create_tree(3)
+        with patch(progressive.__name__ + '.render_children') as render_children:
+            render_children_progressively(root, WxRenderingContext(), _get_child_context)
+
+        assert render_children.called
+
+    def test_queues_children_after_initial_time(self):
+        """should render children until initial time is over and queue the rest"""
+        renderer = self._begin()
+        root = _create_tree(5)
+
+        render_children_progressively(root, WxRenderingContext(), _get_child_context)
+
+        assert len(root.children) == 3
+        assert renderer.pending == 2
+        assert get_renderer() is renderer
+
+    def test_renders_queued_children_on_idle(self):
+        """should render queued children in slices and call on_complete"""
+        on_complete = Mock()
+        renderer = self._begin(on_complete = on_complete)
+        root = _create_tree(6)
+        render_children_progressively(root, WxRenderingContext(), _get_child_context)
+        app = Mock()
+        renderer.start(app)
+        handler = app.Bind.call_args[0][1]
+        event = Mock()
+
+        handler(event)
+
+        assert len(root.children) == 5
+        assert event.RequestMore.called
+        assert not on_complete.called
+
+        handler(Mock())
+
+        assert [child.xml_node for child in root.children] == root.xml_node.children
+        assert on_complete.called
+        assert app.Unbind.call_args[0][0] == EVT_IDLE
+        assert get_renderer() is None
+
+    def test_keeps_children_order(self):
+        """should queue later siblings if previous sibling is queued"""
+        renderer = self._begin(initial_time = 1.5)
+        root = _create_tree(2, nested = 2)
+
+        render_children_progressively(root, WxRenderingContext(), _get_child_context)
+        renderer.start(Mock())
+        while renderer.pending:
+            renderer.run_slice()
+
+        assert [child.xml_node for child in root.children] == root.xml_node.children
+        for child in root.children:
+            assert [nested.xml_node for nested in child.children] == child.xml_node.children
+
+    def test_complete(self):
+        """complete() should render queued subtree of passed node"""
+        renderer = self._begin(initial_time = 0)
+        root = _create_tree(2, nested = 2)
+        other = _create_tree(2)
+        render_children_progressively(root, WxRenderingContext(), _get_child_context)
+        render_children_progressively(other, WxRenderingContext(), _get_child_context)
+
+        complete(root)
+
+        assert len(root.children) == 2
+        assert all(len(child.children) == 2 for child in root.children)
+        assert other.children == []
+        assert renderer.pending == 2
+
+    def test_cancel(self):
+        """cancel() should remove queued subtrees of passed node"""
+        renderer = self._begin(initial_time = 0)
+        root, other = _create_tree(3), _create_tree(2)
+        render_children_progressively(root, WxRenderingContext(), _get_child_context)
+        render_children_progressively(other, WxRenderingContext(), _get_child_context)
+
+        cancel(root)
+        renderer.start(Mock())
+        while renderer.pending:
+            renderer.run_slice()
+
+        assert len(root.children) == 1
+        assert len(other.children) == 2
+
+    def test_cancel_finishes(self):
+        """cancel() should call on_complete if there are no queued subtrees"""
+        on_complete = Mock()
+        renderer = self._begin(initial_time = 0, on_complete = on_complete)
+        root = _create_tree(2)
+        render_children_progressively(root, WxRenderingContext(), _get_child_context)
+        renderer.start(Mock())
+
+        cancel(root)
+
+        assert on_complete.called
+        assert get_renderer() is None
+
+    def test_finishes_without_queued_children(self):
+        """start() should call on_complete if everything is rendered"""
+        on_complete = Mock()
+        renderer = self._begin(on_complete = on_complete)
+
+        renderer.start(Mock())
+
+        assert on_complete.called
+        assert get_renderer() is None
@@ -1,9 +1,9 @@
 from unittest.mock import Mock
 
-from pytest import fixture, mark
+from pytest import fixture, mark, raises
 from pyviews.core.xml import XmlAttr
 
-from wxviews.core.rendering import WxRenderingContext, get_attr_args
+from wxviews.core.rendering import WxRenderingContext, get_attr_args, to_bool
 
 
 @fixture
@@ -50,6 +50,66 @@ class WxRenderingContextTests:
         assert self.context.node_styles == value
         assert self.context['node_styles'] == value
 
+    @staticmethod
+    def test_is_dictionary():
+        """should store fields and other keys as dictionary"""
+        parent = Mock()
+        context = WxRenderingContext({'parent': parent, 'key': 'value'})
+
+        assert context == {'parent': parent, 'key': 'value'}
+        assert dict(context) == {'parent': parent, 'key': 'value'}
+        assert len(context) == 2
+        assert 'parent' in context
+        assert 'sizer' not in context
+        assert context.get('sizer', 'default') == 'default'
+
+    @staticmethod
+    def test_deletes_fields():
+        """should remove field from dictionary"""
+        context = WxRenderingContext({'sizer': Mock()})
+
+        del context['sizer']
+
+        assert 'sizer' not in context
+        assert context.sizer is None
+        with raises(KeyError):
+            assert context['sizer']
+
+    @staticmethod
+    def test_stores_fields_in_slots():
+        """should not store fields in dictionary storage"""
+        context = WxRenderingContext({'parent': Mock(), 'sizer': Mock(), 'key': 'value'})
+
+        assert dict.__len__(context) == 1
+
+    @staticmethod
+    def test_derive():
+        """derive() should copy parent and apply passed values"""
+        parent, sizer, xml_node = Mock(), Mock(), Mock()
+        context = WxRenderingContext({
+            'parent': parent,
+            'sizer': Mock(),
+            'node_styles': Mock(),
+            'parent_node': Mock(),
+            'xml_node': Mock(),
+            'key': 'value'
+        })
+
+        actual = context.derive(sizer = sizer, xml_node = xml_node)
+
+        assert isinstance(actual, WxRenderingContext)
+        assert actual == {'parent': parent, 'sizer': sizer, 'xml_node': xml_node}
+
+    @staticmethod
+    def test_derive_does_not_copy_sizer():
+        """derive() should not copy sizer and styles if they are not passed"""
+        parent = Mock()
+        context = WxRenderingContext({'parent': Mock(), 'sizer': Mock(), 'node_styles': Mock()})
+
+        actual = context.derive(parent = parent)
+
+        assert actual == {'parent': parent}
+
 
 @mark.parametrize('namespace, attrs, args', [
     ('init', [], {}),
@@ -77,3 +137,20 @@ def test_get_attr_args(namespace, attrs, args):
     actual = get_attr_args(xml_node, namespace)
 
     assert actual == args
+
+
+@mark.parametrize('value, expected', [
+    ('true', True),
+    ('False', False),
+    (None, False),
+    (2, True)
+]) # yapf: disable
+def test_to_bool(value, expected):
+    """to_bool() should convert value to boolean"""
+    assert to_bool(value) == expected
+
+
+def test_to_bool_raises():
+    """to_bool() should raise ValueError for string that is not boolean"""
+    with raises(ValueError):
+        to_bool('yes')
@@ -0,0 +1,141 @@
+from itertools import count
+from json import load
+from unittest.mock import Mock
+
+from injectool import DependencyError, add_singleton, resolve
+from pytest import mark, raises
+from pyviews.binding.expression import ExpressionBinding
+from pyviews.core.binding import BindableEntity
+from pyviews.core.error import ViewInfo
+from pyviews.core.expression import Expression
+from pyviews.core.rendering import NodeGlobals
+from pyviews.core.xml import XmlNode
+from pyviews.rendering.pipeline import render
+
+from wxviews.core.tracing import Tracer, get_tracer, span, tracing
+from wxviews.widgets.batching import MarshalledExpressionBinding
+
+
+class TracerTests:
+    """Tracer tests"""
+
+    @staticmethod
+    def test_span():
+        """span() should record complete event in microseconds"""
+        tracer = Tracer(timer = count().__next__)
+
+        with tracer.span('name', 'category', {'key': 'value'}):
+            pass
+
+        event = tracer.events[0]
+        assert (event['name'], event['cat'], event['ph']) == ('name', 'category', 'X')
+        assert (event['ts'], event['dur']) == (0, 1_000_000)
+        assert event['args'] == {'key': 'value'}
+
+    @staticmethod
+    def test_instant():
+        """instant() should record instant event"""
+        tracer = Tracer()
+
+        tracer.instant('name', 'category')
+
+        assert tracer.events[0]['ph'] == 'i'
+        assert 'args' not in tracer.events[0]
+
+    @staticmethod
+    def test_save(tmp_path):
+        """save() should write trace events json"""
+        tracer = Tracer()
+        tracer.instant('name', 'category', {'value': object()})
+        path = str(tmp_path / 'trace.json')
+
+        tracer.save(path)
+
+        with open(path) as trace_file:
+            trace = load(trace_file)
+        assert trace['traceEvents'][0]['name'] == 'name'
+
+
+def test_span_without_tracer():
+    """span() should do nothing if tracing is not active"""
+    with span('name', 'category'):
+        assert get_tracer() is None
+
+
+class Model(BindableEntity):
+    """Test model"""
+
+    def __init__(self):
+        super().__init__()
+        self.value = 1
+
+
+@mark.usefixtures('container_fixture')
+class TracingTests:
+    """tracing() tests"""
+
+    @staticmethod
+    def test_sets_active_tracer():
+        """should set active tracer while context is active"""
+        with tracing() as tracer:
+            assert get_tracer() is tracer
+
+        assert get_tracer() is None
+
+    @staticmethod
+    def test_traces_render():
+        """should record rendered nodes with view info"""
+        render_node = Mock()
+        add_singleton(render, render_node)
+        xml_node = XmlNode('wx', 'Button', view_info = ViewInfo('view', 3))
+
+        with tracing() as tracer:
+            render(Mock(xml_node = xml_node))
+
+        assert render_node.called
+        assert tracer.events[0]['name'] == 'wx.Button'
+        assert tracer.events[0]['args'] == {'view': 'view', 'line': 3}
+        assert resolve(render) is render_node
+
+    @staticmethod
+    def test_restores_unregistered_render():
+        """should leave render unregistered if it was not registered"""
+        with tracing():
+            pass
+
+        with raises(DependencyError):
+            resolve(render)
+
+    @staticmethod
+    def test_does_not_patch_expression_binding():
+        """should not change pyviews ExpressionBinding class"""
+        execute_callback = ExpressionBinding._execute_callback
+
+        with tracing():
+            assert ExpressionBinding._execute_callback is execute_callback
+
+    @staticmethod
+    def test_traces_expression_binding():
+        """should record expression binding updates"""
+        model = Model()
+        callback = Mock()
+        binding = MarshalledExpressionBinding(callback, Expression('model.value'), NodeGlobals({'model': model}))
+        binding.bind()
+
+        with tracing() as tracer:
+            model.value = 2
+        model.value = 3
+
+        assert [event['name'] for event in tracer.events] == ['ExpressionBinding']
+        assert tracer.events[0]['args'] == {'expression': 'model.value'}
+        assert callback.call_count == 3
+
+    @staticmethod
+    def test_saves_trace(tmp_path):
+        """should save trace to passed path"""
+        path = tmp_path / 'trace.json'
+
+        with tracing(str(path)) as tracer:
+            tracer.instant('name', 'category')
+
+        assert path.exists()
@@ -0,0 +1,118 @@
+"""Chrome trace events of rendering, binding and layout"""
+
+from contextlib import contextmanager, nullcontext
+from functools import wraps
+from json import dump
+from os import getpid
+from threading import get_ident
+from time import perf_counter
+from typing import Any, Callable, ContextManager, Dict, Generator, List, Optional
+
+from injectool import DependencyError, add_singleton, get_container, resolve
+from pyviews.core.rendering import Node, RenderingContext
+from pyviews.rendering.pipeline import render
+
+_NO_SPAN = nullcontext()
+
+
+class Tracer:
+    """Collects trace events in Chrome trace event format"""
+
+    def __init__(self, timer: Callable[[], float] = perf_counter):
+        self._timer: Callable[[], float] = timer
+        self._pid: int = getpid()
+        self.events: List[dict] = []
+
+    def _now(self) -> float:
+        return self._timer() * 1_000_000
+
+    @contextmanager
+    def span(self, name: str, category: str, args: Optional[Dict[str, Any]] = None) -> Generator[None, None, None]:
+        """Records complete event for wrapped code"""
+        start = self._now()
+        try:
+            yield
+        finally:
+            event = self._create_event(name, category, 'X', start, args)
+            event['dur'] = self._now() - start
+            self.events.append(event)
+
+    def instant(self, name: str, category: str, args: Optional[Dict[str, Any]] = None):
+        """Records instant event"""
+        self.events.append(self._create_event(name, category, 'i', self._now(), args))
+
+    def _create_event(self, name: str, category: str, phase: str, timestamp: float, args: Optional[dict]) -> dict:
+        event = {'name': name, 'cat': category, 'ph': phase, 'ts': timestamp, 'pid': self._pid, 'tid': get_ident()}
+        if args:
+            event['args'] = args
+        return event
+
+    def to_dict(self) -> dict:
+        """Returns trace in Chrome trace event format"""
+        return {'traceEvents': self.events, 'displayTimeUnit': 'ms'}
+
+    def save(self, path: str):
+        """Writes trace json that can be opened in chrome://tracing or Perfetto"""
+        with open(path, 'w', encoding = 'utf-8') as trace_file:
+            dump(self.to_dict(), trace_file, default = str)
+
+
+_TRACER: Optional[Tracer] = None
+
+
+def get_tracer() -> Optional[Tracer]:
+    """Returns active tracer"""
+    return _TRACER
+
+
+def _set_tracer(tracer: Optional[Tracer]):
+    global _TRACER # pylint: disable=global-statement
+    _TRACER = tracer
+
+
+def span(name: str, category: str, args: Optional[Dict[str, Any]] = None) -> ContextManager:
+    """Records span to active tracer. Does nothing if tracing is not active"""
+    if _TRACER is None:
+        return _NO_SPAN
+    return _TRACER.span(name, category, args)
+
+
+def _trace_render(render_node: Callable[[RenderingContext], Node]) -> Callable[[RenderingContext], Node]:
+
+    @wraps(render_node)
+    def _render(context: RenderingContext) -> Node:
+        xml_node = context.xml_node
+        view_info = xml_node.view_info
+        args = {'view': view_info.view, 'line': view_info.line} if view_info else None
+        with span(f'{xml_node.namespace}.{xml_node.name}', 'render', args):
+            return render_node(context)
+
+    return _render
+
+
+@contextmanager
+def tracing(path: Optional[str] = None, timer: Callable[[], float] = perf_counter) -> Generator[Tracer, None, None]:
+    """
+    Records node rendering, bindings updates, styles and layout while context is active.
+    Trace is saved to passed path on exit.
+    """
+    # pylint: disable=protected-access
+    tracer = Tracer(timer)
+    container = get_container()
+    resolver = container._resolvers.get(render)
+    try:
+        render_node = resolve(render)
+    except DependencyError:
+        render_node = render.__wrapped__
+    add_singleton(render, _trace_render(render_node))
+    _set_tracer(tracer)
+    try:
+        yield tracer
+    finally:
+        _set_tracer(None)
+        if resolver is None:
+            container._resolvers.pop(render, None)
+        else:
+            container.set(render, resolver)
+        if path:
+            tracer.save(path)
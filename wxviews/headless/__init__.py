@@ -0,0 +1,44 @@
+"""
+Headless wx backend implemented by pure python objects.
+Used to run and measure wxviews pipelines without display server.
+"""
+
+import sys
+from os import environ
+from types import ModuleType
+
+from wxviews.headless import aui, core
+
+BACKEND_ENV = 'WXVIEWS_BACKEND'
+HEADLESS = 'headless'
+
+
+def is_requested() -> bool:
+    """Returns True if headless backend is selected by environment variable"""
+    return environ.get(BACKEND_ENV, '').lower() == HEADLESS
+
+
+def is_installed() -> bool:
+    """Returns True if headless backend is used as wx"""
+    return sys.modules.get('wx') is core
+
+
+def install():
+    """Registers headless backend as wx module. Should be called before wx is imported"""
+    if is_installed():
+        return
+    if 'wx' in sys.modules:
+        raise ImportError('wx is already imported, headless backend should be installed before')
+    dispatcher = ModuleType('wx.py.dispatcher')
+    dispatcher.Any = object
+    py = ModuleType('wx.py')
+    py.dispatcher = dispatcher
+    core.aui = aui
+    core.py = py
+    sys.modules.update({
+        'wx': core,
+        'wx._core': core,
+        'wx.aui': aui,
+        'wx.py': py,
+        'wx.py.dispatcher': dispatcher
+    }) # yapf: disable
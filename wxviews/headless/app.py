@@ -0,0 +1,194 @@
+"""Event loop of headless backend"""
+
+# pylint: disable=unused-argument,redefined-builtin
+
+from collections import deque
+from threading import current_thread, main_thread
+from time import perf_counter
+from typing import Any, Callable, Optional
+
+from wxviews.headless.common import ID_ANY
+from wxviews.headless.events import _IDLE_HANDLERS, _PENDING, EVT_IDLE, EVT_TIMER, Event, EvtHandler, IdleEvent
+from wxviews.headless.windows import _TOP_LEVEL_WINDOWS, GetTopLevelWindows, Window
+
+
+class Timer(EvtHandler):
+    """Timer fired by event loop"""
+
+    def __init__(self, owner: Optional[EvtHandler] = None, id: int = ID_ANY):
+        super().__init__()
+        self._owner: Optional[EvtHandler] = owner
+        self._due: Optional[float] = None
+        self._interval: int = 0
+        self._one_shot: bool = False
+
+    def Start(self, milliseconds: int = -1, oneShot: bool = False) -> bool:
+        if milliseconds >= 0:
+            self._interval = milliseconds
+        self._one_shot = oneShot
+        self._due = perf_counter() + self._interval / 1000
+        if self not in _PENDING.timers:
+            _PENDING.timers.append(self)
+        return True
+
+    def StartOnce(self, milliseconds: int = -1) -> bool:
+        return self.Start(milliseconds, True)
+
+    def Stop(self):
+        self._due = None
+        if self in _PENDING.timers:
+            _PENDING.timers.remove(self)
+
+    def IsRunning(self) -> bool:
+        return self._due is not None
+
+    def GetInterval(self) -> int:
+        return self._interval
+
+    def is_due(self, now: float) -> bool:
+        """Returns True if timer should be fired"""
+        return self._due is not None and self._due <= now
+
+    def Notify(self):
+        if self._one_shot:
+            self.Stop()
+        else:
+            self._due = perf_counter() + self._interval / 1000
+        target = self._owner if self._owner is not None else self
+        target.ProcessEvent(Event(0, EVT_TIMER.typeId))
+
+
+class CallLater(Timer):
+    """Calls passed function after delay"""
+
+    def __init__(self, millis: int, callableObj: Callable, *args, **kwargs):
+        super().__init__()
+        self._callable: Callable = callableObj
+        self._args: tuple = args
+        self._kwargs: dict = kwargs
+        self._result: Any = None
+        self.Start(millis, True)
+
+    def Notify(self):
+        self.Stop()
+        self._result = self._callable(*self._args, **self._kwargs)
+
+    def GetResult(self) -> Any:
+        return self._result
+
+    def Restart(self, millis: int = -1):
+        self.Start(millis, True)
+
+
+_APP: Optional['App'] = None
+
+
+class App(EvtHandler):
+    """Application running pending calls, timers and idle events"""
+
+    def __init__(self, redirect: bool = False, filename: Optional[str] = None, useBestVisual: bool = False,
+                 clearSigInt: bool = True):
+        super().__init__()
+        global _APP # pylint: disable=global-statement
+        _APP = self
+        self._top_window: Optional[Window] = None
+        self._running: bool = False
+        self.OnInit()
+
+    def OnInit(self) -> bool:
+        return True
+
+    def GetTopWindow(self) -> Optional[Window]:
+        if self._top_window is not None:
+            return self._top_window
+        return next((window for window in GetTopLevelWindows() if window), None)
+
+    def SetTopWindow(self, frame: Window):
+        self._top_window = frame
+
+    def MainLoop(self) -> int:
+        """Processes pending calls, due timers and idle events until there is nothing to do"""
+        self._running = True
+        while self._running and process_events():
+            pass
+        self._running = False
+        return 0
+
+    def ExitMainLoop(self):
+        self._running = False
+
+    def IsMainLoopRunning(self) -> bool:
+        return self._running
+
+    def Yield(self, onlyIfNeeded: bool = False) -> bool:
+        process_events()
+        return True
+
+
+PySimpleApp = App
+
+
+def GetApp() -> Optional[App]:
+    """Returns created application"""
+    return _APP
+
+
+def IsMainThread() -> bool:
+    """Returns True if called from main thread"""
+    return current_thread() is main_thread()
+
+
+def Exit():
+    """Stops main loop"""
+    if _APP is not None:
+        _APP.ExitMainLoop()
+
+
+def Yield() -> bool:
+    """Processes pending events"""
+    process_events()
+    return True
+
+
+SafeYield = Yield
+
+
+def WakeUpIdle():
+    """Requests idle event on next event loop iteration"""
+    _PENDING.wake_up = True
+
+
+def process_events() -> bool:
+    """Runs pending calls, due timers and idle event handlers. Returns True if more processing is requested"""
+    _PENDING.wake_up = False
+    calls, _PENDING.calls = _PENDING.calls, deque()
+    for call, args, kwargs in calls:
+        call(*args, **kwargs)
+    now = perf_counter()
+    for timer in [timer for timer in _PENDING.timers if timer.is_due(now)]:
+        timer.Notify()
+    more = _send_idle()
+    return bool(_PENDING.calls) or more or _PENDING.wake_up
+
+
+def _send_idle() -> bool:
+    more = False
+    for handler in list(_IDLE_HANDLERS):
+        if not handler.has_handlers(EVT_IDLE):
+            _IDLE_HANDLERS.remove(handler)
+            continue
+        event = IdleEvent()
+        handler.ProcessEvent(event)
+        more = more or event.MoreRequested()
+    return more
+
+
+def reset():
+    """Removes pending calls, timers, idle handlers and top level windows"""
+    global _APP # pylint: disable=global-statement
+    _PENDING.calls.clear()
+    _PENDING.timers.clear()
+    _PENDING.wake_up = False
+    _IDLE_HANDLERS.clear()
+    _TOP_LEVEL_WINDOWS.clear()
+    _APP = None
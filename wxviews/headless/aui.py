@@ -0,0 +1,16 @@
+"""Pure python stub of wx.aui notebook"""
+
+from wxviews.headless.core import BookCtrlBase, BookCtrlEvent, PyEventBinder, NewEventType
+
+EVT_AUINOTEBOOK_PAGE_CHANGING = PyEventBinder(NewEventType())
+EVT_AUINOTEBOOK_PAGE_CHANGED = PyEventBinder(NewEventType())
+EVT_AUINOTEBOOK_PAGE_CLOSE = PyEventBinder(NewEventType())
+
+AuiNotebookEvent = BookCtrlEvent
+
+
+class AuiNotebook(BookCtrlBase):
+    """Aui notebook stub"""
+
+    changing_event: PyEventBinder = EVT_AUINOTEBOOK_PAGE_CHANGING
+    changed_event: PyEventBinder = EVT_AUINOTEBOOK_PAGE_CHANGED
@@ -0,0 +1,74 @@
+"""Constants and value types of headless backend"""
+
+from typing import NamedTuple
+
+ID_ANY = -1
+ID_SEPARATOR = -2
+ID_OK = 5100
+ID_CANCEL = 5101
+ID_EXIT = 5006
+ID_ABOUT = 5014
+
+HORIZONTAL = 0x0004
+VERTICAL = 0x0008
+BOTH = VERTICAL | HORIZONTAL
+
+LEFT = 0x0010
+RIGHT = 0x0020
+UP = 0x0040
+TOP = UP
+DOWN = 0x0080
+BOTTOM = DOWN
+ALL = LEFT | RIGHT | TOP | BOTTOM
+EXPAND = 0x2000
+SHAPED = 0x4000
+FIXED_MINSIZE = 0x8000
+ALIGN_LEFT = 0
+ALIGN_TOP = 0
+ALIGN_RIGHT = 0x0200
+ALIGN_BOTTOM = 0x0400
+ALIGN_CENTER_HORIZONTAL = 0x0100
+ALIGN_CENTER_VERTICAL = 0x0800
+ALIGN_CENTER = ALIGN_CENTER_HORIZONTAL | ALIGN_CENTER_VERTICAL
+ALIGN_CENTRE = ALIGN_CENTER
+
+DEFAULT_FRAME_STYLE = 0x20400e40
+TE_MULTILINE = 0x0020
+TE_READONLY = 0x0010
+TE_PROCESS_ENTER = 0x0400
+ITEM_SEPARATOR = -1
+ITEM_NORMAL = 0
+ITEM_CHECK = 1
+ITEM_RADIO = 2
+
+EmptyString = ''
+
+
+class wxAssertionError(AssertionError):
+    """Raised by wx assertions"""
+
+
+class PyAssertionError(wxAssertionError):
+    """Raised by wx assertions"""
+
+
+class Size(NamedTuple):
+    """Width and height"""
+    width: int = -1
+    height: int = -1
+
+    def GetWidth(self) -> int:
+        return self.width
+
+    def GetHeight(self) -> int:
+        return self.height
+
+
+class Point(NamedTuple):
+    """Position"""
+    x: int = -1
+    y: int = -1
+
+
+DefaultSize = Size()
+DefaultPosition = Point()
@@ -0,0 +1,10 @@
+"""wx namespace of headless backend"""
+
+# pylint: disable=wildcard-import,unused-wildcard-import
+
+from wxviews.headless.common import *
+from wxviews.headless.events import *
+from wxviews.headless.windows import *
+from wxviews.headless.sizers import *
+from wxviews.headless.menus import *
+from wxviews.headless.app import *
@@ -0,0 +1,318 @@
+"""Events, event handlers and pending calls of headless backend"""
+
+# pylint: disable=unused-argument,redefined-builtin
+
+from collections import deque
+from itertools import count
+from typing import Any, Callable, Deque, Dict, List, Optional, Tuple, Union
+
+from wxviews.headless.common import ID_ANY, DefaultSize, Size
+
+_EVENT_TYPES = count(10000)
+
+
+def NewEventType() -> int:
+    """Returns new event type id"""
+    return next(_EVENT_TYPES)
+
+
+class PyEventBinder:
+    """Event type used to bind handlers"""
+
+    def __init__(self, evtType: Union[int, List[int]], expectedIDs: int = 0):
+        self.evtType: List[int] = evtType if isinstance(evtType, list) else [evtType]
+        self.expectedIDs: int = expectedIDs
+
+    @property
+    def typeId(self) -> int:
+        return self.evtType[0]
+
+
+def _binder() -> PyEventBinder:
+    return PyEventBinder(NewEventType())
+
+
+EVT_IDLE = _binder()
+EVT_SHOW = _binder()
+EVT_SIZE = _binder()
+EVT_SCROLLWIN = _binder()
+EVT_CLOSE = _binder()
+EVT_PAINT = _binder()
+EVT_TIMER = _binder()
+EVT_SET_FOCUS = _binder()
+EVT_KILL_FOCUS = _binder()
+EVT_LEFT_DOWN = _binder()
+EVT_LEFT_UP = _binder()
+EVT_MOTION = _binder()
+EVT_KEY_DOWN = _binder()
+EVT_KEY_UP = _binder()
+EVT_CHAR = _binder()
+EVT_BUTTON = _binder()
+EVT_TEXT = _binder()
+EVT_TEXT_ENTER = _binder()
+EVT_CHECKBOX = _binder()
+EVT_CHOICE = _binder()
+EVT_COMBOBOX = _binder()
+EVT_LISTBOX = _binder()
+EVT_RADIOBUTTON = _binder()
+EVT_SLIDER = _binder()
+EVT_SPINCTRL = _binder()
+EVT_MENU = _binder()
+EVT_NOTEBOOK_PAGE_CHANGING = _binder()
+EVT_NOTEBOOK_PAGE_CHANGED = _binder()
+
+class Event:
+    """Base event"""
+
+    def __init__(self, id: int = 0, eventType: int = 0):
+        self._id: int = id
+        self._event_type: int = eventType
+        self._skipped: bool = False
+        self._event_object: Any = None
+
+    def GetId(self) -> int:
+        return self._id
+
+    def SetId(self, value: int):
+        self._id = value
+
+    def GetEventType(self) -> int:
+        return self._event_type
+
+    def SetEventType(self, value: int):
+        self._event_type = value
+
+    def GetEventObject(self) -> Any:
+        return self._event_object
+
+    def SetEventObject(self, value: Any):
+        self._event_object = value
+
+    def Skip(self, skip: bool = True):
+        self._skipped = skip
+
+    def GetSkipped(self) -> bool:
+        return self._skipped
+
+    def IsCommandEvent(self) -> bool:
+        return False
+
+
+class CommandEvent(Event):
+    """Event propagated to parent windows"""
+
+    def __init__(self, commandEventType: int = 0, id: int = 0):
+        super().__init__(id, commandEventType)
+        self._string: str = ''
+        self._int: int = 0
+
+    def GetString(self) -> str:
+        return self._string
+
+    def SetString(self, value: str):
+        self._string = value
+
+    def GetInt(self) -> int:
+        return self._int
+
+    def SetInt(self, value: int):
+        self._int = value
+
+    def GetSelection(self) -> int:
+        return self._int
+
+    def IsChecked(self) -> bool:
+        return bool(self._int)
+
+    def IsCommandEvent(self) -> bool:
+        return True
+
+
+class NotifyEvent(CommandEvent):
+    """Command event that can be vetoed"""
+
+    def __init__(self, eventType: int = 0, id: int = 0):
+        super().__init__(eventType, id)
+        self._allowed: bool = True
+
+    def Veto(self):
+        self._allowed = False
+
+    def Allow(self):
+        self._allowed = True
+
+    def IsAllowed(self) -> bool:
+        return self._allowed
+
+
+class BookCtrlEvent(NotifyEvent):
+    """Notebook page change event"""
+
+    def __init__(self, eventType: int = 0, id: int = 0, sel: int = -1, oldSel: int = -1):
+        super().__init__(eventType, id)
+        self._selection: int = sel
+        self._old_selection: int = oldSel
+
+    def GetSelection(self) -> int:
+        return self._selection
+
+    def GetOldSelection(self) -> int:
+        return self._old_selection
+
+
+class IdleEvent(Event):
+    """Event sent when event queue is empty"""
+
+    def __init__(self):
+        super().__init__(0, EVT_IDLE.typeId)
+        self._more: bool = False
+
+    def RequestMore(self, needMore: bool = True):
+        self._more = needMore
+
+    def MoreRequested(self) -> bool:
+        return self._more
+
+
+class ShowEvent(Event):
+    """Event sent when window is shown or hidden"""
+
+    def __init__(self, winid: int = 0, show: bool = False):
+        super().__init__(winid, EVT_SHOW.typeId)
+        self._show: bool = show
+
+    def IsShown(self) -> bool:
+        return self._show
+
+
+class SizeEvent(Event):
+    """Event sent when window is resized"""
+
+    def __init__(self, sz: Size = DefaultSize, winid: int = 0):
+        super().__init__(winid, EVT_SIZE.typeId)
+        self._size: Size = sz
+
+    def GetSize(self) -> Size:
+        return self._size
+
+
+class ScrollWinEvent(Event):
+    """Event sent when window is scrolled"""
+
+    def __init__(self, commandType: int = 0, pos: int = 0, orient: int = 0):
+        super().__init__(0, commandType if commandType else EVT_SCROLLWIN.typeId)
+        self._position: int = pos
+        self._orientation: int = orient
+
+    def GetPosition(self) -> int:
+        return self._position
+
+    def GetOrientation(self) -> int:
+        return self._orientation
+
+
+
+
+Handler = Tuple[Callable[[Event], Any], int, int, Any]
+_IDLE_HANDLERS: List['EvtHandler'] = []
+
+
+class EvtHandler:
+    """Dispatches events to bound handlers"""
+
+    def __init__(self):
+        self._handlers: Dict[int, List[Handler]] = {}
+
+    def Bind(self, event: PyEventBinder, handler: Callable[[Event], Any], source: Any = None, id: int = ID_ANY,
+             id2: int = ID_ANY):
+        if source is not None:
+            id = source.GetId()
+        for event_type in event.evtType:
+            self._handlers.setdefault(event_type, []).append((handler, id, id2, source))
+        if event is EVT_IDLE and self not in _IDLE_HANDLERS:
+            _IDLE_HANDLERS.append(self)
+
+    def Unbind(self, event: PyEventBinder, source: Any = None, id: int = ID_ANY, id2: int = ID_ANY,
+               handler: Optional[Callable] = None) -> bool:
+        if source is not None:
+            id = source.GetId()
+        found = False
+        for event_type in event.evtType:
+            handlers = self._handlers.get(event_type, [])
+            for index in range(len(handlers) - 1, -1, -1):
+                bound, bound_id, _, __ = handlers[index]
+                if (handler is None or bound == handler) and id in (ID_ANY, bound_id):
+                    del handlers[index]
+                    found = True
+                    break
+        return found
+
+    def has_handlers(self, event: PyEventBinder) -> bool:
+        """Returns True if any handler is bound to event"""
+        return any(self._handlers.get(event_type) for event_type in event.evtType)
+
+    def ProcessEvent(self, event: Event) -> bool:
+        """Calls bound handlers. Returns True if event is handled"""
+        handlers = self._handlers.get(event.GetEventType())
+        if handlers:
+            for handler, handler_id, handler_id2, _ in reversed(list(handlers)):
+                if not _matches(event.GetId(), handler_id, handler_id2):
+                    continue
+                event.Skip(False)
+                handler(event)
+                if not event.GetSkipped():
+                    return True
+        parent = self.get_event_parent() if event.IsCommandEvent() else None
+        return parent.ProcessEvent(event) if parent is not None else False
+
+    def get_event_parent(self) -> Optional['EvtHandler']:
+        """Returns handler receiving not handled command events"""
+        return None
+
+    def GetEventHandler(self) -> 'EvtHandler':
+        return self
+
+    def SafelyProcessEvent(self, event: Event) -> bool:
+        return self.ProcessEvent(event)
+
+    def QueueEvent(self, event: Event):
+        CallAfter(self.ProcessEvent, event)
+
+    def AddPendingEvent(self, event: Event):
+        CallAfter(self.ProcessEvent, event)
+
+
+def _matches(event_id: int, handler_id: int, handler_id2: int) -> bool:
+    if handler_id == ID_ANY:
+        return True
+    if handler_id2 == ID_ANY:
+        return event_id == handler_id
+    return handler_id <= event_id <= handler_id2
+
+
+_IDS = count(1000)
+
+
+def NewIdRef(count: int = 1) -> int: # pylint: disable=redefined-outer-name
+    """Returns new window id"""
+    return next(_IDS)
+
+
+NewId = NewIdRef
+
+
+class _PendingCalls:
+    """Queue of calls run by event loop"""
+
+    def __init__(self):
+        self.calls: Deque[Tuple[Callable, tuple, dict]] = deque()
+        self.timers: List['CallLater'] = []
+        self.wake_up: bool = False
+
+
+_PENDING = _PendingCalls()
+
+
+def CallAfter(callableObj: Callable, *args, **kw):
+    """Calls passed function on next event loop iteration"""
+    _PENDING.calls.append((callableObj, args, kw))
@@ -0,0 +1,157 @@
+"""Menus of headless backend"""
+
+# pylint: disable=unused-argument,redefined-builtin,too-many-instance-attributes,too-many-arguments
+# pylint: disable=too-many-positional-arguments
+
+from typing import List, Optional, Tuple
+
+from wxviews.headless.common import ID_ANY, ID_SEPARATOR, ITEM_NORMAL, ITEM_SEPARATOR
+from wxviews.headless.events import EvtHandler, NewIdRef
+from wxviews.headless.windows import Frame, Window
+
+
+class Menu(EvtHandler):
+    """Menu stub"""
+
+    def __init__(self, title: str = '', style: int = 0):
+        super().__init__()
+        self._title: str = title
+        self._items: List[MenuItem] = []
+        self._deleted: bool = False
+
+    def Append(self, *args, **kwargs) -> 'MenuItem':
+        item = args[0] if args and isinstance(args[0], MenuItem) else MenuItem(self, *args, **kwargs)
+        item.SetMenu(self)
+        self._items.append(item)
+        return item
+
+    def AppendSeparator(self) -> 'MenuItem':
+        return self.Append(MenuItem(self, ID_SEPARATOR, kind = ITEM_SEPARATOR))
+
+    def AppendSubMenu(self, submenu: 'Menu', text: str, help: str = '') -> 'MenuItem':
+        return self.Append(MenuItem(self, ID_ANY, text, help, subMenu = submenu))
+
+    def Remove(self, item: 'MenuItem') -> 'MenuItem':
+        self._items.remove(item)
+        return item
+
+    def GetMenuItems(self) -> List['MenuItem']:
+        return list(self._items)
+
+    def GetMenuItemCount(self) -> int:
+        return len(self._items)
+
+    GetCount = GetMenuItemCount
+
+    def FindItemById(self, id: int) -> Optional['MenuItem']:
+        return next((item for item in self._items if item.GetId() == id), None)
+
+    def GetTitle(self) -> str:
+        return self._title
+
+    def SetTitle(self, title: str):
+        self._title = title
+
+    Title = property(GetTitle, SetTitle)
+
+    def Destroy(self) -> bool:
+        self._deleted = True
+        return True
+
+    def IsBeingDeleted(self) -> bool:
+        return self._deleted
+
+
+class MenuItem:
+    """Menu item stub"""
+
+    def __init__(self, parentMenu: Optional[Menu] = None, id: int = ID_SEPARATOR, text: str = '', helpString: str = '',
+                 kind: int = ITEM_NORMAL, subMenu: Optional[Menu] = None):
+        self._menu: Optional[Menu] = parentMenu
+        self._id: int = NewIdRef() if id == ID_ANY else id
+        self._text: str = text
+        self._help: str = helpString
+        self._kind: int = kind
+        self._sub_menu: Optional[Menu] = subMenu
+        self._enabled: bool = True
+        self._checked: bool = False
+
+    def GetId(self) -> int:
+        return self._id
+
+    Id = property(GetId)
+
+    def GetKind(self) -> int:
+        return self._kind
+
+    def GetMenu(self) -> Optional[Menu]:
+        return self._menu
+
+    def SetMenu(self, menu: Menu):
+        self._menu = menu
+
+    def GetSubMenu(self) -> Optional[Menu]:
+        return self._sub_menu
+
+    def GetItemLabel(self) -> str:
+        return self._text
+
+    def SetItemLabel(self, label: str):
+        self._text = label
+
+    ItemLabel = property(GetItemLabel, SetItemLabel)
+    Text = ItemLabel
+
+    def GetItemLabelText(self) -> str:
+        return self._text.replace('&', '')
+
+    def GetHelp(self) -> str:
+        return self._help
+
+    def SetHelp(self, value: str):
+        self._help = value
+
+    Help = property(GetHelp, SetHelp)
+
+    def Enable(self, enable: bool = True):
+        self._enabled = enable
+
+    def IsEnabled(self) -> bool:
+        return self._enabled
+
+    def Check(self, check: bool = True):
+        self._checked = check
+
+    def IsChecked(self) -> bool:
+        return self._checked
+
+
+class MenuBar(Window):
+    """Menu bar stub"""
+
+    def __init__(self, style: int = 0):
+        super().__init__(None, style = style)
+        self._menus: List[Tuple[Menu, str]] = []
+        self._frame: Optional[Frame] = None
+
+    def Append(self, menu: Menu, title: str) -> bool:
+        self._menus.append((menu, title))
+        return True
+
+    def GetMenuCount(self) -> int:
+        return len(self._menus)
+
+    def GetMenu(self, menuIndex: int) -> Menu:
+        return self._menus[menuIndex][0]
+
+    def GetMenuLabel(self, pos: int) -> str:
+        return self._menus[pos][1]
+
+    def Attach(self, frame: Frame):
+        self._frame = frame
+
+    def GetFrame(self) -> Optional[Frame]:
+        return self._frame
+
+    def IsTopLevel(self) -> bool:
+        return False
@@ -0,0 +1,339 @@
+"""Sizers of headless backend"""
+
+# pylint: disable=unused-argument,redefined-builtin,too-many-instance-attributes,too-many-public-methods
+
+from typing import Any, Dict, List, NamedTuple, Optional
+
+from wxviews.headless.common import ALL, EXPAND, HORIZONTAL, Point, Size, wxAssertionError
+from wxviews.headless.windows import StaticBox, Window
+
+
+class SizerItem:
+    """Window, sizer or spacer added to sizer"""
+
+    def __init__(self, item: Any = None, proportion: int = 0, flag: int = 0, border: int = 0, userData: Any = None):
+        self._window: Optional[Window] = item if isinstance(item, Window) else None
+        self._sizer: Optional[Sizer] = item if isinstance(item, Sizer) else None
+        self._spacer: Optional[Size] = Size(*item) if isinstance(item, tuple) else None
+        self._proportion: int = proportion
+        self._flag: int = flag
+        self._border: int = border
+        self._user_data: Any = userData
+        self._shown: bool = True
+        self._position: Point = Point(0, 0)
+
+    def IsWindow(self) -> bool:
+        return self._window is not None
+
+    def IsSizer(self) -> bool:
+        return self._sizer is not None
+
+    def IsSpacer(self) -> bool:
+        return self._spacer is not None
+
+    def GetWindow(self) -> Optional[Window]:
+        return self._window
+
+    def GetSizer(self) -> Optional['Sizer']:
+        return self._sizer
+
+    def GetSpacer(self) -> Size:
+        return self._spacer if self._spacer else Size(0, 0)
+
+    def AssignSpacer(self, *args):
+        self._window, self._sizer = None, None
+        self._spacer = Size(*args[0]) if len(args) == 1 else Size(*args)
+
+    def GetSize(self) -> Size:
+        if self._window is not None:
+            return self._window.GetSize()
+        return self.GetSpacer()
+
+    def GetPosition(self) -> Point:
+        return self._position
+
+    def SetPosition(self, position: Point):
+        self._position = position
+
+    def GetProportion(self) -> int:
+        return self._proportion
+
+    def SetProportion(self, proportion: int):
+        self._proportion = proportion
+
+    def GetFlag(self) -> int:
+        return self._flag
+
+    def SetFlag(self, flag: int):
+        self._flag = flag
+
+    def GetBorder(self) -> int:
+        return self._border
+
+    def SetBorder(self, border: int):
+        self._border = border
+
+    def GetUserData(self) -> Any:
+        return self._user_data
+
+    def IsShown(self) -> bool:
+        if self._window is not None:
+            return self._window.IsShown()
+        return self._shown
+
+    def Show(self, show: bool):
+        if self._window is not None:
+            self._window.Show(show)
+        elif self._sizer is not None:
+            self._sizer.ShowItems(show)
+        self._shown = show
+
+
+class Sizer:
+    """Sizer storing items without computing positions"""
+
+    def __init__(self):
+        self._items: List[SizerItem] = []
+        self._containing_window: Optional[Window] = None
+        self.layout_count: int = 0
+
+    def Add(self, item: Any, *args, **kwargs) -> SizerItem:
+        return self.Insert(len(self._items), item, *args, **kwargs)
+
+    def Prepend(self, item: Any, *args, **kwargs) -> SizerItem:
+        return self.Insert(0, item, *args, **kwargs)
+
+    def Insert(self, index: int, item: Any, *args, **kwargs) -> SizerItem:
+        if isinstance(item, int):
+            item, args = (item, args[0]), args[1:]
+        if isinstance(item, SizerItem):
+            sizer_item = item
+        else:
+            sizer_item = SizerItem(item, *args, **_get_item_args(kwargs))
+        if sizer_item.IsWindow():
+            window = sizer_item.GetWindow()
+            if window.GetContainingSizer() is not None:
+                raise wxAssertionError('Adding a window already in a sizer, detach it first!')
+            window.SetContainingSizer(self)
+        self._items.insert(index, sizer_item)
+        return sizer_item
+
+    def AddSpacer(self, size: int) -> SizerItem:
+        return self.Add((size, size))
+
+    def AddStretchSpacer(self, prop: int = 1) -> SizerItem:
+        return self.Add((0, 0), prop)
+
+    def GetChildren(self) -> List[SizerItem]:
+        return list(self._items)
+
+    def GetItemCount(self) -> int:
+        return len(self._items)
+
+    ItemCount = property(GetItemCount)
+
+    def GetItem(self, item: Any, recursive: bool = False) -> Optional[SizerItem]:
+        index = self._find(item)
+        return None if index is None else self._items[index]
+
+    def _find(self, item: Any) -> Optional[int]:
+        if isinstance(item, int):
+            return item if 0 <= item < len(self._items) else None
+        for index, sizer_item in enumerate(self._items):
+            if item is sizer_item or item is sizer_item.GetWindow() or item is sizer_item.GetSizer():
+                return index
+        return None
+
+    def Detach(self, item: Any) -> bool:
+        index = self._find(item)
+        if index is None:
+            return False
+        sizer_item = self._items.pop(index)
+        if sizer_item.IsWindow():
+            sizer_item.GetWindow().SetContainingSizer(None)
+        return True
+
+    def Remove(self, item: Any) -> bool:
+        index = self._find(item)
+        if index is None:
+            return False
+        sizer_item = self._items[index]
+        self.Detach(index)
+        if sizer_item.IsSizer():
+            sizer_item.GetSizer().Clear(False)
+        return True
+
+    def Clear(self, delete_windows: bool = False):
+        items, self._items = self._items, []
+        for item in items:
+            if item.IsWindow():
+                item.GetWindow().SetContainingSizer(None)
+                if delete_windows:
+                    item.GetWindow().Destroy()
+            elif item.IsSizer():
+                item.GetSizer().Clear(delete_windows)
+
+    def Show(self, item: Any, show: bool = True, recursive: bool = False) -> bool:
+        sizer_item = self.GetItem(item)
+        if sizer_item is None:
+            return False
+        sizer_item.Show(show)
+        return True
+
+    def Hide(self, item: Any, recursive: bool = False) -> bool:
+        return self.Show(item, False, recursive)
+
+    def IsShown(self, item: Any) -> bool:
+        sizer_item = self.GetItem(item)
+        if sizer_item is None:
+            raise wxAssertionError('IsShown failed to find sizer item')
+        return sizer_item.IsShown()
+
+    def ShowItems(self, show: bool):
+        for item in self._items:
+            item.Show(show)
+
+    def Layout(self):
+        self.layout_count += 1
+        for item in self._items:
+            if item.IsSizer():
+                item.GetSizer().Layout()
+
+    def Fit(self, window: Window) -> Size:
+        return window.GetSize()
+
+    def FitInside(self, window: Window):
+        pass
+
+    def SetSizeHints(self, window: Window):
+        pass
+
+    def SetMinSize(self, *args):
+        pass
+
+    def GetContainingWindow(self) -> Optional[Window]:
+        return self._containing_window
+
+    def SetContainingWindow(self, window: Optional[Window]):
+        self._containing_window = window
+
+
+def _get_item_args(kwargs: dict) -> dict:
+    flags = kwargs.pop('flags', None)
+    if flags is not None:
+        kwargs.update(flags.args)
+    return kwargs
+
+
+class SizerFlags:
+    """Sizer item flags"""
+
+    def __init__(self, proportion: int = 0):
+        self.args: dict = {'proportion': proportion, 'flag': 0, 'border': 0}
+
+    def Expand(self) -> 'SizerFlags':
+        self.args['flag'] |= EXPAND
+        return self
+
+    def Border(self, direction: int = ALL, borderinpixels: int = 5) -> 'SizerFlags':
+        self.args['flag'] |= direction
+        self.args['border'] = borderinpixels
+        return self
+
+    def Proportion(self, proportion: int) -> 'SizerFlags':
+        self.args['proportion'] = proportion
+        return self
+
+
+class BoxSizer(Sizer):
+    """Box sizer stub"""
+
+    def __init__(self, orient: int = HORIZONTAL):
+        super().__init__()
+        self._orient: int = orient
+
+    def GetOrientation(self) -> int:
+        return self._orient
+
+    Orientation = property(GetOrientation)
+
+
+class StaticBoxSizer(BoxSizer):
+    """Static box sizer stub"""
+
+    def __init__(self, box: Any, *args, **kwargs):
+        if isinstance(box, StaticBox):
+            super().__init__(args[0] if args else kwargs.get('orient', HORIZONTAL))
+            self._box: StaticBox = box
+        else:
+            parent = args[0] if args else kwargs.get('parent')
+            super().__init__(box)
+            self._box = StaticBox(parent, label = kwargs.get('label', ''))
+
+    def GetStaticBox(self) -> StaticBox:
+        return self._box
+
+    StaticBox = property(GetStaticBox)
+
+
+class GridSizer(Sizer):
+    """Grid sizer stub"""
+
+    def __init__(self, rows: int = 0, cols: int = 0, vgap: int = 0, hgap: int = 0):
+        super().__init__()
+        self._rows: int = rows
+        self._cols: int = cols
+        self._vgap: int = vgap
+        self._hgap: int = hgap
+
+    def GetRows(self) -> int:
+        return self._rows
+
+    def GetCols(self) -> int:
+        return self._cols
+
+
+class FlexGridSizer(GridSizer):
+    """Flex grid sizer stub"""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._growable_rows: Dict[int, int] = {}
+        self._growable_cols: Dict[int, int] = {}
+
+    def AddGrowableRow(self, idx: int, proportion: int = 0):
+        self._growable_rows[idx] = proportion
+
+    def AddGrowableCol(self, idx: int, proportion: int = 0):
+        self._growable_cols[idx] = proportion
+
+    def IsRowGrowable(self, idx: int) -> bool:
+        return idx in self._growable_rows
+
+    def IsColGrowable(self, idx: int) -> bool:
+        return idx in self._growable_cols
+
+
+class GBPosition(NamedTuple):
+    """Grid bag position"""
+    row: int = 0
+    col: int = 0
+
+
+class GBSpan(NamedTuple):
+    """Grid bag span"""
+    rowspan: int = 1
+    colspan: int = 1
+
+
+class GridBagSizer(FlexGridSizer):
+    """Grid bag sizer stub"""
+
+    def __init__(self, vgap: int = 0, hgap: int = 0):
+        super().__init__(0, 0, vgap, hgap)
+
+    def Insert(self, index: int, item: Any, *args, **kwargs) -> SizerItem:
+        kwargs.pop('pos', None)
+        kwargs.pop('span', None)
+        args = tuple(arg for arg in args if not isinstance(arg, (GBPosition, GBSpan, tuple)))
+        return super().Insert(index, item, *args, **kwargs)
@@ -0,0 +1,367 @@
+from os import environ
+from pathlib import Path
+from subprocess import run
+from sys import executable
+from threading import Thread
+from unittest.mock import Mock
+
+from pytest import fixture, mark, raises
+
+from wxviews.headless import core
+from wxviews.headless.aui import EVT_AUINOTEBOOK_PAGE_CHANGING, AuiNotebook
+from wxviews.headless.core import (ALL, EVT_BUTTON, EVT_IDLE, EVT_NOTEBOOK_PAGE_CHANGING, EVT_SHOW, EVT_TEXT, VERTICAL,
+                                   App, BoxSizer, Button, CallAfter, CallLater, CheckBox, Frame, IsMainThread, Menu,
+                                   MenuBar, MenuItem, Notebook, Panel, StaticBoxSizer, TextCtrl, GetTopLevelParent,
+                                   WakeUpIdle, wxAssertionError)
+
+
+@fixture
+def reset_fixture():
+    core.reset()
+    yield
+    core.reset()
+
+
+class EvtHandlerTests:
+    """EvtHandler tests"""
+
+    @staticmethod
+    def test_calls_last_bound_handler_first():
+        """should call handlers in reverse order until event is not skipped"""
+        button = Button(Frame())
+        first, second = Mock(), Mock()
+        button.Bind(EVT_BUTTON, first)
+        button.Bind(EVT_BUTTON, second)
+
+        button.Click()
+
+        assert second.called
+        assert not first.called
+
+    @staticmethod
+    def test_propagates_command_events():
+        """should propagate skipped command event to parent window"""
+        frame = Frame()
+        button = Button(Panel(frame))
+        handler = Mock()
+        frame.Bind(EVT_BUTTON, handler)
+        button.Bind(EVT_BUTTON, lambda evt: evt.Skip())
+
+        button.Click()
+
+        assert handler.called
+
+    @staticmethod
+    def test_unbind():
+        """should remove bound handler"""
+        text = TextCtrl(Frame())
+        handler = Mock()
+        text.Bind(EVT_TEXT, handler)
+
+        assert text.Unbind(EVT_TEXT, handler = handler)
+        text.SetValue('value')
+
+        assert not handler.called
+
+
+class WindowTests:
+    """Window tests"""
+
+    @staticmethod
+    def test_show_sends_event():
+        """Show() should send EVT_SHOW if state is changed"""
+        panel = Panel(Frame())
+        handler = Mock()
+        panel.Bind(EVT_SHOW, handler)
+
+        panel.Show(False)
+        panel.Show(False)
+
+        assert handler.call_count == 1
+        assert not handler.call_args[0][0].IsShown()
+
+    @staticmethod
+    def test_is_shown_on_screen():
+        """IsShownOnScreen() should check parents up to top level window"""
+        frame = Frame()
+        panel = Panel(frame)
+
+        assert not panel.IsShownOnScreen()
+        frame.Show()
+        assert panel.IsShownOnScreen()
+
+    @staticmethod
+    def test_get_top_level_parent():
+        """GetTopLevelParent() should return top level ancestor"""
+        frame = Frame()
+
+        assert GetTopLevelParent(Button(Panel(frame))) is frame
+
+    @staticmethod
+    def test_destroy():
+        """Destroy() should destroy children and detach from sizer"""
+        panel = Panel(Frame())
+        sizer = BoxSizer(VERTICAL)
+        panel.SetSizer(sizer)
+        button = Button(panel)
+        sizer.Add(button)
+
+        button.Destroy()
+
+        assert sizer.GetItemCount() == 0
+        assert not panel.GetChildren()
+        assert not button
+        with raises(RuntimeError):
+            button.IsBeingDeleted()
+
+    @staticmethod
+    def test_layout():
+        """Layout() should layout sizer"""
+        panel = Panel(Frame())
+        sizer = BoxSizer(VERTICAL)
+        panel.SetSizer(sizer)
+
+        panel.Layout()
+
+        assert (panel.layout_count, sizer.layout_count) == (1, 1)
+        assert sizer.GetContainingWindow() is panel
+
+    @staticmethod
+    def test_thaw_without_freeze():
+        """Thaw() should raise assertion error without Freeze()"""
+        with raises(wxAssertionError):
+            Panel().Thaw()
+
+
+class SizerTests:
+    """Sizer tests"""
+
+    @staticmethod
+    def test_add():
+        """Add() should store window, sizer and spacer items"""
+        sizer = BoxSizer(VERTICAL)
+        button, child = Button(Frame()), BoxSizer()
+
+        sizer.Add(button, proportion = 1, flag = ALL, border = 5)
+        sizer.Add(child)
+        sizer.Add(10, 20)
+
+        items = sizer.GetChildren()
+        assert (items[0].GetWindow(), items[0].GetProportion(), items[0].GetBorder()) == (button, 1, 5)
+        assert items[1].GetSizer() is child
+        assert items[2].IsSpacer() and items[2].GetSize() == (10, 20)
+        assert button.GetContainingSizer() is sizer
+
+    @staticmethod
+    def test_add_window_twice():
+        """Add() should raise assertion error for window added to other sizer"""
+        button = Button(Frame())
+        BoxSizer().Add(button)
+
+        with raises(wxAssertionError):
+            BoxSizer().Add(button)
+
+    @staticmethod
+    def test_show():
+        """Show() should show and hide window item"""
+        sizer = BoxSizer()
+        button = Button(Frame())
+        sizer.Add(button)
+
+        sizer.Show(button, False)
+
+        assert not sizer.IsShown(button)
+        assert not button.IsShown()
+
+    @staticmethod
+    def test_insert_and_detach():
+        """Insert() should add item at index and Detach() should remove it"""
+        sizer = BoxSizer()
+        first, second = Button(Frame()), Button(Frame())
+        sizer.Add(first)
+        sizer.Insert(0, second)
+
+        assert [item.GetWindow() for item in sizer.GetChildren()] == [second, first]
+        assert sizer.Detach(second)
+        assert not sizer.Detach(second)
+        assert second.GetContainingSizer() is None
+
+    @staticmethod
+    def test_static_box_sizer():
+        """StaticBoxSizer should create static box for orientation and parent"""
+        parent = Panel()
+        sizer = StaticBoxSizer(VERTICAL, parent, label = 'label')
+
+        assert sizer.GetOrientation() == VERTICAL
+        assert sizer.GetStaticBox().GetParent() is parent
+        assert sizer.GetStaticBox().GetLabel() == 'label'
+
+
+class MenuTests:
+    """Menu tests"""
+
+    @staticmethod
+    def test_menu_bar():
+        """should append menus to menu bar and menu items to menu"""
+        frame, menu_bar, menu = Frame(), MenuBar(), Menu()
+        item = MenuItem(id = 1, text = '&Exit')
+
+        menu.Append(item)
+        menu_bar.Append(menu, 'File')
+        frame.SetMenuBar(menu_bar)
+
+        assert menu.GetMenuItems() == [item]
+        assert item.GetMenu() is menu
+        assert menu_bar.GetMenu(0) is menu
+        assert frame.GetMenuBar() is menu_bar
+
+
+class NotebookTests:
+    """Notebook tests"""
+
+    @staticmethod
+    @mark.parametrize('notebook_type, event', [
+        (Notebook, EVT_NOTEBOOK_PAGE_CHANGING),
+        (AuiNotebook, EVT_AUINOTEBOOK_PAGE_CHANGING)
+    ]) # yapf: disable
+    def test_set_selection(notebook_type, event):
+        """SetSelection() should send changing event that can be vetoed"""
+        notebook = notebook_type(Frame())
+        for _ in range(3):
+            notebook.AddPage(Panel(notebook), 'page')
+        notebook.Bind(event, lambda evt: evt.Veto() if evt.GetSelection() == 2 else evt.Skip())
+
+        notebook.SetSelection(1)
+        notebook.SetSelection(2)
+
+        assert notebook.GetSelection() == 1
+
+    @staticmethod
+    def test_remove_page():
+        """RemovePage() should shift selection"""
+        notebook = Notebook(Frame())
+        for _ in range(3):
+            notebook.AddPage(Panel(notebook), 'page')
+        notebook.ChangeSelection(2)
+
+        notebook.RemovePage(0)
+
+        assert (notebook.GetPageCount(), notebook.GetSelection()) == (2, 1)
+
+
+@mark.usefixtures('reset_fixture')
+class MainLoopTests:
+    """App.MainLoop() tests"""
+
+    @staticmethod
+    def test_runs_pending_calls():
+        """should run CallAfter calls and return when there is nothing to do"""
+        calls = []
+        CallAfter(calls.append, 1)
+        CallAfter(lambda: CallAfter(calls.append, 2))
+
+        App().MainLoop()
+
+        assert calls == [1, 2]
+
+    @staticmethod
+    def test_sends_idle_events():
+        """should send idle events while more is requested"""
+        frame = Frame()
+        counter = []
+
+        def _on_idle(event):
+            counter.append(1)
+            event.RequestMore(len(counter) < 3)
+
+        frame.Bind(EVT_IDLE, _on_idle)
+        App().MainLoop()
+
+        assert len(counter) == 3
+
+    @staticmethod
+    def test_wake_up_idle():
+        """should send idle event again if WakeUpIdle is called"""
+        frame = Frame()
+        counter = []
+
+        def _on_idle(_):
+            counter.append(1)
+            if len(counter) < 3:
+                WakeUpIdle()
+
+        frame.Bind(EVT_IDLE, _on_idle)
+        App().MainLoop()
+
+        assert len(counter) == 3
+
+    @staticmethod
+    def test_runs_due_timers():
+        """should fire due timers"""
+        callback = Mock()
+        CallLater(0, callback, 'value')
+        later = CallLater(60000, Mock())
+
+        App().MainLoop()
+
+        assert callback.call_args == (('value', ), )
+        assert later.IsRunning()
+
+    @staticmethod
+    def test_is_main_thread():
+        """IsMainThread() should return False in worker thread"""
+        results = []
+        thread = Thread(target = lambda: results.append(IsMainThread()))
+        thread.start()
+        thread.join()
+
+        assert IsMainThread()
+        assert results == [False]
+
+    @staticmethod
+    def test_check_box_event():
+        """Toggle() should send checkbox event"""
+        check_box = CheckBox(Frame())
+        handler = Mock()
+        check_box.Bind(core.EVT_CHECKBOX, handler)
+
+        check_box.Toggle()
+
+        assert check_box.GetValue()
+        assert handler.call_args[0][0].IsChecked()
+
+
+def test_renders_views_with_headless_backend(tmp_path):
+    """should render view using wxviews pipelines when backend is selected by environment variable"""
+    (tmp_path / 'root.xml').write_text('''<App xmlns='wx' xmlns:sizer='wxviews.set_sizer' xmlns:init='init'
+     xmlns:wx='pyviews.setters.import_global' wx:wx='wx'>
+    <Frame init:title='title'>
+        <BoxSizer init:orient='{wx.VERTICAL}'>
+            <TextCtrl init:value='text' sizer:flag='{wx.EXPAND}' />
+            <Button Label='button' />
+        </BoxSizer>
+    </Frame>
+</App>''')
+    script = f'''
+import wxviews
+import wx
+from injectool import Container, set_default_container, add_singleton
+from pyviews.core.rendering import NodeGlobals
+from wxviews.app import launch, register_dependencies
+from wxviews.core.rendering import WxRenderingContext
+set_default_container(Container())
+register_dependencies()
+add_singleton('views_folder', {str(tmp_path)!r})
+launch(WxRenderingContext({{'node_globals': NodeGlobals()}}))
+frame = wx.GetTopLevelWindows()[0]
+sizer = frame.GetChildren()[0].GetContainingSizer()
+print(frame.IsShown(), [type(item.GetWindow()).__name__ for item in sizer.GetChildren()])
+'''
+    result = run([executable, '-c', script],
+                 env = {**environ, 'WXVIEWS_BACKEND': 'headless'},
+                 cwd = str(Path(__file__).parents[3]),
+                 capture_output = True,
+                 text = True,
+                 check = False)
+
+    assert result.stdout.strip() == "True ['TextCtrl', 'Button']", result.stderr
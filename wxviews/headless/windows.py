@@ -0,0 +1,582 @@
+"""Windows of headless backend"""
+
+# pylint: disable=unused-argument,redefined-builtin,keyword-arg-before-vararg,too-many-instance-attributes
+# pylint: disable=too-many-public-methods,too-many-arguments,too-many-positional-arguments
+
+from typing import TYPE_CHECKING, Any, List, Optional, Tuple
+
+from wxviews.headless.common import (ID_ANY, ID_OK, VERTICAL, DefaultPosition, DefaultSize, Point, Size,
+                                     wxAssertionError)
+from wxviews.headless.events import (EVT_BUTTON, EVT_CHECKBOX, EVT_NOTEBOOK_PAGE_CHANGED, EVT_NOTEBOOK_PAGE_CHANGING,
+                                     EVT_SCROLLWIN, EVT_TEXT, BookCtrlEvent, CommandEvent, EvtHandler, NewIdRef,
+                                     PyEventBinder, ScrollWinEvent, ShowEvent, SizeEvent)
+
+if TYPE_CHECKING:
+    from wxviews.headless.menus import MenuBar
+    from wxviews.headless.sizers import Sizer
+
+_TOP_LEVEL_WINDOWS: List['TopLevelWindow'] = []
+
+
+class Window(EvtHandler):
+    """Window without native control"""
+
+    def __init__(self, parent: Optional['Window'] = None, id: int = ID_ANY, pos: Point = DefaultPosition,
+                 size: Tuple[int, int] = DefaultSize, style: int = 0, name: str = '', **kwargs):
+        super().__init__()
+        self._parent: Optional[Window] = parent
+        self._id: int = NewIdRef() if id == ID_ANY else id
+        self._position: Point = Point(*pos)
+        self._size: Size = Size(*size)
+        self._style: int = style
+        self._name: str = name
+        self._label: str = kwargs.get('label', '')
+        self._children: List[Window] = []
+        self._shown: bool = True
+        self._frozen: int = 0
+        self._deleted: bool = False
+        self._sizer: Optional[Sizer] = None
+        self._containing_sizer: Optional[Sizer] = None
+        self._enabled: bool = True
+        self.layout_count: int = 0
+        if parent is not None:
+            parent.AddChild(self)
+
+    def GetId(self) -> int:
+        return self._id
+
+    def SetId(self, value: int):
+        self._id = value
+
+    Id = property(GetId, SetId)
+
+    def GetName(self) -> str:
+        return self._name
+
+    def SetName(self, value: str):
+        self._name = value
+
+    Name = property(GetName, SetName)
+
+    def GetLabel(self) -> str:
+        return self._label
+
+    def SetLabel(self, value: str):
+        self._label = value
+
+    Label = property(GetLabel, SetLabel)
+
+    def GetWindowStyle(self) -> int:
+        return self._style
+
+    def SetWindowStyle(self, value: int):
+        self._style = value
+
+    GetWindowStyleFlag = GetWindowStyle
+    SetWindowStyleFlag = SetWindowStyle
+
+    def GetParent(self) -> Optional['Window']:
+        return self._parent
+
+    Parent = property(GetParent)
+
+    def GetChildren(self) -> List['Window']:
+        return list(self._children)
+
+    Children = property(GetChildren)
+
+    def AddChild(self, child: 'Window'):
+        self._children.append(child)
+
+    def RemoveChild(self, child: 'Window'):
+        if child in self._children:
+            self._children.remove(child)
+
+    def Reparent(self, newParent: 'Window') -> bool:
+        if self._parent is not None:
+            self._parent.RemoveChild(self)
+        self._parent = newParent
+        if newParent is not None:
+            newParent.AddChild(self)
+        return True
+
+    def IsTopLevel(self) -> bool:
+        return False
+
+    def get_event_parent(self) -> Optional[EvtHandler]:
+        return None if self.IsTopLevel() else self._parent
+
+    def GetTopLevelParent(self) -> Optional['Window']:
+        return GetTopLevelParent(self)
+
+    def Show(self, show: bool = True) -> bool:
+        if self._shown == show:
+            return False
+        self._shown = show
+        self.ProcessEvent(ShowEvent(self._id, show))
+        return True
+
+    def Hide(self) -> bool:
+        return self.Show(False)
+
+    def IsShown(self) -> bool:
+        return self._shown
+
+    Shown = property(IsShown, Show)
+
+    def IsShownOnScreen(self) -> bool:
+        window: Optional[Window] = self
+        while window is not None:
+            if not window.IsShown():
+                return False
+            if window.IsTopLevel():
+                return True
+            window = window.GetParent()
+        return False
+
+    def Enable(self, enable: bool = True) -> bool:
+        changed = self._enabled != enable
+        self._enabled = enable
+        return changed
+
+    def Disable(self) -> bool:
+        return self.Enable(False)
+
+    def IsEnabled(self) -> bool:
+        return self._enabled
+
+    Enabled = property(IsEnabled, Enable)
+
+    def Freeze(self):
+        self._frozen += 1
+
+    def Thaw(self):
+        if self._frozen <= 0:
+            raise wxAssertionError('Thaw() without matching Freeze()')
+        self._frozen -= 1
+
+    def IsFrozen(self) -> bool:
+        return self._frozen > 0
+
+    def Refresh(self, eraseBackground: bool = True, rect: Any = None):
+        pass
+
+    def Update(self):
+        pass
+
+    def Raise(self):
+        pass
+
+    def SetFocus(self):
+        pass
+
+    def Layout(self) -> bool:
+        self.layout_count += 1
+        if self._sizer is not None:
+            self._sizer.Layout()
+        return True
+
+    def Fit(self):
+        pass
+
+    def FitInside(self):
+        pass
+
+    def GetSize(self) -> Size:
+        return self._size
+
+    def SetSize(self, *args):
+        size = Size(*args[0]) if len(args) == 1 else Size(*args[2:4]) if len(args) >= 4 else Size(*args)
+        if size != self._size:
+            self._size = size
+            self.ProcessEvent(SizeEvent(size, self._id))
+
+    def GetClientSize(self) -> Size:
+        return self._size
+
+    def GetPosition(self) -> Point:
+        return self._position
+
+    def SetPosition(self, pt: Point):
+        self._position = Point(*pt)
+
+    def SetMinSize(self, size: Tuple[int, int]):
+        pass
+
+    def SetMaxSize(self, size: Tuple[int, int]):
+        pass
+
+    def SetBackgroundColour(self, colour: Any) -> bool:
+        return True
+
+    def SetForegroundColour(self, colour: Any) -> bool:
+        return True
+
+    def SetFont(self, font: Any) -> bool:
+        return True
+
+    def SetToolTip(self, tip: Any):
+        pass
+
+    def SetSizer(self, sizer: Optional['Sizer'], deleteOld: bool = True):
+        if self._sizer is not None and self._sizer is not sizer:
+            self._sizer.SetContainingWindow(None)
+            if deleteOld:
+                self._sizer.Clear(True)
+        self._sizer = sizer
+        if sizer is not None:
+            sizer.SetContainingWindow(self)
+
+    def SetSizerAndFit(self, sizer: 'Sizer', deleteOld: bool = True):
+        self.SetSizer(sizer, deleteOld)
+
+    def GetSizer(self) -> Optional['Sizer']:
+        return self._sizer
+
+    def GetContainingSizer(self) -> Optional['Sizer']:
+        return self._containing_sizer
+
+    def SetContainingSizer(self, sizer: Optional['Sizer']):
+        self._containing_sizer = sizer
+
+    def IsBeingDeleted(self) -> bool:
+        if self._deleted:
+            raise RuntimeError(f'wrapped C/C++ object of type {type(self).__name__} has been deleted')
+        return False
+
+    def Destroy(self) -> bool:
+        if self._deleted:
+            raise RuntimeError(f'wrapped C/C++ object of type {type(self).__name__} has been deleted')
+        self.DestroyChildren()
+        if self._containing_sizer is not None:
+            self._containing_sizer.Detach(self)
+        if self._sizer is not None:
+            self._sizer.SetContainingWindow(None)
+            self._sizer = None
+        if self._parent is not None:
+            self._parent.RemoveChild(self)
+        self._handlers.clear()
+        self._deleted = True
+        return True
+
+    def DestroyChildren(self) -> bool:
+        for child in list(self._children):
+            child.Destroy()
+        return True
+
+    def SetClientSize(self, *args):
+        self.SetSize(*args)
+
+    def __bool__(self) -> bool:
+        return not self._deleted
+
+    Size = property(GetSize, SetSize)
+    ClientSize = property(GetClientSize, SetClientSize)
+    Position = property(GetPosition, SetPosition)
+    Sizer = property(GetSizer, SetSizer)
+    ContainingSizer = property(GetContainingSizer, SetContainingSizer)
+
+
+class Control(Window):
+    """Control stub"""
+
+
+class StaticText(Control):
+    """Label stub"""
+
+    def __init__(self, parent: Optional[Window] = None, id: int = ID_ANY, label: str = '', *args, **kwargs):
+        super().__init__(parent, id, *args, label = label, **kwargs)
+
+
+class Button(Control):
+    """Button stub"""
+
+    def __init__(self, parent: Optional[Window] = None, id: int = ID_ANY, label: str = '', *args, **kwargs):
+        super().__init__(parent, id, *args, label = label, **kwargs)
+
+    def Click(self):
+        """Sends button event"""
+        event = CommandEvent(EVT_BUTTON.typeId, self.GetId())
+        event.SetEventObject(self)
+        self.ProcessEvent(event)
+
+
+class TextEntry:
+    """Text value with EVT_TEXT notifications"""
+
+    # pylint: disable=no-member
+
+    _value: str = ''
+
+    def GetValue(self) -> str:
+        return self._value
+
+    def SetValue(self, value: str):
+        self._value = value
+        self._send_text_event(value)
+
+    def ChangeValue(self, value: str):
+        self._value = value
+
+    def AppendText(self, text: str):
+        self.SetValue(self._value + text)
+
+    def Clear(self):
+        self.SetValue('')
+
+    def _send_text_event(self, value: str):
+        event = CommandEvent(EVT_TEXT.typeId, self.GetId())
+        event.SetString(value)
+        event.SetEventObject(self)
+        self.ProcessEvent(event)
+
+    Value = property(GetValue, SetValue)
+
+
+class TextCtrl(TextEntry, Control):
+    """Text control stub"""
+
+    def __init__(self, parent: Optional[Window] = None, id: int = ID_ANY, value: str = '', *args, **kwargs):
+        Control.__init__(self, parent, id, *args, **kwargs)
+        self._value = value
+
+    def SetReadOnly(self, readonly: bool = True):
+        pass
+
+
+class ComboBox(TextCtrl):
+    """Combo box stub"""
+
+
+class CheckBox(Control):
+    """Check box stub"""
+
+    def __init__(self, parent: Optional[Window] = None, id: int = ID_ANY, label: str = '', *args, **kwargs):
+        super().__init__(parent, id, *args, label = label, **kwargs)
+        self._checked: bool = False
+
+    def GetValue(self) -> bool:
+        return self._checked
+
+    def SetValue(self, state: bool):
+        self._checked = bool(state)
+
+    IsChecked = GetValue
+    Value = property(GetValue, SetValue)
+
+    def Toggle(self):
+        """Changes state and sends checkbox event"""
+        self._checked = not self._checked
+        event = CommandEvent(EVT_CHECKBOX.typeId, self.GetId())
+        event.SetInt(int(self._checked))
+        event.SetEventObject(self)
+        self.ProcessEvent(event)
+
+
+class StaticBox(Control):
+    """Static box stub"""
+
+    def __init__(self, parent: Optional[Window] = None, id: int = ID_ANY, label: str = '', *args, **kwargs):
+        super().__init__(parent, id, *args, label = label, **kwargs)
+
+
+class Panel(Window):
+    """Panel stub"""
+
+
+class ScrolledWindow(Panel):
+    """Scrolled window stub"""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._view_start: Point = Point(0, 0)
+        self._pixels_per_unit: Tuple[int, int] = (0, 0)
+
+    def SetScrollRate(self, xstep: int, ystep: int):
+        self._pixels_per_unit = (xstep, ystep)
+
+    def GetScrollPixelsPerUnit(self) -> Tuple[int, int]:
+        return self._pixels_per_unit
+
+    def GetViewStart(self) -> Point:
+        return self._view_start
+
+    def Scroll(self, x: int = -1, y: int = -1):
+        self._view_start = Point(self._view_start.x if x < 0 else x, self._view_start.y if y < 0 else y)
+        self.ProcessEvent(ScrollWinEvent(EVT_SCROLLWIN.typeId, self._view_start.y, VERTICAL))
+
+
+ScrolledPanel = ScrolledWindow
+
+
+class TopLevelWindow(Window):
+    """Top level window stub"""
+
+    def __init__(self, parent: Optional[Window] = None, id: int = ID_ANY, title: str = '', *args, **kwargs):
+        super().__init__(parent, id, *args, **kwargs)
+        self._title: str = title
+        self._shown = False
+        self._iconized: bool = False
+        _TOP_LEVEL_WINDOWS.append(self)
+
+    def IsTopLevel(self) -> bool:
+        return True
+
+    def GetTitle(self) -> str:
+        return self._title
+
+    def SetTitle(self, value: str):
+        self._title = value
+
+    Title = property(GetTitle, SetTitle)
+
+    def Iconize(self, iconize: bool = True):
+        self._iconized = iconize
+
+    def IsIconized(self) -> bool:
+        return self._iconized
+
+    def Close(self, force: bool = False) -> bool:
+        return self.Destroy()
+
+    def Destroy(self) -> bool:
+        if self in _TOP_LEVEL_WINDOWS:
+            _TOP_LEVEL_WINDOWS.remove(self)
+        return super().Destroy()
+
+
+class Frame(TopLevelWindow):
+    """Frame stub"""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._menu_bar: Optional[MenuBar] = None
+
+    def SetMenuBar(self, menuBar: 'MenuBar'):
+        self._menu_bar = menuBar
+        menuBar.Attach(self)
+
+    def GetMenuBar(self) -> Optional['MenuBar']:
+        return self._menu_bar
+
+    MenuBar = property(GetMenuBar, SetMenuBar)
+
+    def CreateStatusBar(self, *args, **kwargs):
+        pass
+
+    def Centre(self, *args, **kwargs):
+        pass
+
+    Center = Centre
+
+
+class Dialog(TopLevelWindow):
+    """Dialog stub"""
+
+    def ShowModal(self) -> int:
+        return ID_OK
+
+    def EndModal(self, retCode: int):
+        pass
+
+
+class MessageDialog(Dialog):
+    """Message dialog stub"""
+
+
+class BookCtrlBase(Control):
+    """Notebook stub"""
+
+    changing_event: PyEventBinder = EVT_NOTEBOOK_PAGE_CHANGING
+    changed_event: PyEventBinder = EVT_NOTEBOOK_PAGE_CHANGED
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._pages: List[Tuple[Window, str]] = []
+        self._selection: int = -1
+
+    def AddPage(self, page: Window, text: str, select: bool = False, imageId: int = -1) -> bool:
+        return self.InsertPage(len(self._pages), page, text, select, imageId)
+
+    def InsertPage(self, index: int, page: Window, text: str, select: bool = False, imageId: int = -1) -> bool:
+        self._pages.insert(index, (page, text))
+        if self._selection >= index:
+            self._selection += 1
+        if select or self._selection < 0:
+            self.ChangeSelection(index)
+        return True
+
+    def RemovePage(self, page: int) -> bool:
+        if not 0 <= page < len(self._pages):
+            return False
+        self._pages.pop(page)
+        if self._selection >= len(self._pages) or self._selection > page:
+            self._selection -= 1
+        return True
+
+    def DeletePage(self, page: int) -> bool:
+        window = self.GetPage(page)
+        if not self.RemovePage(page):
+            return False
+        window.Destroy()
+        return True
+
+    def DeleteAllPages(self) -> bool:
+        while self._pages:
+            self.DeletePage(0)
+        return True
+
+    def GetPage(self, page: int) -> Window:
+        return self._pages[page][0]
+
+    def GetPageCount(self) -> int:
+        return len(self._pages)
+
+    def GetPageText(self, nPage: int) -> str:
+        return self._pages[nPage][1]
+
+    def SetPageText(self, page: int, text: str) -> bool:
+        self._pages[page] = (self._pages[page][0], text)
+        return True
+
+    def GetSelection(self) -> int:
+        return self._selection
+
+    def ChangeSelection(self, page: int) -> int:
+        old, self._selection = self._selection, page
+        return old
+
+    def SetSelection(self, page: int) -> int:
+        old = self._selection
+        if page == old:
+            return old
+        changing = BookCtrlEvent(self.changing_event.typeId, self.GetId(), page, old)
+        changing.SetEventObject(self)
+        self.ProcessEvent(changing)
+        if not changing.IsAllowed():
+            return old
+        self._selection = page
+        changed = BookCtrlEvent(self.changed_event.typeId, self.GetId(), page, old)
+        changed.SetEventObject(self)
+        self.ProcessEvent(changed)
+        return old
+
+    Selection = property(GetSelection, SetSelection)
+
+
+class Notebook(BookCtrlBase):
+    """Notebook stub"""
+
+
+
+
+def GetTopLevelParent(window: Optional[Window]) -> Optional[Window]:
+    """Returns first top level ancestor of window"""
+    while window is not None and not window.IsTopLevel():
+        window = window.GetParent()
+    return window
+
+
+def GetTopLevelWindows() -> List[Window]:
+    """Returns not destroyed top level windows"""
+    return list(_TOP_LEVEL_WINDOWS)
@@ -1,19 +1,21 @@
 """Rendering pipeline for menus"""
 
-from pyviews.core.rendering import InstanceNode, NodeGlobals
+from pyviews.core.rendering import InstanceNode
 from pyviews.core.xml import XmlNode
 from pyviews.pipes import render_children
-from pyviews.rendering.pipeline import RenderingPipeline, get_type
+from pyviews.rendering.pipeline import RenderingPipeline
 from wx import Frame, Menu, MenuBar
 
+from wxviews.core.globals import ChildGlobals
 from wxviews.core.pipes import apply_attributes
-from wxviews.core.rendering import WxRenderingContext, get_attr_args, get_init_value
+from wxviews.core.plan import get_node_plan, get_node_type
+from wxviews.core.rendering import WxRenderingContext, get_attr_args
 from wxviews.widgets.rendering import WxNode
 
 
 def create_menu_node(context: WxRenderingContext) -> WxNode:
     """Creates node from xml node using namespace as module and tag name as class name"""
-    inst_type = get_type(context.xml_node)
+    inst_type = get_node_type(context.xml_node)
     args = get_attr_args(context.xml_node, 'init', context.node_globals)
     inst = inst_type(**args)
     return WxNode(inst, context.xml_node, node_globals = context.node_globals)
@@ -33,13 +35,12 @@ def render_menu_children(node: WxNode, context: WxRenderingContext):
     render_children(node, context, _get_menu_child_context)
 
 
-def _get_menu_child_context(child_xml_node: XmlNode, node: InstanceNode, _: WxRenderingContext) -> WxRenderingContext:
-    return WxRenderingContext({
-        'parent_node': node,
-        'parent': node.instance,
-        'node_globals': NodeGlobals(node.node_globals),
-        'xml_node': child_xml_node
-    })
+def _get_menu_child_context(child_xml_node: XmlNode, node: InstanceNode,
+                            context: WxRenderingContext) -> WxRenderingContext:
+    return context.derive(parent_node = node,
+                          parent = node.instance,
+                          node_globals = ChildGlobals(node.node_globals),
+                          xml_node = child_xml_node)
 
 
 def set_to_frame(node: InstanceNode, context: WxRenderingContext):
@@ -65,11 +66,9 @@ def set_to_menu_bar(node: WxNode, context: WxRenderingContext):
         msg = f'parent for Menu should be MenuBar, but it is {context.parent}'
         raise TypeError(msg)
     # context.parent.Append(node.instance, node.properties['title'].get())
-    try:
-        title_attr = next(attr for attr in node.xml_node.attrs if attr.name == 'title')
-        title = get_init_value(title_attr, context.node_globals)
-    except StopIteration:
-        title = str(node.instance)
+    plan = get_node_plan(node.xml_node)
+    title_attr = plan.get_attr('title')
+    title = str(node.instance) if title_attr is None else plan.get_value(title_attr, context.node_globals)
     context.parent.Append(node.instance, title)
 
 
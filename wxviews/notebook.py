@@ -0,0 +1,249 @@
+"""Notebook pages rendered on demand"""
+
+from functools import partial
+from typing import Any, Callable, Dict, Optional
+
+from pyviews.core.rendering import NodeGlobals
+from pyviews.core.xml import XmlNode
+from pyviews.pipes import render_children
+from pyviews.rendering.pipeline import RenderingPipeline
+from wx import EVT_NOTEBOOK_PAGE_CHANGING, VERTICAL, BookCtrlEvent, BoxSizer, CallLater, Notebook, Panel
+from wx.aui import EVT_AUINOTEBOOK_PAGE_CHANGING, AuiNotebook
+
+from wxviews.core.globals import ChildGlobals
+from wxviews.core.layout import layout, render_transaction
+from wxviews.core.pipes import add_to_sizer, apply_attributes
+from wxviews.core.rendering import WxRenderingContext, get_attr_args
+from wxviews.widgets.rendering import WxNode, create_widget_node, render_wx_children
+
+
+class Page(WxNode):
+    """Notebook page. Content is rendered when page is selected"""
+
+    def __init__(self, instance: Panel, xml_node: XmlNode, node_globals: Optional[NodeGlobals] = None,
+                 sizer: Optional[BoxSizer] = None):
+        super().__init__(instance, xml_node, node_globals = node_globals)
+        self._sizer: Optional[BoxSizer] = sizer
+        self._title: str = ''
+        self._notebook: Optional[Any] = None
+        self._rendered: bool = False
+        self._unload_after: Optional[float] = None
+        self._unload_timer: Optional[CallLater] = None
+        self.render_content: Callable[[], None] = lambda: None
+
+    @property
+    def sizer(self) -> Optional[BoxSizer]:
+        """Sizer of page panel"""
+        return self._sizer
+
+    @property
+    def title(self) -> str:
+        """Page title"""
+        return self._title
+
+    @title.setter
+    def title(self, value: str):
+        self._title = '' if value is None else str(value)
+        index = self.index
+        if index is not None:
+            self._notebook.SetPageText(index, self._title)
+
+    @property
+    def notebook(self) -> Optional[Any]:
+        """Notebook containing page"""
+        return self._notebook
+
+    @notebook.setter
+    def notebook(self, value: Optional[Any]):
+        self._notebook = value
+
+    @property
+    def index(self) -> Optional[int]:
+        """Page index in notebook"""
+        if self._notebook is None:
+            return None
+        return next((i for i in range(self._notebook.GetPageCount()) if self._notebook.GetPage(i) is self.instance),
+                    None)
+
+    @property
+    def rendered(self) -> bool:
+        """Is page content rendered"""
+        return self._rendered
+
+    @rendered.setter
+    def rendered(self, value: bool):
+        self._rendered = value
+
+    @property
+    def unload_after(self) -> Optional[float]:
+        """Minutes after page content is destroyed if page is not selected"""
+        return self._unload_after
+
+    @unload_after.setter
+    def unload_after(self, value: Optional[float]):
+        self._unload_after = None if value is None else float(value)
+
+    @property
+    def unload_timer(self) -> Optional[CallLater]:
+        """Timer unloading page content"""
+        return self._unload_timer
+
+    @unload_timer.setter
+    def unload_timer(self, value: Optional[CallLater]):
+        self._unload_timer = value
+
+    def stop_unload(self):
+        """Stops unload timer"""
+        if self._unload_timer is not None:
+            self._unload_timer.Stop()
+            self._unload_timer = None
+
+    def destroy(self):
+        self.stop_unload()
+        index = self.index
+        if index is not None:
+            self._notebook.RemovePage(index)
+        self._notebook = None
+        super().destroy()
+
+
+def get_notebook_pipeline() -> RenderingPipeline:
+    """Returns rendering pipeline for Notebook"""
+    return RenderingPipeline(
+        pipes = [apply_attributes, add_to_sizer, render_wx_children, render_selected_page],
+        create_node = create_widget_node,
+        name = 'notebook pipeline'
+    )
+
+
+def render_selected_page(node: WxNode, _: WxRenderingContext):
+    """Renders content of selected page"""
+    selection = _SELECTIONS.get(id(node.instance))
+    if selection is not None:
+        page = selection.get_page(node.instance.GetSelection())
+        if page is not None:
+            page.render_content()
+
+
+def get_page_pipeline() -> RenderingPipeline:
+    """Returns rendering pipeline for notebook Page"""
+    return RenderingPipeline(
+        pipes = [apply_attributes, add_to_notebook, render_page_on_selection],
+        create_node = create_page_node,
+        name = 'page pipeline'
+    )
+
+
+def create_page_node(context: WxRenderingContext) -> Page:
+    """Creates panel with sizer for page"""
+    panel = Panel(context.parent, **get_attr_args(context.xml_node, 'init', context.node_globals))
+    sizer = BoxSizer(VERTICAL)
+    panel.SetSizer(sizer)
+    return Page(panel, context.xml_node, node_globals = context.node_globals, sizer = sizer)
+
+
+def add_to_notebook(node: Page, context: WxRenderingContext):
+    """Adds page to parent notebook. Page selection is tracked only for Notebook and AuiNotebook"""
+    if not isinstance(context.parent, (Notebook, AuiNotebook)):
+        msg = f'parent for Page should be Notebook, but it is {context.parent}'
+        raise TypeError(msg)
+    context.parent.AddPage(node.instance, node.title)
+    node.notebook = context.parent
+
+
+class PageSelection:
+    """
+    Renders and unloads pages of notebook on selection change.
+    One page changing handler is bound per notebook, pages are found by selected page instance.
+    """
+
+    def __init__(self, notebook: Any):
+        self._notebook = notebook
+        self._pages: Dict[int, Page] = {}
+        self._event = EVT_AUINOTEBOOK_PAGE_CHANGING if isinstance(notebook, AuiNotebook) \
+            else EVT_NOTEBOOK_PAGE_CHANGING
+        notebook.Bind(self._event, self._on_page_changing)
+
+    def add(self, page: Page):
+        """Adds page to track selection of"""
+        self._pages[id(page.instance)] = page
+
+    def remove(self, page: Page):
+        """Removes page, unbinds handler after last page is removed"""
+        self._pages.pop(id(page.instance), None)
+        if not self._pages:
+            self._notebook.Unbind(self._event, handler = self._on_page_changing)
+            _SELECTIONS.pop(id(self._notebook), None)
+
+    def get_page(self, index: int) -> Optional[Page]:
+        """Returns page node by index in notebook"""
+        if index < 0 or index >= self._notebook.GetPageCount():
+            return None
+        return self._pages.get(id(self._notebook.GetPage(index)))
+
+    def _on_page_changing(self, event: BookCtrlEvent):
+        event.Skip()
+        selected = self.get_page(event.GetSelection())
+        if selected is not None:
+            selected.stop_unload()
+            selected.render_content()
+        old = self.get_page(event.GetOldSelection())
+        if old is not None and old is not selected and old.unload_after is not None and old.rendered:
+            old.stop_unload()
+            old.unload_timer = CallLater(int(old.unload_after * 60000), unload_page, old)
+
+
+_SELECTIONS: Dict[int, PageSelection] = {}
+
+
+def get_page_selection(notebook: Any) -> PageSelection:
+    """Returns page selection handler of notebook"""
+    selection = _SELECTIONS.get(id(notebook))
+    if selection is None:
+        selection = _SELECTIONS[id(notebook)] = PageSelection(notebook)
+    return selection
+
+
+def render_page_on_selection(node: Page, context: WxRenderingContext):
+    """Renders page content if page is selected or when it is selected"""
+    node.render_content = partial(_render_page_content, node, context)
+    selection = get_page_selection(node.notebook)
+    selection.add(node)
+    if selection.get_page(node.notebook.GetSelection()) is node:
+        node.render_content()
+
+    on_destroy = node.on_destroy
+
+    def _remove(destroyed: Page):
+        selection.remove(destroyed)
+        on_destroy(destroyed)
+
+    node.on_destroy = _remove
+
+
+def _render_page_content(node: Page, context: WxRenderingContext):
+    if node.rendered:
+        return
+    node.rendered = True
+    with render_transaction(node.instance):
+        render_children(
+            node,
+            context,
+            lambda xn,
+            n,
+            ctx: ctx.derive(parent = n.instance,
+                            parent_node = n,
+                            node_globals = ChildGlobals(n.node_globals),
+                            sizer = n.sizer,
+                            xml_node = xn)
+        )
+        layout(node.instance)
+
+
+def unload_page(node: Page):
+    """Destroys content of not selected page"""
+    node.unload_timer = None
+    if node.notebook is None or node.notebook.GetSelection() == node.index:
+        return
+    node.destroy_children()
+    node.rendered = False
@@ -0,0 +1,167 @@
+"""Wall time profiling of rendering pipelines"""
+
+from collections import defaultdict
+from contextlib import contextmanager
+from functools import partial, wraps
+from time import perf_counter
+from typing import Any, Callable, Dict, Generator, Iterable, List, NamedTuple, Optional, Tuple
+
+from injectool import DependencyError, resolve
+from pyviews.core.rendering import Node, RenderingContext
+from pyviews.rendering.pipeline import RenderingPipeline, use_pipeline
+
+from wxviews.app import get_wx_pipelines
+
+CREATE_NODE = 'create_node'
+
+
+class TimingStats:
+    """Count, total and max wall time of measured calls"""
+
+    def __init__(self):
+        self.count: int = 0
+        self.total: float = 0.0
+        self.max: float = 0.0
+
+    def add(self, elapsed: float):
+        """Adds measured call"""
+        self.count += 1
+        self.total += elapsed
+        self.max = max(self.max, elapsed)
+
+    def to_dict(self) -> dict:
+        """Returns stats as dictionary"""
+        return {'count': self.count, 'total': self.total, 'max': self.max}
+
+
+class NodeTiming(NamedTuple):
+    """Wall time of rendered node"""
+    tag: str
+    pipeline: str
+    depth: int
+    inclusive: float
+    exclusive: float
+
+
+class RenderingProfile:
+    """Wall time of rendering collected per pipe, pipeline and xml tag"""
+
+    def __init__(self, timer: Callable[[], float] = perf_counter):
+        self._timer: Callable[[], float] = timer
+        self.pipes: Dict[Tuple[str, str], TimingStats] = defaultdict(TimingStats)
+        self.pipelines: Dict[str, TimingStats] = defaultdict(TimingStats)
+        self.tags: Dict[str, TimingStats] = defaultdict(TimingStats)
+        self.nodes: List[NodeTiming] = []
+        self._children_times: List[float] = []
+
+    def measure_node(self, pipeline: str, context: RenderingContext, run: Callable[[], Node]) -> Node:
+        """Runs pipeline and records inclusive time of node subtree"""
+        self._children_times.append(0.0)
+        start = self._timer()
+        try:
+            return run()
+        finally:
+            inclusive = self._timer() - start
+            exclusive = inclusive - self._children_times.pop()
+            if self._children_times:
+                self._children_times[-1] += inclusive
+            tag = _get_tag(context)
+            self.pipelines[pipeline].add(inclusive)
+            self.tags[tag].add(inclusive)
+            self.nodes.append(NodeTiming(tag, pipeline, len(self._children_times), inclusive, exclusive))
+
+    def measure_pipe(self, pipeline: str, pipe: str, call: Callable, *args) -> Any:
+        """Calls pipe or create_node and records wall time"""
+        start = self._timer()
+        try:
+            return call(*args)
+        finally:
+            self.pipes[(pipeline, pipe)].add(self._timer() - start)
+
+    def to_dict(self) -> dict:
+        """Returns structured report"""
+        return {
+            'pipes': [{'pipeline': pipeline, 'pipe': pipe, **stats.to_dict()}
+                      for (pipeline, pipe), stats in _sort(self.pipes)],
+            'pipelines': [{'pipeline': pipeline, **stats.to_dict()} for pipeline, stats in _sort(self.pipelines)],
+            'tags': [{'tag': tag, **stats.to_dict()} for tag, stats in _sort(self.tags)],
+            'nodes': [node._asdict() for node in self.nodes]
+        } # yapf: disable
+
+    def format(self, limit: int = 20) -> str:
+        """Returns text table of slowest pipes"""
+        lines = [f'{"pipeline":<30} {"pipe":<40} {"count":>8} {"total, ms":>12} {"max, ms":>10}']
+        for (pipeline, pipe), stats in _sort(self.pipes)[:limit]:
+            lines.append(f'{pipeline:<30} {pipe:<40} {stats.count:>8} '
+                         f'{stats.total * 1000:>12.3f} {stats.max * 1000:>10.3f}')
+        return '\n'.join(lines)
+
+
+def _get_tag(context: RenderingContext) -> str:
+    xml_node = context.xml_node
+    return f'{xml_node.namespace}.{xml_node.name}' if xml_node.namespace else xml_node.name
+
+
+def _sort(stats: Dict[Any, TimingStats]) -> List[Tuple[Any, TimingStats]]:
+    return sorted(stats.items(), key = lambda item: item[1].total, reverse = True)
+
+
+def get_pipe_name(pipe: Callable) -> str:
+    """Returns readable pipe name"""
+    if isinstance(pipe, partial):
+        args = ', '.join(repr(arg) for arg in pipe.args)
+        return f'{get_pipe_name(pipe.func)}({args})'
+    return getattr(pipe, '__name__', repr(pipe))
+
+
+class ProfiledPipeline(RenderingPipeline):
+    """Rendering pipeline measuring create_node, every pipe and node subtree"""
+
+    # pylint: disable=protected-access
+    def __init__(self, pipeline: RenderingPipeline, profile: RenderingProfile, class_path: str):
+        self._pipeline: RenderingPipeline = pipeline
+        self._profile: RenderingProfile = profile
+        self._label: str = pipeline._name if pipeline._name else class_path
+        super().__init__(pipes = [self._wrap(pipe, get_pipe_name(pipe)) for pipe in pipeline._pipes],
+                         create_node = self._wrap(pipeline._create_node, CREATE_NODE),
+                         name = pipeline._name)
+
+    @property
+    def pipeline(self) -> RenderingPipeline:
+        """Measured pipeline"""
+        return self._pipeline
+
+    def _wrap(self, call: Callable, name: str) -> Callable:
+
+        @wraps(call)
+        def _measured(*args):
+            return self._profile.measure_pipe(self._label, name, call, *args)
+
+        return _measured
+
+    def run(self, context: RenderingContext) -> Node:
+        return self._profile.measure_node(self._label, context, partial(super().run, context))
+
+
+@contextmanager
+def profiling(class_paths: Optional[Iterable[str]] = None,
+              timer: Callable[[], float] = perf_counter) -> Generator[RenderingProfile, None, None]:
+    """
+    Measures registered rendering pipelines while context is active.
+    By default wxviews pipelines are measured.
+    """
+    class_paths = get_wx_pipelines().keys() if class_paths is None else class_paths
+    profile = RenderingProfile(timer)
+    registered: Dict[str, RenderingPipeline] = {}
+    for class_path in class_paths:
+        try:
+            pipeline = resolve((RenderingPipeline, class_path))
+        except DependencyError:
+            continue
+        registered[class_path] = pipeline
+        use_pipeline(ProfiledPipeline(pipeline, profile, class_path), class_path)
+    try:
+        yield profile
+    finally:
+        for class_path, pipeline in registered.items():
+            use_pipeline(pipeline, class_path)
@@ -1,16 +1,19 @@
 """Rendering pipeline for SizerNode"""
 
-from typing import Any, Optional
+from typing import Any, Callable, Optional, Type
 
 from pyviews.core.rendering import InstanceNode, Node, NodeGlobals
 from pyviews.core.xml import XmlNode
-from pyviews.pipes import render_children
-from pyviews.rendering.pipeline import RenderingPipeline, get_type
+from pyviews.rendering.pipeline import RenderingPipeline
 from wx import GridSizer, Sizer, StaticBoxSizer
 
+from wxviews.core.globals import ChildGlobals
+from wxviews.core.layout import render_transaction
 from wxviews.core.node import Sizerable
 from wxviews.core.pipes import add_to_sizer, apply_attributes
-from wxviews.core.rendering import WxRenderingContext, get_attr_args, get_init_value
+from wxviews.core.plan import ConstructorCache, get_node_plan
+from wxviews.core.progressive import cancel, render_children_progressively
+from wxviews.core.rendering import WxRenderingContext, get_attr_args
 
 
 class SizerNode(InstanceNode, Sizerable):
@@ -34,6 +37,7 @@ class SizerNode(InstanceNode, Sizerable):
         return self._instance
 
     def destroy(self):
+        cancel(self)
         super().destroy()
         if self._parent_sizer is None and self._parent is not None:
             self._parent.SetSizer(None, True)
@@ -49,29 +53,36 @@ def get_sizer_pipeline() -> RenderingPipeline:
 
 
 def _create_sizer_node(context: WxRenderingContext) -> SizerNode:
-    inst_type = get_type(context.xml_node)
-    if issubclass(inst_type, GridSizer):
-        args = _get_init_values(context.xml_node, context.node_globals)
-        inst = inst_type(*args)
-        return SizerNode(inst, context.xml_node, node_globals = context.node_globals)
+    inst_type, create = _SIZER_CONSTRUCTORS.get(context.xml_node)
+    return create(inst_type, context)
+
+
+def _create_grid_sizer_node(inst_type: Type[GridSizer], context: WxRenderingContext) -> SizerNode:
+    args = _get_init_values(context.xml_node, context.node_globals)
+    inst = inst_type(*args)
+    return SizerNode(inst, context.xml_node, node_globals = context.node_globals)
+
+
+def _create_static_box_sizer_node(inst_type: Type[StaticBoxSizer], context: WxRenderingContext) -> SizerNode:
+    init_args = get_attr_args(context.xml_node, 'init', context.node_globals)
+    args = []
+    try:
+        static_box = init_args.pop('box')
+        args.append(static_box)
+    except KeyError:
+        args.append(init_args.pop('orient'))
+        args.append(context.parent)
+    inst = inst_type(*args, **init_args)
+    return SizerNode(
+        inst,
+        context.xml_node,
+        node_globals = context.node_globals,
+        parent = inst.GetStaticBox(),
+        sizer = context.sizer
+    )
 
-    if issubclass(inst_type, StaticBoxSizer):
-        init_args = get_attr_args(context.xml_node, 'init', context.node_globals)
-        args = []
-        try:
-            static_box = init_args.pop('box')
-            args.append(static_box)
-        except KeyError:
-            args.append(init_args.pop('orient'))
-            args.append(context.parent)
-        inst = inst_type(*args, **init_args)
-        return SizerNode(
-            inst,
-            context.xml_node,
-            node_globals = context.node_globals,
-            parent = inst.GetStaticBox(),
-            sizer = context.sizer
-        )
+
+def _create_box_sizer_node(inst_type: Type[Sizer], context: WxRenderingContext) -> SizerNode:
     args = get_attr_args(context.xml_node, 'init', context.node_globals)
     inst = inst_type(**args)
     return SizerNode(
@@ -79,26 +90,37 @@ def _create_sizer_node(context: WxRenderingContext) -> SizerNode:
     )
 
 
+SizerConstructor = Callable[[Type, WxRenderingContext], SizerNode]
+
+
+def _choose_sizer_constructor(inst_type: Type) -> SizerConstructor:
+    if issubclass(inst_type, GridSizer):
+        return _create_grid_sizer_node
+    if issubclass(inst_type, StaticBoxSizer):
+        return _create_static_box_sizer_node
+    return _create_box_sizer_node
+
+
+_SIZER_CONSTRUCTORS: ConstructorCache[SizerConstructor] = ConstructorCache(_choose_sizer_constructor)
+
+
 def _get_init_values(xml_node: XmlNode, node_globals: Optional[NodeGlobals] = None) -> list:
-    init_attrs = [attr for attr in xml_node.attrs if attr.namespace == 'init']
-    return [get_init_value(attr, node_globals) for attr in init_attrs]
+    plan = get_node_plan(xml_node)
+    return [plan.get_value(attr, node_globals) for attr in plan.get_attrs('init')]
 
 
 def render_sizer_children(node: SizerNode, context: WxRenderingContext):
     """Renders sizer children"""
-    render_children(
-        node,
-        context,
-        lambda x,
-        n,
-        ctx: WxRenderingContext({
-            'parent_node': n,
-            'parent': ctx.parent,
-            'node_globals': NodeGlobals(node.node_globals),
-            'sizer': node.instance,
-            'xml_node': x
-        })
-    )
+    with render_transaction(context.parent):
+        render_children_progressively(
+            node,
+            context,
+            lambda x,
+            n,
+            ctx: ctx.derive(
+                parent_node = n, node_globals = ChildGlobals(node.node_globals), sizer = node.instance, xml_node = x
+            )
+        )
 
 
 def set_sizer_to_parent(node, context: WxRenderingContext):
@@ -3,15 +3,18 @@
 from typing import Any, List, Optional
 
 from pyviews.core.error import PyViewsError
-from pyviews.core.expression import execute, is_expression, parse_expression
+from pyviews.core.expression import is_expression
 from pyviews.core.rendering import Node, NodeGlobals, Setter
 from pyviews.core.xml import XmlAttr, XmlNode
 from pyviews.pipes import get_setter, render_children
 from pyviews.rendering.pipeline import RenderingPipeline
 
 from wxviews.containers import render_view_content
+from wxviews.core.globals import ChildGlobals
 from wxviews.core.pipes import apply_attributes
+from wxviews.core.plan import NodePlan, get_node_plan
 from wxviews.core.rendering import WxRenderingContext
+from wxviews.core.tracing import span
 
 STYLES_KEY = '_node_styles'
 
@@ -79,20 +82,22 @@ def setup_node_styles(_: Style, context: WxRenderingContext):
 
 def apply_style_items(node: Style, _: WxRenderingContext):
     """Parsing step. Parses attributes to style items and sets them to style"""
-    attrs = node.xml_node.attrs
-    try:
-        node.name = next(attr.value for attr in attrs if attr.name == 'name')
-    except StopIteration as err:
-        raise StyleError('Style name is missing', node.xml_node.view_info) from err
-    node.items = {f'{attr.namespace}{attr.name}': _get_style_item(node, attr) for attr in attrs if attr.name != 'name'}
-
-
-def _get_style_item(node: Style, attr: XmlAttr):
+    plan = get_node_plan(node.xml_node)
+    name_attr = plan.get_attr('name')
+    if name_attr is None:
+        raise StyleError('Style name is missing', node.xml_node.view_info)
+    node.name = name_attr.value
+    node.items = {
+        f'{attr.namespace}{attr.name}': _get_style_item(node, attr, plan)
+        for attr in node.xml_node.attrs if attr.name != 'name'
+    }
+
+
+def _get_style_item(node: Style, attr: XmlAttr, plan: NodePlan):
     setter = get_setter(attr)
     value = attr.value if attr.value else ''
     if is_expression(value):
-        expression_body = parse_expression(value).body
-        value = execute(expression_body, node.node_globals)
+        value = plan.get_value(attr, node.node_globals)
     return StyleItem(setter, attr.name, value)
 
 
@@ -118,12 +123,10 @@ def render_child_styles(node: Style, context: WxRenderingContext):
         context,
         lambda x,
         n,
-        _: WxRenderingContext({
-            'parent_node': n,
-            'node_globals': NodeGlobals(node.node_globals),
-            'node_styles': _get_styles(context),
-            'xml_node': x
-        })
+        ctx: ctx.derive(parent_node = n,
+                        node_globals = ChildGlobals(node.node_globals),
+                        node_styles = _get_styles(context),
+                        xml_node = x)
     )
 
 
@@ -159,9 +162,10 @@ def style(node: Node, _: str, keys: List[str]):
         keys = [key.strip() for key in keys.split(',') if key]
     try:
         node_styles = node.node_globals[STYLES_KEY]
-        for key in keys:
-            for item in node_styles[key]:
-                item.apply(node)
+        with span('style', 'style', {'keys': keys}):
+            for key in keys:
+                for item in node_styles[key]:
+                    item.apply(node)
     except KeyError as key_error:
         error = StyleError('Style is not found')
         error.add_info('Style name', key_error.args[0])
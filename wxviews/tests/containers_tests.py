@@ -1,10 +1,19 @@
-from unittest.mock import Mock
+from unittest.mock import Mock, call, patch
 
-from pytest import mark
-from pyviews.containers import For, If, View
+from pytest import fixture, mark, raises
+from pyviews.core.rendering import Node, NodeGlobals
+from pyviews.core.xml import XmlNode
+from wx import EVT_SHOW, Window
 
-from wxviews.containers import layout_parent_on_change
+from wxviews import containers
+from wxviews.containers import (For, If, KeptSubtree, Lazy, SubtreeCache, View, VirtualFor, layout_parent_on_change,
+                                render_lazy, render_lazy_on_trigger, render_virtual_items,
+                                rerender_on_condition_change, rerender_on_items_change, rerender_on_view_change,
+                                rerender_virtual_items_on_change, update_virtual_items, update_virtual_items_on_scroll)
+from wxviews.core import layout
+from wxviews.core.layout import flush_layout, get_transaction
 from wxviews.core.rendering import WxRenderingContext
+from wxviews.widgets.rendering import WxNode
 
 
 @mark.parametrize('container, prop', [
@@ -17,7 +26,631 @@ def test_layout_parent_on_change(container, prop):
     parent = Mock()
     context = WxRenderingContext({'parent': parent})
 
-    layout_parent_on_change(prop, container, context)
-    setattr(container, prop, 'new value')
+    with patch(layout.__name__ + '.CallAfter'):
+        layout_parent_on_change(prop, container, context)
+        setattr(container, prop, 'new value')
+    flush_layout()
 
     assert parent.Layout.called
+
+
+@mark.parametrize('container, prop, rerender', [
+    (View(Mock()), 'name', '_rerender_view'),
+    (For(Mock()), 'items', '_update_for_items'),
+    (If(Mock()), 'condition', '_rerender_if')
+]) # yapf: disable
+def test_rerender_in_transaction(container, prop, rerender):
+    """should rerender container in render transaction"""
+    context = WxRenderingContext({'parent': Mock()})
+    subscribe = {
+        'name': rerender_on_view_change,
+        'items': rerender_on_items_change,
+        'condition': rerender_on_condition_change
+    }[prop]
+    with patch(containers.__name__ + '.' + rerender) as render:
+        render.side_effect = lambda *_: setattr(render, 'transaction', get_transaction())
+        subscribe(container, context)
+        setattr(container, prop, 'new value')
+
+    assert render.call_count == 1
+    assert render.call_args[0][:2] == (container, context)
+    assert render.transaction is not None
+    assert get_transaction() is None
+
+
+class SizerItem:
+    """Sizer item stub"""
+
+    def __init__(self, window):
+        self._window = window
+
+    def IsWindow(self):
+        """Returns True"""
+        return True
+
+    def GetWindow(self):
+        """Returns window"""
+        return self._window
+
+
+class SpacerItem:
+    """Spacer sizer item stub"""
+
+    def __init__(self):
+        self.AssignSpacer = Mock()
+        self.GetPosition = Mock(return_value = (0, 0))
+
+    @staticmethod
+    def IsWindow():
+        """Returns False"""
+        return False
+
+    @staticmethod
+    def IsSizer():
+        """Returns False"""
+        return False
+
+
+class SizerStub:
+    """Sizer stub storing windows"""
+
+    def __init__(self, windows):
+        self.windows = list(windows)
+        self.Detach = Mock(side_effect = self.windows.remove)
+        self.Insert = Mock(side_effect = lambda index, window, **_: self.windows.insert(index, window))
+        self.Remove = Mock(side_effect = self.windows.pop)
+        self.Layout = Mock()
+
+    def Add(self, window, height = None, **_):
+        """Appends window or spacer"""
+        if height is not None:
+            window = SpacerItem()
+        self.windows.append(window)
+        return window
+
+    def GetChildren(self):
+        """Returns sizer items"""
+        return [window if isinstance(window, SpacerItem) else SizerItem(window) for window in self.windows]
+
+    @staticmethod
+    def GetContainingWindow():
+        """Returns None"""
+        return None
+
+
+def _render_stub(sizer: SizerStub):
+
+    def render(child_context):
+        child = WxNode(Mock(), child_context.xml_node, child_context.node_globals)
+        child.destroy = Mock(side_effect = lambda: sizer.windows.remove(child.instance))
+        sizer.Add(child.instance)
+        return child
+
+    return render
+
+
+@fixture
+def keyed_for_fixture(request):
+    node = For(XmlNode('wxviews', 'For', children = [XmlNode('wx', 'Button')]))
+    node.key = lambda item: item
+    sibling = Mock()
+    sizer = SizerStub([sibling])
+    context = WxRenderingContext({'parent': Mock(), 'sizer': sizer})
+    render = _render_stub(sizer)
+    with patch(containers.__name__ + '.render') as render_mock:
+        render_mock.side_effect = render
+        with patch(containers.__name__ + '.get_child_context') as get_child_context:
+            get_child_context.side_effect = lambda xml_node, *_: Mock(xml_node = xml_node, node_globals = NodeGlobals())
+            node.items = ['a', 'b', 'c']
+            for index, item in enumerate(node.items):
+                node.add_child(render(Mock(xml_node = node.xml_node.children[0], node_globals = NodeGlobals({
+                    'item': item, 'index': index
+                }))))
+            sizer.windows.append(Mock())
+            rerender_on_items_change(node, context)
+            request.cls.node = node
+            request.cls.sizer = sizer
+            request.cls.render = render_mock
+            yield node
+
+
+@mark.usefixtures(keyed_for_fixture.__name__)
+class KeyedForTests:
+    """Keyed For rerendering tests"""
+
+    node: For
+    sizer: SizerStub
+    render: Mock
+
+    def test_appends_only_new_items(self):
+        """should render only new items"""
+        old_children = self.node.children
+
+        self.node.items = ['a', 'b', 'c', 'd']
+
+        assert self.render.call_count == 1
+        assert self.node.children[:3] == old_children
+        assert [child.node_globals['item'] for child in self.node.children] == ['a', 'b', 'c', 'd']
+
+    def test_destroys_removed_items(self):
+        """should destroy children of removed items only"""
+        removed = self.node.children[1]
+
+        self.node.items = ['a', 'c']
+
+        assert removed.destroy.called
+        assert not self.render.called
+        assert [child.node_globals['item'] for child in self.node.children] == ['a', 'c']
+        assert [child.node_globals['index'] for child in self.node.children] == [0, 1]
+
+    def test_reorders_sizer_items(self):
+        """should move widgets in sizer according to items order"""
+        instances = [child.instance for child in self.node.children]
+
+        self.node.items = ['c', 'a', 'b']
+
+        assert not self.render.called
+        assert self.sizer.windows[1:4] == [instances[2], instances[0], instances[1]]
+        assert self.sizer.Detach.call_count == 1
+
+    def test_inserts_new_items_in_place(self):
+        """should insert new widgets at item position before following siblings"""
+        following = self.sizer.windows[-1]
+
+        self.node.items = ['new', 'a', 'b', 'c']
+
+        assert self.render.call_count == 1
+        assert self.sizer.windows[1] is self.node.children[0].instance
+        assert self.sizer.windows[-1] is following
+
+    def test_reorders_nested_sizer_items(self):
+        """should move widgets of items with container root in sizer"""
+        render = self.render.side_effect
+
+        def render_container(child_context):
+            container = Node(child_context.xml_node, child_context.node_globals)
+            container.add_child(render(child_context))
+            return container
+
+        self.render.side_effect = render_container
+        self.node.items = []
+        self.node.items = ['a', 'b', 'c']
+        instances = [child.children[0].instance for child in self.node.children]
+
+        self.node.items = ['c', 'a', 'b']
+
+        assert [window for window in self.sizer.windows if window in instances] == \
+               [instances[2], instances[0], instances[1]]
+
+    def test_uses_positional_update_without_key(self):
+        """should update children by position if key is not set"""
+        self.node.key = None
+        old_children = self.node.children
+
+        self.node.items = ['c', 'b', 'a']
+
+        assert self.node.children == old_children
+        assert [child.node_globals['item'] for child in self.node.children] == ['c', 'b', 'a']
+
+
+@fixture
+def virtual_for_fixture(request):
+    node = VirtualFor(XmlNode('wxviews', 'VirtualFor', children = [XmlNode('wx', 'Button')]))
+    node.items = list(range(100))
+    node.row_height = 20
+    node.overscan = 1
+    sizer = SizerStub([Mock()])
+    parent = Mock()
+    parent.GetViewStart.return_value = (0, 10)
+    parent.GetScrollPixelsPerUnit.return_value = (0, 10)
+    parent.GetClientSize.return_value = (100, 100)
+    context = WxRenderingContext({'parent': parent, 'sizer': sizer})
+    with patch(containers.__name__ + '.render') as render:
+        render.side_effect = _render_stub(sizer)
+        with patch(containers.__name__ + '.get_child_context') as get_child_context:
+            get_child_context.side_effect = lambda xml_node, *_: Mock(xml_node = xml_node, node_globals = NodeGlobals())
+            request.cls.node = node
+            request.cls.sizer = sizer
+            request.cls.parent = parent
+            request.cls.context = context
+            request.cls.render = render
+            yield node
+
+
+@mark.usefixtures(virtual_for_fixture.__name__)
+class VirtualForTests:
+    """VirtualFor rendering tests"""
+
+    node: VirtualFor
+    sizer: SizerStub
+    parent: Mock
+    context: WxRenderingContext
+    render: Mock
+
+    def _get_items(self):
+        return [child.node_globals['item'] for child in self.node.children]
+
+    def test_renders_visible_rows(self):
+        """should render visible rows with overscan"""
+        render_virtual_items(self.node, self.context)
+
+        assert self._get_items() == list(range(4, 11))
+        assert self.render.call_count == 7
+
+    def test_sets_spacers(self):
+        """should replace not rendered rows with spacers"""
+        render_virtual_items(self.node, self.context)
+        top, bottom = self.node.spacers
+
+        assert top.AssignSpacer.call_args == call((0, 4 * 20))
+        assert bottom.AssignSpacer.call_args == call((0, (100 - 11) * 20))
+        assert self.sizer.windows[1] is top
+        assert self.sizer.windows[2:9] == [child.instance for child in self.node.children]
+        assert self.sizer.windows[9] is bottom
+
+    def test_recycles_rows_on_scroll(self):
+        """should rebind rendered rows instead of rendering new ones"""
+        render_virtual_items(self.node, self.context)
+        children = self.node.children
+        self.render.reset_mock()
+
+        self.parent.GetViewStart.return_value = (0, 50)
+        update_virtual_items(self.node, self.context)
+
+        assert not self.render.called
+        assert self.node.children == children
+        assert self._get_items() == list(range(24, 31))
+        assert [child.node_globals['index'] for child in self.node.children] == list(range(24, 31))
+
+    def test_destroys_overflow_rows(self):
+        """should destroy rows if there are less items"""
+        render_virtual_items(self.node, self.context)
+        children = self.node.children
+        rerender_virtual_items_on_change(self.node, self.context)
+
+        self.node.items = [1, 2]
+
+        assert self._get_items() == [1, 2]
+        assert all(child.destroy.called for child in children[2:])
+        assert self.node.spacers[1].AssignSpacer.call_args == call((0, 0))
+
+    def test_schedules_update_once(self):
+        """should schedule one update for several scroll events"""
+        render_virtual_items(self.node, self.context)
+        with patch(containers.__name__ + '.CallAfter') as call_after:
+            update_virtual_items_on_scroll(self.node, self.context)
+            handler = self.parent.Bind.call_args[0][1]
+            for _ in range(3):
+                handler(Mock())
+
+        assert call_after.call_count == 1
+
+    def test_unbinds_on_destroy(self):
+        """should unbind handlers and stop updates on destroy"""
+        render_virtual_items(self.node, self.context)
+        update_virtual_items_on_scroll(self.node, self.context)
+
+        self.node.destroy()
+
+        assert self.parent.Unbind.call_count == 2
+        assert self.node.spacers is None
+
+
+def _create_window():
+    window = Mock(spec = Window)
+    window.IsShown.return_value = True
+    return window
+
+
+@fixture
+def keep_alive_fixture(request):
+    sizer = SizerStub([Mock()])
+    context = WxRenderingContext({'parent': Mock(), 'sizer': sizer})
+
+    def render_content(node, _):
+        child = WxNode(_create_window(), XmlNode('wx', 'Panel'), NodeGlobals())
+        child.destroy = Mock()
+        sizer.Add(child.instance)
+        node.add_child(child)
+
+    with patch(containers.__name__ + '.render_view_content') as render_view_content:
+        render_view_content.side_effect = render_content
+        with patch(containers.__name__ + '.render_if') as render_if:
+            render_if.side_effect = lambda node, ctx: render_content(node, ctx) if node.condition else None
+            request.cls.sizer = sizer
+            request.cls.context = context
+            request.cls.render_view_content = render_view_content
+            request.cls.render_if = render_if
+            yield render_content
+
+
+@mark.usefixtures(keep_alive_fixture.__name__)
+class KeepAliveTests:
+    """keep_alive tests for View and If"""
+
+    sizer: SizerStub
+    context: WxRenderingContext
+    render_view_content: Mock
+    render_if: Mock
+
+    def _render_view(self, keep_alive) -> View:
+        view = View(XmlNode('wxviews', 'View'))
+        view.keep_alive = keep_alive
+        view.name = 'first'
+        self.render_view_content(view, self.context)
+        rerender_on_view_change(view, self.context)
+        return view
+
+    def test_reuses_kept_view(self):
+        """should hide previous view and reattach it on return"""
+        view = self._render_view(2)
+        first = view.children[0]
+
+        view.name = 'second'
+
+        assert first.instance.Hide.called
+        assert first.instance not in self.sizer.windows
+        assert not first.destroy.called
+
+        view.name = 'first'
+
+        assert view.children == [first]
+        assert first.instance.Show.call_args == call(True)
+        assert self.sizer.windows[1] is first.instance
+        assert self.render_view_content.call_count == 2
+
+    def test_completes_view_before_keeping(self):
+        """should render queued children of previous view before it is kept"""
+        view = self._render_view(1)
+
+        with patch(containers.__name__ + '.complete') as complete:
+            view.name = 'second'
+
+        assert complete.call_args == call(view)
+
+    def test_restores_hidden_state(self):
+        """should keep hidden widgets hidden on return"""
+        view = self._render_view(1)
+        first = view.children[0]
+        first.instance.IsShown.return_value = False
+
+        view.name = 'second'
+        view.name = 'first'
+
+        assert first.instance.Show.call_args == call(False)
+
+    def test_evicts_least_recently_used_view(self):
+        """should destroy views above keep_alive count"""
+        view = self._render_view(1)
+        first = view.children[0]
+
+        view.name = 'second'
+        second = view.children[0]
+        view.name = 'third'
+
+        assert first.destroy.called
+        assert not second.destroy.called
+
+    def test_destroys_without_keep_alive(self):
+        """should destroy previous view if keep_alive is not set"""
+        view = self._render_view(0)
+        first = view.children[0]
+
+        view.name = 'second'
+        view.name = 'first'
+
+        assert first.destroy.called
+        assert view.children[0] is not first
+
+    def test_destroy_clears_kept(self):
+        """should destroy kept views with node"""
+        view = self._render_view(1)
+        first = view.children[0]
+        view.name = 'second'
+
+        view.destroy()
+
+        assert first.destroy.called
+
+    def test_if_keep_alive(self):
+        """should hide If children and reattach them if condition is true again"""
+        node = If(XmlNode('wxviews', 'If'))
+        node.keep_alive = True
+        node.condition = True
+        self.render_if(node, self.context)
+        rerender_on_condition_change(node, self.context)
+        children = node.children
+
+        node.condition = False
+
+        assert node.children == []
+        assert not children[0].destroy.called
+
+        node.condition = True
+
+        assert node.children == children
+        assert self.render_if.call_count == 2
+
+    @staticmethod
+    @mark.parametrize('value, expected', [
+        ('false', False),
+        ('True', True),
+        (False, False),
+        (1, True)
+    ]) # yapf: disable
+    def test_if_keep_alive_parses_bool(value, expected):
+        """should parse keep_alive string as boolean"""
+        node = If(XmlNode('wxviews', 'If'))
+
+        node.keep_alive = value
+
+        assert node.keep_alive == expected
+
+    @staticmethod
+    def test_if_keep_alive_raises_for_not_bool():
+        """should raise ValueError if keep_alive string is not boolean"""
+        with raises(ValueError):
+            If(XmlNode('wxviews', 'If')).keep_alive = 'yes'
+
+    def test_if_keep_alive_truthy_change(self):
+        """should keep children if condition changes from one true value to another"""
+        node = If(XmlNode('wxviews', 'If'))
+        node.keep_alive = True
+        node.condition = 1
+        self.render_if(node, self.context)
+        rerender_on_condition_change(node, self.context)
+        children = node.children
+
+        node.condition = 2
+        node.condition = 0
+        node.condition = 1
+
+        assert node.children == children
+        assert self.render_if.call_count == 2
+
+        node.destroy()
+
+        assert children[0].destroy.called
+        assert not node.kept.pop(True)
+
+    @staticmethod
+    def test_put_destroys_replaced_subtree():
+        """should destroy subtree stored with the same key"""
+        cache = SubtreeCache(2)
+        replaced, stored = Mock(), Mock()
+        cache.put('key', KeptSubtree([replaced], []))
+
+        cache.put('key', KeptSubtree([stored], []))
+
+        assert replaced.destroy.called
+        assert not stored.destroy.called
+
+
+@fixture
+def lazy_fixture(request):
+    sizer = SizerStub([Mock(), Mock()])
+    parent = Mock()
+    parent.IsShownOnScreen.return_value = False
+    context = WxRenderingContext({'parent': parent, 'sizer': sizer})
+    node = Lazy(XmlNode('wxviews', 'Lazy'))
+
+    def render_children(lazy, _):
+        child = WxNode(_create_window(), XmlNode('wx', 'Panel'), NodeGlobals())
+        sizer.Add(child.instance)
+        lazy.add_child(child)
+
+    with patch(containers.__name__ + '.render_container_children') as render_container_children:
+        render_container_children.side_effect = render_children
+        request.cls.node = node
+        request.cls.sizer = sizer
+        request.cls.parent = parent
+        request.cls.context = context
+        request.cls.render_children = render_container_children
+        yield node
+
+
+@mark.usefixtures(lazy_fixture.__name__)
+class LazyTests:
+    """Lazy rendering tests"""
+
+    node: Lazy
+    sizer: SizerStub
+    parent: Mock
+    context: WxRenderingContext
+    render_children: Mock
+
+    def _render(self):
+        render_lazy(self.node, self.context)
+        render_lazy_on_trigger(self.node, self.context)
+
+    @mark.parametrize('trigger, shown', [(True, False), (False, True)])
+    def test_renders_immediately(self, trigger, shown):
+        """should render children if trigger is true or parent is shown"""
+        self.node.trigger = trigger
+        self.parent.IsShownOnScreen.return_value = shown
+
+        self._render()
+
+        assert self.render_children.call_count == 1
+        assert self.node.rendered
+        assert not self.parent.Bind.called
+
+    def test_defers_rendering(self):
+        """should add placeholder instead of children"""
+        self._render()
+
+        assert not self.render_children.called
+        assert isinstance(self.sizer.windows[2], SpacerItem)
+        assert self.parent.Bind.call_args == call(EVT_SHOW, self.parent.Bind.call_args[0][1])
+
+    def test_renders_on_trigger(self):
+        """should render children in place of placeholder once trigger is true"""
+        self._render()
+        following = Mock()
+        self.sizer.windows.append(following)
+
+        self.node.trigger = True
+        self.node.trigger = False
+        self.node.trigger = True
+
+        assert self.render_children.call_count == 1
+        assert self.sizer.windows[2] is self.node.children[0].instance
+        assert self.sizer.windows[3] is following
+        assert not any(isinstance(window, SpacerItem) for window in self.sizer.windows)
+        assert self.parent.Unbind.called
+
+    def test_renders_on_show(self):
+        """should render children when parent is shown on screen"""
+        self._render()
+        on_show = self.parent.Bind.call_args[0][1]
+        event = Mock()
+        event.IsShown.return_value = True
+        with patch(containers.__name__ + '.CallAfter') as call_after:
+            on_show(event)
+            render_if_shown = call_after.call_args[0][0]
+
+        render_if_shown()
+        assert not self.render_children.called
+
+        self.parent.IsShownOnScreen.return_value = True
+        render_if_shown()
+        assert self.render_children.call_count == 1
+
+    def test_does_not_render_after_destroy(self):
+        """should not render children if node is destroyed before posted show call is run"""
+        self._render()
+        event = Mock()
+        event.IsShown.return_value = True
+        with patch(containers.__name__ + '.CallAfter') as call_after:
+            self.parent.Bind.call_args[0][1](event)
+            render_if_shown = call_after.call_args[0][0]
+        self.node.destroy()
+        self.parent.IsShownOnScreen.reset_mock()
+
+        render_if_shown()
+
+        assert not self.render_children.called
+        assert not self.parent.IsShownOnScreen.called
+
+    def test_parses_trigger(self):
+        """should parse trigger string as boolean"""
+        self._render()
+
+        self.node.trigger = 'false'
+
+        assert self.node.trigger is False
+        assert not self.render_children.called
+
+        self.node.trigger = 'true'
+
+        assert self.render_children.call_count == 1
+
+    def test_destroy_releases_handlers(self):
+        """should unbind show handler on destroy"""
+        self._render()
+
+        self.node.destroy()
+        self.node.trigger = True
+
+        assert self.parent.Unbind.called
+        assert not self.render_children.called
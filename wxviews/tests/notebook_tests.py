@@ -0,0 +1,217 @@
+from unittest.mock import Mock, call, patch
+
+from pytest import fixture, mark, raises
+from pyviews.core.rendering import NodeGlobals
+from pyviews.core.xml import XmlNode
+from wx import EVT_NOTEBOOK_PAGE_CHANGING, BookCtrlBase, Notebook
+
+from wxviews import notebook
+from wxviews.core.rendering import WxRenderingContext
+from wxviews.notebook import Page, add_to_notebook, render_page_on_selection, render_selected_page, unload_page
+
+
+class NotebookStub(Notebook):
+    """Notebook storing pages"""
+
+    def __init__(self):
+        self.pages = []
+        self.titles = []
+        self.selection = 0
+        self.Bind = Mock()
+        self.Unbind = Mock()
+
+    def AddPage(self, page, title):
+        """Appends page"""
+        self.pages.append(page)
+        self.titles.append(title)
+
+    def RemovePage(self, index):
+        """Removes page"""
+        self.pages.pop(index)
+        self.titles.pop(index)
+
+    def GetPage(self, index):
+        """Returns page"""
+        return self.pages[index]
+
+    def GetPageCount(self):
+        """Returns pages count"""
+        return len(self.pages)
+
+    def GetSelection(self):
+        """Returns selected page index"""
+        return self.selection
+
+    def SetPageText(self, index, title):
+        """Sets page title"""
+        self.titles[index] = title
+
+
+def _create_page(title = 'title') -> Page:
+    page = Page(Mock(), XmlNode('wxviews', 'Page', children = [XmlNode('wx', 'Button')]), NodeGlobals(), Mock())
+    page.title = title
+    return page
+
+
+def _changing_event(selection, old_selection):
+    event = Mock()
+    event.GetSelection.return_value = selection
+    event.GetOldSelection.return_value = old_selection
+    return event
+
+
+class AddToNotebookTests:
+    """add_to_notebook() tests"""
+
+    @staticmethod
+    def test_adds_page():
+        """should add page panel with title"""
+        book = NotebookStub()
+        page = _create_page('first')
+
+        add_to_notebook(page, WxRenderingContext({'parent': book}))
+
+        assert book.pages == [page.instance]
+        assert book.titles == ['first']
+        assert page.index == 0
+
+    @staticmethod
+    def test_raises_for_parent_not_notebook():
+        """should raise TypeError if parent is not notebook"""
+        with raises(TypeError):
+            add_to_notebook(_create_page(), WxRenderingContext({'parent': Mock()}))
+
+    @staticmethod
+    def test_raises_for_other_book_controls():
+        """should raise TypeError for book controls sending other page changing events"""
+        with raises(TypeError):
+            add_to_notebook(_create_page(), WxRenderingContext({'parent': BookCtrlBase()}))
+
+    @staticmethod
+    def test_title_updates_page_text():
+        """should update page text on title change"""
+        book = NotebookStub()
+        page = _create_page('first')
+        add_to_notebook(page, WxRenderingContext({'parent': book}))
+
+        page.title = 'changed'
+
+        assert book.titles == ['changed']
+
+
+@fixture
+def pages_fixture(request):
+    book = NotebookStub()
+    pages = [_create_page(str(i)) for i in range(3)]
+    with patch(notebook.__name__ + '.render_children') as render_children:
+        render_children.side_effect = lambda node, *_: node.add_child(Mock())
+        for page in pages:
+            context = WxRenderingContext({'parent': book})
+            add_to_notebook(page, context)
+            render_page_on_selection(page, context)
+        request.cls.book = book
+        request.cls.pages = pages
+        request.cls.render_children = render_children
+        yield pages
+    notebook._SELECTIONS.clear()
+
+
+@mark.usefixtures(pages_fixture.__name__)
+class PageRenderingTests:
+    """Page on demand rendering tests"""
+
+    book: NotebookStub
+    pages: list
+    render_children: Mock
+
+    def _change_page(self, selection):
+        event = _changing_event(selection, self.book.selection)
+        for bind_call in self.book.Bind.call_args_list:
+            bind_call[0][1](event)
+        self.book.selection = selection
+
+    def test_renders_only_selected_page(self):
+        """should render selected page only"""
+        assert [page.rendered for page in self.pages] == [True, False, False]
+        assert self.render_children.call_count == 1
+
+    def test_renders_page_on_changing(self):
+        """should render page once when it is selected"""
+        self._change_page(2)
+        self._change_page(0)
+        self._change_page(2)
+
+        assert [page.rendered for page in self.pages] == [True, False, True]
+        assert self.render_children.call_count == 2
+        assert self.book.Bind.call_args[0][0] == EVT_NOTEBOOK_PAGE_CHANGING
+
+    def test_binds_one_handler(self):
+        """should bind one page changing handler per notebook"""
+        assert self.book.Bind.call_count == 1
+
+    def test_render_selected_page(self):
+        """render_selected_page() should render currently selected page"""
+        self.book.selection = 1
+        node = Mock(instance = self.book, children = self.pages)
+
+        render_selected_page(node, WxRenderingContext())
+
+        assert self.pages[1].rendered
+
+    def test_schedules_unload(self):
+        """should start unload timer when page is left"""
+        self.pages[0].unload_after = 2
+        with patch(notebook.__name__ + '.CallLater') as call_later:
+            self._change_page(1)
+
+        assert call_later.call_args == call(120000, unload_page, self.pages[0])
+
+    def test_stops_unload_on_return(self):
+        """should stop unload timer when page is selected again"""
+        self.pages[0].unload_after = 2
+        with patch(notebook.__name__ + '.CallLater') as call_later:
+            self._change_page(1)
+            self._change_page(0)
+
+        assert call_later.return_value.Stop.called
+        assert self.pages[0].unload_timer is None
+
+    def test_unload_page(self):
+        """unload_page() should destroy content of not selected page"""
+        page = self.pages[0]
+        content = page.children[0]
+        self.book.selection = 1
+
+        unload_page(page)
+
+        assert content.destroy.called
+        assert not page.rendered
+        assert page.children == []
+
+    def test_destroy_removes_page(self):
+        """should remove page from notebook and unbind handler on destroy"""
+        page = self.pages[1]
+
+        page.destroy()
+
+        assert page.instance not in self.book.pages
+        assert not self.book.Unbind.called
+        assert page.instance.Destroy.called
+
+    def test_destroyed_page_is_not_rendered(self):
+        """should not render destroyed page on selection"""
+        page = self.pages[1]
+        page.destroy()
+
+        self._change_page(1)
+
+        assert not page.rendered
+        assert self.pages[2].rendered
+
+    def test_unbinds_after_last_page(self):
+        """should unbind handler after last page is destroyed"""
+        for page in self.pages:
+            page.destroy()
+
+        assert self.book.Unbind.call_count == 1
+        assert self.book.Unbind.call_args == call(EVT_NOTEBOOK_PAGE_CHANGING, handler = self.book.Bind.call_args[0][1])
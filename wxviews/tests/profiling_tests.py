@@ -0,0 +1,144 @@
+from functools import partial
+from itertools import count
+from unittest.mock import Mock
+
+from injectool import resolve
+from pytest import mark
+from pyviews.core.xml import XmlNode
+from pyviews.rendering.pipeline import RenderingPipeline, use_pipeline
+
+from wxviews.core.plan import get_node_plan
+from wxviews.profiling import (CREATE_NODE, NodeTiming, ProfiledPipeline, RenderingProfile, get_pipe_name,
+                               profiling)
+
+
+def apply_attributes(_, __):
+    """Test pipe"""
+
+
+def add_to_sizer(_, __):
+    """Test pipe"""
+
+
+class ProfiledPipelineTests:
+    """ProfiledPipeline tests"""
+
+    @staticmethod
+    def test_measures_create_node_and_pipes():
+        """should record wall time of create_node and every pipe"""
+        profile = RenderingProfile(timer = count().__next__)
+        pipeline = RenderingPipeline(pipes = [apply_attributes, add_to_sizer], create_node = Mock(), name = 'wx')
+        context = Mock(xml_node = XmlNode('wx', 'Button'))
+
+        ProfiledPipeline(pipeline, profile, 'wx').run(context)
+
+        assert set(profile.pipes.keys()) == {('wx', CREATE_NODE), ('wx', 'apply_attributes'), ('wx', 'add_to_sizer')}
+        assert all(stats.count == 1 and stats.total == 1 for stats in profile.pipes.values())
+        assert profile.pipelines['wx'].count == 1
+        assert profile.tags['wx.Button'].count == 1
+
+    @staticmethod
+    def test_uses_class_path_for_unnamed_pipeline():
+        """should use class path as pipeline name if pipeline has no name"""
+        profile = RenderingProfile(timer = count().__next__)
+        context = Mock(xml_node = XmlNode('wxviews', 'Code'))
+
+        ProfiledPipeline(RenderingPipeline(create_node = Mock()), profile, 'wxviews.Code').run(context)
+
+        assert list(profile.pipelines.keys()) == ['wxviews.Code']
+
+    @staticmethod
+    def test_returns_node():
+        """should return created node"""
+        profile = RenderingProfile()
+        create_node = Mock()
+        pipeline = ProfiledPipeline(RenderingPipeline(create_node = create_node), profile, 'wx')
+
+        actual = pipeline.run(Mock(xml_node = XmlNode('wx', 'Button')))
+
+        assert actual is create_node.return_value
+
+
+class RenderingProfileTests:
+    """RenderingProfile tests"""
+
+    @staticmethod
+    def test_measures_subtree():
+        """should record inclusive and exclusive time of nested nodes"""
+        profile = RenderingProfile(timer = count().__next__)
+        parent_context = Mock(xml_node = XmlNode('wx', 'Panel'))
+        child_context = Mock(xml_node = XmlNode('wx', 'Button'))
+
+        profile.measure_node('wx', parent_context, lambda: profile.measure_node('wx', child_context, Mock()))
+
+        assert profile.nodes == [NodeTiming('wx.Button', 'wx', 1, 1, 1), NodeTiming('wx.Panel', 'wx', 0, 3, 2)]
+        assert profile.pipelines['wx'].count == 2
+        assert profile.pipelines['wx'].max == 3
+
+    @staticmethod
+    def test_to_dict():
+        """to_dict() should return report sorted by total time"""
+        profile = RenderingProfile(timer = count().__next__)
+        profile.measure_pipe('wx', 'fast', Mock())
+        profile.measure_pipe('wx', 'slow', lambda: profile.measure_pipe('wx', 'fast', Mock()))
+
+        actual = profile.to_dict()
+
+        assert actual['pipes'] == [
+            {'pipeline': 'wx', 'pipe': 'slow', 'count': 1, 'total': 3, 'max': 3},
+            {'pipeline': 'wx', 'pipe': 'fast', 'count': 2, 'total': 2, 'max': 1}
+        ] # yapf: disable
+        assert actual['nodes'] == []
+
+    @staticmethod
+    def test_format():
+        """format() should return table of pipes"""
+        profile = RenderingProfile(timer = count().__next__)
+        profile.measure_pipe('wx', 'apply_attributes', Mock())
+
+        lines = profile.format().splitlines()
+
+        assert len(lines) == 2
+        assert 'apply_attributes' in lines[1]
+
+
+@mark.parametrize('pipe, expected', [
+    (apply_attributes, 'apply_attributes'),
+    (partial(apply_attributes, 'name'), "apply_attributes('name')")
+]) # yapf: disable
+def test_get_pipe_name(pipe, expected):
+    """get_pipe_name() should return function name"""
+    assert get_pipe_name(pipe) == expected
+
+
+@mark.usefixtures('container_fixture')
+class ProfilingTests:
+    """profiling() tests"""
+
+    @staticmethod
+    def test_replaces_pipelines():
+        """should measure registered pipelines while context is active"""
+        pipeline = RenderingPipeline()
+        use_pipeline(pipeline, 'wx')
+
+        with profiling(['wx', 'wx.Missing']) as profile:
+            profiled = resolve((RenderingPipeline, 'wx'))
+
+            assert isinstance(profiled, ProfiledPipeline)
+            assert profiled.pipeline is pipeline
+            assert isinstance(profile, RenderingProfile)
+
+        assert resolve((RenderingPipeline, 'wx')) is pipeline
+
+    @staticmethod
+    def test_plans_use_profiled_pipelines():
+        """should be used by plans while context is active"""
+        pipeline = RenderingPipeline()
+        use_pipeline(pipeline, 'wx')
+        node_plan = get_node_plan(XmlNode('wx', 'Button'))
+        assert node_plan.pipeline is pipeline
+
+        with profiling(['wx']):
+            assert isinstance(node_plan.pipeline, ProfiledPipeline)
+
+        assert node_plan.pipeline is pipeline
@@ -3,12 +3,14 @@ from unittest.mock import Mock, call, patch
 from injectool import add_singleton
 from pytest import fail, mark
 from pyviews.rendering.pipeline import render
-from wx import Sizer
+from wx import BoxSizer, FlexGridSizer, GridSizer, Sizer, StaticBoxSizer
 
 from wxviews import sizers
 from wxviews.core.rendering import WxRenderingContext
 from wxviews.sizers import (GrowableCol, GrowableRow, SizerNode, add_growable_col_to_sizer, add_growable_row_to_sizer,
                             render_sizer_children, set_sizer, set_sizer_to_parent)
+from wxviews.sizers import (_choose_sizer_constructor, _create_box_sizer_node, _create_grid_sizer_node,
+                            _create_static_box_sizer_node)
 
 
 class SizerNodeTests:
@@ -24,6 +26,16 @@ class SizerNodeTests:
 
         assert parent.SetSizer.call_args == call(None, True)
 
+    @staticmethod
+    def test_cancels_queued_children():
+        """should remove queued children from progressive rendering"""
+        node = SizerNode(Mock(), Mock())
+
+        with patch(sizers.__name__ + '.cancel') as cancel:
+            node.destroy()
+
+        assert cancel.call_args == call(node)
+
     @staticmethod
     def test_do_nothing_if_has_parent_sizer():
         """should do nothing if has parent sizer"""
@@ -35,13 +47,24 @@ class SizerNodeTests:
         assert not parent.SetSizer.called
 
 
+@mark.parametrize('sizer_type, constructor', [
+    (GridSizer, _create_grid_sizer_node),
+    (FlexGridSizer, _create_grid_sizer_node),
+    (StaticBoxSizer, _create_static_box_sizer_node),
+    (BoxSizer, _create_box_sizer_node)
+]) # yapf: disable
+def test_choose_sizer_constructor(sizer_type, constructor):
+    """should choose constructor by sizer type"""
+    assert _choose_sizer_constructor(sizer_type) is constructor
+
+
 @mark.usefixtures('container_fixture')
 @mark.parametrize('nodes_count', [1, 2, 5])
 def test_render_sizer_children(nodes_count):
     """should render all xml children for every item"""
     render_mock = Mock()
     add_singleton(render, render_mock)
-    with patch(sizers.__name__ + '.NodeGlobals') as inherited_dict_mock:
+    with patch(sizers.__name__ + '.ChildGlobals') as inherited_dict_mock:
         inherited_dict_mock.side_effect = lambda p: {'source': p} if p else p
         xml_node = Mock(children = [Mock() for _ in range(nodes_count)])
         parent, node = Mock(), SizerNode(Mock(), xml_node)
@@ -50,6 +50,8 @@ class ApplyStyleItemsTests:
     @staticmethod
     @mark.parametrize('attrs, expected', [
         ([('one', '{1}', None)], [('one', 1, call_set_attr)]),
+        ([('one', '{None}', None)], [('one', None, call_set_attr)]),
+        ([('one', ' {1} ', None)], [('one', ' {1} ', call_set_attr)]),
         ([('one', ' value ', None)], [('one', ' value ', call_set_attr)]),
         ([('one', 'value', __name__ + '.some_setter')], [('one', 'value', some_setter)]),
         ([('one', 'value', __name__ + '.some_setter'),
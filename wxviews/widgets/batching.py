@@ -0,0 +1,275 @@
+"""Batched updates of binding targets"""
+
+from contextlib import contextmanager
+from threading import Lock
+from time import perf_counter
+from typing import Any, Callable, ContextManager, Dict, Generator, List, Optional, Tuple
+
+from pyviews.binding.expression import ExpressionBinding
+from pyviews.core.binding import Bindable, BindingCallback, BindingError
+from pyviews.core.error import error_handling
+from pyviews.core.expression import Expression
+from pyviews.core.rendering import NodeGlobals
+from wx import EVT_IDLE, CallAfter, CallLater, EvtHandler, GetApp, IdleEvent, IsMainThread, WakeUpIdle
+
+from wxviews.core.tracing import get_tracer, span
+
+
+class RateLimiter:
+    """Computes delay keeping count of calls per second below max rate"""
+
+    def __init__(self, max_rate: Optional[float] = None, timer: Callable[[], float] = perf_counter):
+        self.max_rate: Optional[float] = max_rate
+        self._timer: Callable[[], float] = timer
+        self._last_call: Optional[float] = None
+
+    def get_delay(self) -> float:
+        """Returns seconds to wait before next call"""
+        if self.max_rate is None or self._last_call is None:
+            return 0
+        return self._last_call + 1 / self.max_rate - self._timer()
+
+    def add_call(self):
+        """Stores time of call"""
+        self._last_call = self._timer()
+
+
+class MarshalQueue:
+    """Changes of bindings made in worker threads coalesced per binding until GUI thread takes them"""
+
+    def __init__(self):
+        self._lock: Lock = Lock()
+        self._changes: Dict[int, Tuple['MarshalledExpressionBinding', bool]] = {}
+
+    @property
+    def pending(self) -> bool:
+        """True if there are changes not taken by GUI thread"""
+        return bool(self._changes)
+
+    def put(self, binding: 'MarshalledExpressionBinding', rebind: bool) -> bool:
+        """Adds binding change. Returns True if queue was empty"""
+        with self._lock:
+            key = id(binding)
+            was_empty = not self._changes
+            _, pending_rebind = self._changes.get(key, (binding, False))
+            self._changes[key] = (binding, rebind or pending_rebind)
+        return was_empty
+
+    def discard(self, binding: 'MarshalledExpressionBinding'):
+        """Removes binding change"""
+        with self._lock:
+            self._changes.pop(id(binding), None)
+
+    def take(self) -> List[Tuple['MarshalledExpressionBinding', bool]]:
+        """Removes and returns all changes"""
+        with self._lock:
+            changes, self._changes = self._changes, {}
+        return list(changes.values())
+
+
+class UpdateBatcher:
+    """
+    Collects changed bindings and updates every target once with latest value.
+    Targets are updated on next idle event, but not more often than max_fps times per second.
+    Bindings changed in worker threads are marshalled to GUI thread
+    """
+
+    def __init__(self, max_fps: Optional[float] = None, timer: Callable[[], float] = perf_counter):
+        self._limiter: RateLimiter = RateLimiter(max_fps, timer)
+        self._dirty: Dict[int, 'MarshalledExpressionBinding'] = {}
+        self._depth: int = 0
+        self._scheduled: bool = False
+        self._evt_handler: Optional[EvtHandler] = None
+        self._call_later: Optional[CallLater] = None
+        self._marshalled: MarshalQueue = MarshalQueue()
+
+    @property
+    def max_fps(self) -> Optional[float]:
+        """Max count of updates per second"""
+        return self._limiter.max_rate
+
+    @max_fps.setter
+    def max_fps(self, value: Optional[float]):
+        if value is not None and value <= 0:
+            raise ValueError('max_fps should be positive')
+        self._limiter.max_rate = value
+
+    @property
+    def batching(self) -> bool:
+        """True inside batch_updates() context"""
+        return self._depth > 0
+
+    @property
+    def dirty(self) -> int:
+        """Count of bindings waiting for update"""
+        return len(self._dirty)
+
+    def schedule(self, binding: 'MarshalledExpressionBinding'):
+        """Marks binding as changed and schedules update"""
+        self._dirty[id(binding)] = binding
+        if self._depth or self._scheduled:
+            return
+        self._scheduled = True
+        self._schedule_flush()
+
+    def discard(self, binding: 'MarshalledExpressionBinding'):
+        """Removes binding from changed bindings"""
+        self._dirty.pop(id(binding), None)
+        if self._marshalled.pending:
+            self._marshalled.discard(binding)
+
+    def marshal(self, binding: 'MarshalledExpressionBinding', rebind: bool = False):
+        """
+        Schedules update of binding changed in worker thread on GUI thread.
+        Changes are coalesced per binding until GUI thread receives them
+        """
+        if self._marshalled.put(binding, rebind):
+            CallAfter(self._receive_marshalled)
+
+    def _receive_marshalled(self):
+        for binding, rebind in self._marshalled.take():
+            if binding.bound:
+                binding.receive(rebind)
+
+    def _schedule_flush(self):
+        delay = self._limiter.get_delay()
+        if delay > 0:
+            self._call_later = CallLater(max(1, round(delay * 1000)), self.flush)
+            return
+        app = GetApp()
+        if app is None:
+            self.flush()
+            return
+        self._evt_handler = app
+        app.Bind(EVT_IDLE, self._on_idle)
+        WakeUpIdle()
+
+    def _on_idle(self, event: IdleEvent):
+        event.Skip()
+        self.flush()
+
+    def flush(self):
+        """Updates targets of changed bindings"""
+        self._cancel()
+        self._limiter.add_call()
+        self._scheduled = True
+        try:
+            while self._dirty:
+                self._dirty.pop(next(iter(self._dirty))).update()
+        finally:
+            self._scheduled = False
+            if self._dirty and not self._depth:
+                self._scheduled = True
+                self._schedule_flush()
+
+    def _cancel(self):
+        self._scheduled = False
+        if self._evt_handler is not None:
+            self._evt_handler.Unbind(EVT_IDLE, handler = self._on_idle)
+            self._evt_handler = None
+        if self._call_later is not None:
+            self._call_later.Stop()
+            self._call_later = None
+
+    @contextmanager
+    def batch(self) -> Generator['UpdateBatcher', None, None]:
+        """Defers updates of all batched expression bindings until context exit"""
+        self._depth += 1
+        try:
+            yield self
+        finally:
+            self._depth -= 1
+            if not self._depth:
+                self.flush()
+
+
+_BATCHER = UpdateBatcher()
+
+
+def get_update_batcher() -> UpdateBatcher:
+    """Returns update batcher shared by wxviews"""
+    return _BATCHER
+
+
+def batch_updates() -> ContextManager[UpdateBatcher]:
+    """Defers binding target updates made inside context. Every changed target is updated once on exit"""
+    return _BATCHER.batch()
+
+
+def _is_bindable_change(new_val: Any, old_val: Any) -> bool:
+    return isinstance(new_val, Bindable) or isinstance(old_val, Bindable)
+
+
+class MarshalledExpressionBinding(ExpressionBinding):
+    """Expression binding updating target on GUI thread. Changes made in worker threads are marshalled to GUI thread"""
+
+    @property
+    def bound(self) -> bool:
+        """True if binding is subscribed to expression changes"""
+        return bool(self._destroy_functions)
+
+    def _update_callback(self, new_val: Any, old_val: Any):
+        if IsMainThread():
+            super()._update_callback(new_val, old_val)
+        else:
+            _BATCHER.marshal(self, _is_bindable_change(new_val, old_val))
+
+    def receive(self, rebind: bool = False):
+        """Updates target with change marshalled from worker thread. Expression is bound again if rebind is True"""
+        with error_handling(BindingError, self._add_error_info):
+            if rebind:
+                self.bind()
+            else:
+                self._execute_callback()
+
+    def update(self):
+        """Updates target with expression value"""
+        with error_handling(BindingError, self._add_error_info):
+            self._execute_callback()
+
+    def _execute_callback(self):
+        if get_tracer() is None:
+            super()._execute_callback()
+            return
+        with span('ExpressionBinding', 'binding', {'expression': self._expression.code}):
+            super()._execute_callback()
+
+    def destroy(self):
+        _BATCHER.discard(self)
+        super().destroy()
+
+
+class BatchedExpressionBinding(MarshalledExpressionBinding):
+    """
+    Expression binding updating target by update batcher if binding is batched or updates are batched.
+    Changes made in worker threads are always marshalled to GUI thread
+    """
+
+    def __init__(self,
+                 callback: BindingCallback,
+                 expression: Expression,
+                 expr_vars: NodeGlobals,
+                 batched: bool = False):
+        super().__init__(callback, expression, expr_vars)
+        self._batched: bool = batched
+
+    @property
+    def batched(self) -> bool:
+        """True if target is always updated by update batcher"""
+        return self._batched
+
+    def _update_callback(self, new_val: Any, old_val: Any):
+        if IsMainThread() and (self._batched or _BATCHER.batching):
+            self.defer(_is_bindable_change(new_val, old_val))
+        else:
+            super()._update_callback(new_val, old_val)
+
+    def receive(self, rebind: bool = False):
+        self.defer(rebind)
+
+    def defer(self, rebind: bool = False):
+        """Schedules target update by update batcher. Expression is bound again if rebind is True"""
+        if rebind:
+            with error_handling(BindingError, self._add_error_info):
+                self.bind(execute_callback = False)
+        _BATCHER.schedule(self)
@@ -1,16 +1,27 @@
 """Binding based on events"""
 
+from contextlib import contextmanager
 from functools import partial
-from typing import Callable, Any, Optional, Type, cast
+from typing import Callable, Any, Iterator, NamedTuple, Optional, Type, cast
 
 from injectool import In, inject
 from pyviews.binding.binder import Binder, BindingContext
 from pyviews.binding.twoways import TwoWaysBinding
-from pyviews.binding.expression import ExpressionBinding, get_expression_callback
-from pyviews.core.binding import Binding, BindingCallback
+from pyviews.binding.expression import get_expression_callback
+from pyviews.core.binding import Binding, BindingCallback, BindingError
 from pyviews.core.expression import Expression
-from wx import Event, CommandEvent, EVT_TEXT, EVT_CHECKBOX
-from wx import EvtHandler, TextEntry, CheckBox
+from wx import Event, CommandEvent, EVT_TEXT, EVT_CHECKBOX, EVT_KILL_FOCUS, EVT_TEXT_ENTER
+from wx import CallLater, EvtHandler, TextEntry, CheckBox
+
+from wxviews.core.node import Sizerable
+from wxviews.core.plan import get_node_plan
+from wxviews.core.rendering import to_bool
+from wxviews.core.tracing import span
+from wxviews.widgets.batching import BatchedExpressionBinding, MarshalledExpressionBinding
+from wxviews.widgets.sharing import SharedBinding
+
+BINDING_NAMESPACE = 'binding'
+_MISSING = object()
 
 
 class EventBinding(Binding):
@@ -27,15 +38,28 @@ class EventBinding(Binding):
         self._event = event
         self._bound = False
         self._get_value = get_value
+        self._suppressed = False
 
     def bind(self):
         self.destroy()
         self._evt_handler.Bind(self._event, self._update_target)
         self._bound = True
 
+    @contextmanager
+    def suppress(self) -> Iterator[None]:
+        """Ignores events raised inside context"""
+        suppressed, self._suppressed = self._suppressed, True
+        try:
+            yield
+        finally:
+            self._suppressed = suppressed
+
     def _update_target(self, evt: CommandEvent):
-        value = self._get_value(evt) if self._get_value else evt.GetString()
-        self._callback(value)
+        if self._suppressed:
+            return
+        with span('EventBinding', 'binding', {'event_handler': type(self._evt_handler).__name__}):
+            value = self._get_value(evt) if self._get_value else evt.GetString()
+            self._callback(value)
 
     def destroy(self):
         if self._bound:
@@ -43,25 +67,212 @@ class EventBinding(Binding):
             self._bound = False
 
 
+class DeferredEventBinding(EventBinding):
+    """
+    Binds target to wx event deferring target updates.
+    Debounced binding updates target after no events for delay,
+    throttled binding updates target once per delay with last value.
+    Pending value is committed on kill focus and text enter events
+    """
+
+    def __init__(self,
+                 callback: BindingCallback,
+                 evt_handler: EvtHandler,
+                 event: Event,
+                 get_value: Optional[Callable[[CommandEvent], Any]] = None,
+                 debounce: int = 0,
+                 throttle: int = 0):
+        # pylint: disable=too-many-arguments,too-many-positional-arguments
+        super().__init__(callback, evt_handler, event, get_value)
+        self._debounce = debounce
+        self._throttle = throttle
+        self._pending = False
+        self._value: Any = None
+        self._timer: Optional[CallLater] = None
+
+    @property
+    def pending(self) -> bool:
+        """True if there is value not passed to target"""
+        return self._pending
+
+    def bind(self):
+        super().bind()
+        self._evt_handler.Bind(EVT_KILL_FOCUS, self._commit)
+        self._evt_handler.Bind(EVT_TEXT_ENTER, self._commit)
+
+    @contextmanager
+    def suppress(self) -> Iterator[None]:
+        """Drops pending value and ignores events raised inside context"""
+        self.cancel()
+        with super().suppress():
+            yield
+
+    def _update_target(self, evt: CommandEvent):
+        if self._suppressed:
+            return
+        self._value = self._get_value(evt) if self._get_value else evt.GetString()
+        self._pending = True
+        if self._debounce:
+            self._start_timer(self._debounce, restart = True)
+        elif self._throttle:
+            self._start_timer(self._throttle, restart = False)
+
+    def _start_timer(self, delay: int, restart: bool):
+        if self._timer is None:
+            self._timer = CallLater(delay, self.flush)
+        elif restart or not self._timer.IsRunning():
+            self._timer.Restart(delay)
+
+    def _commit(self, evt: Event):
+        evt.Skip()
+        self.flush()
+
+    def flush(self):
+        """Passes pending value to target"""
+        if self._timer is not None:
+            self._timer.Stop()
+        if self._pending:
+            self._pending = False
+            with span('EventBinding', 'binding', {'event_handler': type(self._evt_handler).__name__}):
+                self._callback(self._value)
+
+    def cancel(self):
+        """Drops pending value"""
+        if self._timer is not None:
+            self._timer.Stop()
+        self._pending = False
+
+    def destroy(self):
+        if self._bound:
+            self._evt_handler.Unbind(EVT_KILL_FOCUS, handler = self._commit)
+            self._evt_handler.Unbind(EVT_TEXT_ENTER, handler = self._commit)
+        self.cancel()
+        self._timer = None
+        super().destroy()
+
+
+class BindingOptions(NamedTuple):
+    """
+    Options of binding updates. Delays are in milliseconds.
+    Committed binding updates expression only on kill focus and text enter events.
+    Batched binding updates target by update batcher.
+    Shared binding evaluates expression once for bindings with the same expression and scope
+    """
+    debounce: int = 0
+    throttle: int = 0
+    commit: bool = False
+    batch: bool = False
+    share: bool = False
+
+
+_DEFAULT_OPTIONS = BindingOptions()
+
+
+def get_binding_options(context: BindingContext) -> BindingOptions:
+    """
+    Returns binding options passed by rule with 'binding_options' key
+    or set by node attributes with 'binding' namespace
+    """
+    options = context.get('binding_options')
+    if options is not None:
+        return options
+    node = context.node
+    plan = get_node_plan(node.xml_node)
+    attrs = plan.get_attrs(BINDING_NAMESPACE)
+    if not attrs:
+        return _DEFAULT_OPTIONS
+    values = {attr.name: plan.get_value(attr, node.node_globals) for attr in attrs}
+    unknown = sorted(values.keys() - set(BindingOptions._fields))
+    if unknown:
+        raise BindingError(f'Unknown binding options: {", ".join(unknown)}')
+    try:
+        options = BindingOptions(int(values.get('debounce', 0)), int(values.get('throttle', 0)),
+                                 to_bool(values.get('commit', False)), to_bool(values.get('batch', False)),
+                                 to_bool(values.get('share', False)))
+    except ValueError as error:
+        raise BindingError(f'Binding option is not valid: {error}') from error
+    if options.debounce < 0 or options.throttle < 0:
+        raise BindingError('Binding delay should not be negative')
+    if options.debounce and options.throttle:
+        raise BindingError('Binding can not be debounced and throttled at the same time')
+    return options
+
+
+def create_event_binding(callback: BindingCallback,
+                         evt_handler: EvtHandler,
+                         event: Event,
+                         options: BindingOptions,
+                         get_value: Optional[Callable[[CommandEvent], Any]] = None) -> EventBinding:
+    """Returns event binding deferring target updates if options require it"""
+    if not (options.debounce or options.throttle or options.commit):
+        return EventBinding(callback, evt_handler, event, get_value)
+    if options.commit:
+        return DeferredEventBinding(callback, evt_handler, event, get_value)
+    return DeferredEventBinding(callback, evt_handler, event, get_value, options.debounce, options.throttle)
+
+
 @inject(binder=Binder)
 def use_events_binding(binder: Binder = In):
-    """Adds twoways binding rules"""
+    """Adds oneway and twoways binding rules"""
+    binder.add_rule('oneway', bind_setter_to_marshalled_expression)
+    binder.add_rule('oneway', bind_setter_to_batched_expression, check_wx_node)
     binder.add_rule('twoways', bind_text_and_expression,
                     lambda ctx: check_control_and_property(cast(Type[EvtHandler], TextEntry), ctx))
     binder.add_rule('twoways', bind_check_and_expression,
                     lambda ctx: check_control_and_property(CheckBox, ctx))
 
 
+def get_control_callback(context: BindingContext, value_binding: EventBinding) -> Callable[[Any], None]:
+    """
+    Returns callback updating control property from expression.
+    Equal value is not set and events raised by setter are not passed back to expression
+    """
+    node, name, setter = context.node, context.xml_attr.name, context.setter
+
+    def _update_control(value: Any):
+        if getattr(node.instance, name, _MISSING) == value:
+            return
+        with value_binding.suppress():
+            setter(node, name, value)
+
+    return _update_control
+
+
+def bind_setter_to_marshalled_expression(context: BindingContext) -> Binding:
+    """Binds setter to expression result. Changes made in worker threads are applied on GUI thread"""
+    callback = partial(context.setter, context.node, context.xml_attr.name)
+    binding = MarshalledExpressionBinding(callback, Expression(context.expression_body), context.node.node_globals)
+    binding.bind()
+    return binding
+
+
+def bind_setter_to_batched_expression(context: BindingContext) -> Binding:
+    """
+    Binds setter to expression result. Setter is called by update batcher if binding is batched.
+    Expression is evaluated once for bindings with the same expression and scope if binding is shared
+    """
+    callback = partial(context.setter, context.node, context.xml_attr.name)
+    options = get_binding_options(context)
+    if options.share and not options.batch:
+        binding = SharedBinding(callback, context.expression_body, context.node.node_globals)
+    else:
+        binding = BatchedExpressionBinding(callback, Expression(context.expression_body), context.node.node_globals,
+                                           options.batch)
+    binding.bind()
+    return binding
+
+
 def bind_text_and_expression(context: BindingContext) -> TwoWaysBinding:
     """Binds expression and text entry by EVT_TEXT event"""
     property_expression = Expression(context.expression_body)
 
-    value_callback = partial(context.setter, context.node, context.xml_attr.name)
-    expression_binding = ExpressionBinding(value_callback, property_expression,
-                                           context.node.node_globals)
-
     expression_callback = get_expression_callback(property_expression, context.node.node_globals)
-    value_binding = EventBinding(expression_callback, context.node.instance, EVT_TEXT)
+    options = get_binding_options(context)
+    value_binding = create_event_binding(expression_callback, context.node.instance, EVT_TEXT, options)
+
+    value_callback = get_control_callback(context, value_binding)
+    expression_binding = BatchedExpressionBinding(value_callback, property_expression,
+                                                  context.node.node_globals, options.batch)
 
     two_ways_binding = TwoWaysBinding(expression_binding, value_binding)
     two_ways_binding.bind()
@@ -72,19 +283,24 @@ def bind_check_and_expression(context: BindingContext) -> TwoWaysBinding:
     """Binds expression and text entry by EVT_TEXT event"""
     property_expression = Expression(context.expression_body)
 
-    value_callback = partial(context.setter, context.node, context.xml_attr.name)
-    expression_binding = ExpressionBinding(value_callback, property_expression,
-                                           context.node.node_globals)
-
     expression_callback = get_expression_callback(property_expression, context.node.node_globals)
     value_binding = EventBinding(expression_callback, context.node.instance,
                                  EVT_CHECKBOX, lambda evt: evt.IsChecked())
 
+    value_callback = get_control_callback(context, value_binding)
+    expression_binding = BatchedExpressionBinding(value_callback, property_expression,
+                                                  context.node.node_globals, get_binding_options(context).batch)
+
     two_ways_binding = TwoWaysBinding(expression_binding, value_binding)
     two_ways_binding.bind()
     return two_ways_binding
 
 
+def check_wx_node(context: BindingContext) -> bool:
+    """Returns True if binding target is wx widget or sizer node"""
+    return isinstance(context.node, Sizerable)
+
+
 def check_control_and_property(control_type: Type[EvtHandler], context: BindingContext) -> bool:
     """
     Returns True if passed control type equals xml attribute type
@@ -0,0 +1,102 @@
+"""Pool of widgets reused after node destroy"""
+
+from collections import OrderedDict
+from typing import Any, Hashable, Optional, Tuple, Type
+
+from injectool import DependencyError, add_singleton, resolve
+from pyviews.core.xml import XmlNode
+from wx import TopLevelWindow, Window
+
+DEFAULT_POOL_SIZE = 64
+
+PoolKey = Tuple[Type, int, int, Hashable]
+
+
+class WidgetPool:
+    """Stores hidden widgets by widget type, parent and init args. Least recently stored widgets are destroyed"""
+
+    def __init__(self, max_size: int = DEFAULT_POOL_SIZE):
+        self._max_size: int = max_size
+        self._widgets: 'OrderedDict[int, Tuple[PoolKey, Window]]' = OrderedDict()
+
+    @property
+    def max_size(self) -> int:
+        """Max count of stored widgets"""
+        return self._max_size
+
+    @property
+    def size(self) -> int:
+        """Count of stored widgets"""
+        return len(self._widgets)
+
+    def put(self, key: PoolKey, widget: Window) -> bool:
+        """Detaches widget from sizer, hides it and stores to pool"""
+        if self._max_size <= 0 or not _is_alive(widget):
+            return False
+        sizer = widget.GetContainingSizer()
+        if sizer is not None:
+            sizer.Detach(widget)
+        widget.Hide()
+        self._widgets[id(widget)] = (key, widget)
+        while len(self._widgets) > self._max_size:
+            _, (_, evicted) = self._widgets.popitem(last = False)
+            _destroy(evicted)
+        return True
+
+    def take(self, key: PoolKey, parent: Window) -> Optional[Window]:
+        """Returns stored widget for key or None"""
+        found = [widget_id for widget_id, (widget_key, _) in reversed(self._widgets.items()) if widget_key == key]
+        for widget_id in found:
+            _, widget = self._widgets.pop(widget_id)
+            if _is_alive(widget) and widget.GetParent() is parent:
+                widget.Show()
+                return widget
+            _destroy(widget)
+        return None
+
+    def clear(self):
+        """Destroys stored widgets"""
+        widgets, self._widgets = self._widgets, OrderedDict()
+        for _, widget in widgets.values():
+            _destroy(widget)
+
+
+def _is_alive(widget: Window) -> bool:
+    try:
+        return not widget.IsBeingDeleted()
+    except RuntimeError:
+        return False
+
+
+def _destroy(widget: Window):
+    try:
+        widget.Destroy()
+    except RuntimeError:
+        pass
+
+
+def get_pool_key(inst_type: Type, parent: Any, xml_node: XmlNode, args: dict) -> Optional[PoolKey]:
+    """Returns pool key for widget or None if widget can't be pooled"""
+    if parent is None or not issubclass(inst_type, Window) or issubclass(inst_type, TopLevelWindow):
+        return None
+    try:
+        args_key = tuple(sorted(args.items()))
+        hash(args_key)
+    except TypeError:
+        return None
+    return inst_type, id(parent), id(xml_node), args_key
+
+
+def use_widget_pool(max_size: int = DEFAULT_POOL_SIZE) -> WidgetPool:
+    """Registers widget pool used by wx pipeline"""
+    pool = WidgetPool(max_size)
+    add_singleton(WidgetPool, pool)
+    return pool
+
+
+def get_widget_pool() -> Optional[WidgetPool]:
+    """Returns registered widget pool"""
+    try:
+        return resolve(WidgetPool)
+    except DependencyError:
+        return None
@@ -1,17 +1,22 @@
 """Rendering pipeline for WidgetNode"""
 
-from typing import Callable, Optional
+from typing import Callable, List, Optional, Tuple
 
 from pyviews.core.rendering import InstanceNode, NodeGlobals
 from pyviews.core.xml import XmlNode
 from pyviews.pipes import render_children
-from pyviews.rendering.pipeline import RenderingPipeline, get_type
+from pyviews.rendering.pipeline import RenderingPipeline
 from wx import Event, PyEventBinder
 from wx.py.dispatcher import Any
 
+from wxviews.core.globals import ChildGlobals
+from wxviews.core.layout import render_transaction
 from wxviews.core.node import Sizerable
 from wxviews.core.pipes import add_to_sizer, apply_attributes
+from wxviews.core.plan import get_node_type
+from wxviews.core.progressive import cancel, render_children_progressively
 from wxviews.core.rendering import WxRenderingContext, get_attr_args
+from wxviews.widgets.pool import PoolKey, get_pool_key, get_widget_pool
 
 
 class WxNode(InstanceNode, Sizerable):
@@ -22,59 +27,93 @@ class WxNode(InstanceNode, Sizerable):
     def __init__(self, instance, xml_node: XmlNode, node_globals: Optional[NodeGlobals] = None):
         InstanceNode.__init__(self, instance, xml_node, node_globals = node_globals)
         Sizerable.__init__(self)
+        self._handlers: List[Tuple[PyEventBinder, Callable[[Event], None], dict]] = []
+        self._pool_key: Optional[PoolKey] = None
 
     @property
     def sizer_item(self) -> Any:
         return self._instance
 
+    @property
+    def pool_key(self) -> Optional[PoolKey]:
+        """Key used to store instance to widget pool"""
+        return self._pool_key
+
+    @pool_key.setter
+    def pool_key(self, value: Optional[PoolKey]):
+        self._pool_key = value
+
     def bind(self, event: PyEventBinder, handler: Callable[[Event], None], **args):
         """Binds handler to event"""
         self.instance.Bind(event, handler, **args)
+        self._handlers.append((event, handler, args))
+
+    def unbind_all(self):
+        """Unbinds handlers bound by bind()"""
+        for event, handler, args in self._handlers:
+            self.instance.Unbind(event, handler = handler, **args)
+        self._handlers = []
 
     def destroy(self):
+        cancel(self)
         super().destroy()
-        self.instance.Destroy()
+        pool = get_widget_pool() if self._pool_key else None
+        if pool is None:
+            self.instance.Destroy()
+            return
+        self.unbind_all()
+        if not pool.put(self._pool_key, self.instance):
+            self.instance.Destroy()
 
 
 def get_wx_pipeline() -> RenderingPipeline:
     """Returns rendering pipeline for WidgetNode"""
     return RenderingPipeline(
-        pipes = [apply_attributes, add_to_sizer, render_wx_children], create_node = _create_widget_node
+        pipes = [apply_attributes, add_to_sizer, render_wx_children], create_node = create_widget_node
     )
 
 
-def _create_widget_node(context: WxRenderingContext) -> WxNode:
-    inst_type = get_type(context.xml_node)
+def create_widget_node(context: WxRenderingContext) -> WxNode:
+    """Creates widget node. Widget is taken from widget pool if it is used"""
+    inst_type = get_node_type(context.xml_node)
     args = get_attr_args(context.xml_node, 'init', context.node_globals)
-    inst = inst_type(context.parent, **args)
-    return WxNode(inst, context.xml_node, node_globals = context.node_globals)
+    pool = get_widget_pool()
+    pool_key = get_pool_key(inst_type, context.parent, context.xml_node, args) if pool else None
+    inst = pool.take(pool_key, context.parent) if pool_key else None
+    if inst is None:
+        inst = inst_type(context.parent, **args)
+    node = WxNode(inst, context.xml_node, node_globals = context.node_globals)
+    node.pool_key = pool_key
+    return node
 
 
 def render_wx_children(node: WxNode, context: WxRenderingContext):
     """Renders WidgetNode children"""
-    render_children(
-        node,
-        context,
-        lambda xn,
-        n,
-        ctx: WxRenderingContext({
-            'parent': n.instance, 'parent_node': n, 'node_globals': NodeGlobals(n.node_globals), 'xml_node': xn
-        })
-    )
+    with render_transaction(node.instance):
+        render_children_progressively(
+            node,
+            context,
+            lambda xn,
+            n,
+            ctx: ctx.derive(parent = n.instance,
+                            parent_node = n,
+                            node_globals = ChildGlobals(n.node_globals),
+                            xml_node = xn)
+        )
 
 
 def get_frame_pipeline():
     """Returns rendering pipeline for Frame"""
     return RenderingPipeline(
         pipes = [apply_attributes, render_wx_children, lambda node, ctx: node.instance.Show()],
-        create_node = _create_widget_node
+        create_node = create_widget_node
     )
 
 
 def get_app_pipeline():
     """Returns rendering pipeline for App"""
     return RenderingPipeline(
-        pipes = [store_root, apply_attributes, render_app_children, ], create_node = _create_widget_node
+        pipes = [store_root, apply_attributes, render_app_children, ], create_node = create_widget_node
     )
 
 
@@ -90,9 +129,7 @@ def render_app_children(node: WxNode, context: WxRenderingContext):
         context,
         lambda x,
         n,
-        ctx: WxRenderingContext({
-            'xml_node': x, 'parent_node': n, 'node_globals': NodeGlobals(node.node_globals)
-        })
+        ctx: ctx.derive(xml_node = x, parent_node = n, node_globals = ChildGlobals(node.node_globals))
     )
 
 
@@ -6,6 +6,8 @@ import wx
 from wx import Event, Sizer
 from wx._core import wxAssertionError
 
+from wxviews.core.layout import layout
+from wxviews.core.tracing import span
 from wxviews.widgets.rendering import WxNode
 
 
@@ -25,8 +27,9 @@ def show(node: WxNode, key: str, value: bool):
         sizer: Sizer = node.node_globals[key]
         if value is None or value == sizer.IsShown(node.instance):
             return
-        sizer.Show(node.instance, show=value)
-        sizer.Layout()
+        with span('show', 'layout', {'value': value}):
+            sizer.Show(node.instance, show=value)
+            layout(sizer)
     except wxAssertionError:
         sizer: Sizer = node.node_globals[key]
         wx.CallAfter(_show, sizer, node.instance, value)
@@ -34,4 +37,4 @@ def show(node: WxNode, key: str, value: bool):
 
 def _show(sizer: Sizer, instance: Any, value: bool):
     sizer.Show(instance, show=value)
-    sizer.Layout()
+    layout(sizer)
@@ -0,0 +1,123 @@
+"""Shared evaluation of bound expressions"""
+
+from typing import Any, Collection, Dict, List, Optional, Tuple
+
+from pyviews.core.binding import BindableDict, Binding, BindingCallback
+from pyviews.core.expression import Expression
+
+from wxviews.core.expressions import get_names
+from wxviews.core.globals import get_scope, get_shadowing_globals
+from wxviews.widgets.batching import BatchedExpressionBinding
+
+SharedKey = Tuple[str, int]
+
+
+class SharedExpression:
+    """Expression evaluated once for all bindings with the same expression body and scope"""
+
+    def __init__(self, key: SharedKey, body: str, scope: dict):
+        self._key: SharedKey = key
+        self._scope: dict = scope
+        self._targets: List['SharedBinding'] = []
+        self._value: Any = None
+        self._binding: BatchedExpressionBinding = BatchedExpressionBinding(self._update_targets, Expression(body),
+                                                                           scope)
+
+    @property
+    def scope(self) -> dict:
+        """Globals used to evaluate expression"""
+        return self._scope
+
+    @property
+    def targets(self) -> int:
+        """Count of bound targets"""
+        return len(self._targets)
+
+    def add(self, target: 'SharedBinding'):
+        """Adds target and passes expression value to it"""
+        self._targets.append(target)
+        if len(self._targets) > 1:
+            target.update(self._value)
+            return
+        try:
+            self._binding.bind()
+        except BaseException:
+            self.remove(target)
+            raise
+
+    def remove(self, target: 'SharedBinding'):
+        """Removes target. Expression is unbound when there are no targets"""
+        if target in self._targets:
+            self._targets.remove(target)
+        if not self._targets:
+            self._binding.destroy()
+            if _SHARED.get(self._key) is self:
+                del _SHARED[self._key]
+
+    def _update_targets(self, value: Any):
+        self._value = value
+        for target in list(self._targets):
+            target.update(value)
+
+
+_SHARED: Dict[SharedKey, SharedExpression] = {}
+
+
+def get_shared_expression(body: str, node_globals: dict) -> SharedExpression:
+    """Returns shared expression for expression body and scope of passed globals"""
+    scope = get_scope(node_globals, get_names(body))
+    key = (body, id(scope))
+    try:
+        return _SHARED[key]
+    except KeyError:
+        shared = _SHARED[key] = SharedExpression(key, body, scope)
+        return shared
+
+
+class SharedBinding(Binding):
+    """
+    Binds callback to expression evaluated once for bindings with the same expression body and scope.
+    Binding is moved to another shared expression if used name is set to globals between node globals and scope
+    """
+
+    def __init__(self, callback: BindingCallback, body: str, node_globals: dict):
+        super().__init__()
+        self._callback: BindingCallback = callback
+        self._body: str = body
+        self._names: Collection[str] = ()
+        self._node_globals: dict = node_globals
+        self._shared: Optional[SharedExpression] = None
+        self._shadowing: List[dict] = []
+
+    @property
+    def shared(self) -> Optional[SharedExpression]:
+        """Bound shared expression"""
+        return self._shared
+
+    def bind(self):
+        self.destroy()
+        self._names = get_names(self._body)
+        self._shared = get_shared_expression(self._body, self._node_globals)
+        self._shared.add(self)
+        self._shadowing = get_shadowing_globals(self._node_globals, self._names)
+        for node_globals in self._shadowing:
+            BindableDict.observe_all(node_globals, self._shadowing_changed)
+
+    def _shadowing_changed(self, key: Any, _: Any, __: Any):
+        if key in self._names:
+            self.bind()
+
+    def update(self, value: Any):
+        """Passes expression value to callback. Binding is moved to another shared expression if scope is changed"""
+        if self._shared is not None and get_scope(self._node_globals, self._names) is not self._shared.scope:
+            self.bind()
+            return
+        self._callback(value)
+
+    def destroy(self):
+        for node_globals in self._shadowing:
+            node_globals.release_all(self._shadowing_changed)
+        self._shadowing = []
+        if self._shared is not None:
+            shared, self._shared = self._shared, None
+            shared.remove(self)
@@ -0,0 +1,335 @@
+from threading import Thread, current_thread, main_thread
+from unittest.mock import Mock, call, patch
+
+from pytest import fixture, mark, raises
+from pyviews.core.binding import BindableEntity
+from pyviews.core.expression import Expression
+from pyviews.core.rendering import NodeGlobals
+from wx import EVT_IDLE
+
+from wxviews.widgets import batching
+from wxviews.widgets.batching import BatchedExpressionBinding, UpdateBatcher, batch_updates, get_update_batcher
+
+
+class Clock:
+    """Fake timer"""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+@fixture
+def batcher_fixture(request):
+    with patch(batching.__name__ + '.GetApp') as get_app:
+        with patch(batching.__name__ + '.CallLater') as call_later:
+            request.cls.app = get_app.return_value
+            request.cls.get_app = get_app
+            request.cls.call_later = call_later
+            request.cls.clock = Clock()
+            yield
+
+
+@mark.usefixtures(batcher_fixture.__name__)
+class UpdateBatcherTests:
+    """UpdateBatcher tests"""
+
+    app: Mock
+    get_app: Mock
+    call_later: Mock
+    clock: Clock
+
+    def _idle(self):
+        self.app.Bind.call_args[0][1](Mock())
+
+    def test_updates_on_idle(self):
+        """should update every changed binding once on idle"""
+        batcher = UpdateBatcher(timer = self.clock)
+        one, two = Mock(), Mock()
+
+        batcher.schedule(one)
+        batcher.schedule(two)
+        batcher.schedule(one)
+
+        assert batcher.dirty == 2
+        assert self.app.Bind.call_count == 1
+        assert self.app.Bind.call_args[0][0] == EVT_IDLE
+        assert not one.update.called
+
+        self._idle()
+
+        assert one.update.call_count == 1
+        assert two.update.call_count == 1
+        assert batcher.dirty == 0
+        assert self.app.Unbind.call_args[0][0] == EVT_IDLE
+
+    def test_wakes_up_idle(self):
+        """should request idle event after idle update is scheduled"""
+        batcher = UpdateBatcher(timer = self.clock)
+
+        with patch(batching.__name__ + '.WakeUpIdle') as wake_up_idle:
+            batcher.schedule(Mock())
+
+        assert wake_up_idle.call_count == 1
+
+    def test_updates_without_app(self):
+        """should update binding immediately if there is no application"""
+        self.get_app.return_value = None
+        batcher = UpdateBatcher(timer = self.clock)
+        binding = Mock()
+
+        batcher.schedule(binding)
+
+        assert binding.update.called
+
+    def test_updates_bindings_changed_by_update(self):
+        """should update bindings changed while other bindings are updated"""
+        batcher = UpdateBatcher(timer = self.clock)
+        one, two = Mock(), Mock()
+        one.update.side_effect = lambda: batcher.schedule(two)
+        batcher.schedule(one)
+
+        self._idle()
+
+        assert two.update.called
+        assert self.app.Bind.call_count == 1
+
+    def test_limits_updates_rate(self):
+        """should not update bindings more often than max_fps"""
+        batcher = UpdateBatcher(max_fps = 20, timer = self.clock)
+        batcher.schedule(Mock())
+        self._idle()
+
+        self.clock.now = 0.02
+        binding = Mock()
+        batcher.schedule(binding)
+
+        assert self.app.Bind.call_count == 1
+        assert self.call_later.call_args == call(30, batcher.flush)
+
+        self.clock.now = 0.05
+        batcher.flush()
+
+        assert binding.update.called
+        assert self.call_later.return_value.Stop.called
+
+    def test_updates_on_idle_after_frame(self):
+        """should update bindings on idle if frame time is passed"""
+        batcher = UpdateBatcher(max_fps = 20, timer = self.clock)
+        batcher.schedule(Mock())
+        self._idle()
+        self.clock.now = 0.06
+
+        batcher.schedule(Mock())
+
+        assert self.app.Bind.call_count == 2
+        assert not self.call_later.called
+
+    @staticmethod
+    @mark.parametrize('max_fps', [0, -1])
+    def test_max_fps_raises(max_fps):
+        """should raise ValueError for not positive max_fps"""
+        with raises(ValueError):
+            UpdateBatcher().max_fps = max_fps
+
+    def test_discard(self):
+        """should not update discarded binding"""
+        batcher = UpdateBatcher(timer = self.clock)
+        binding = Mock()
+        batcher.schedule(binding)
+
+        batcher.discard(binding)
+        self._idle()
+
+        assert not binding.update.called
+
+    def test_batch(self):
+        """should update bindings on exit of outer batch context"""
+        batcher = UpdateBatcher(timer = self.clock)
+        binding = Mock()
+
+        with batcher.batch():
+            with batcher.batch():
+                batcher.schedule(binding)
+            assert batcher.batching
+            assert not binding.update.called
+
+        assert binding.update.call_count == 1
+        assert not batcher.batching
+        assert not self.app.Bind.called
+
+    def test_batch_cancels_idle_update(self):
+        """should update scheduled bindings on batch exit"""
+        batcher = UpdateBatcher(timer = self.clock)
+        binding = Mock()
+        batcher.schedule(binding)
+
+        with batcher.batch():
+            pass
+
+        assert binding.update.call_count == 1
+        assert self.app.Unbind.called
+
+    def test_reschedules_after_error(self):
+        """should schedule not updated bindings if update raises error"""
+        batcher = UpdateBatcher(timer = self.clock)
+        one, two = Mock(), Mock()
+        one.update.side_effect = ValueError()
+        batcher.schedule(one)
+        batcher.schedule(two)
+
+        with raises(ValueError):
+            self._idle()
+
+        assert batcher.dirty == 1
+        assert self.app.Bind.call_count == 2
+
+    def test_marshal(self):
+        """should post one call to GUI thread and update every marshalled binding once"""
+        batcher = UpdateBatcher(timer = self.clock)
+        one, two = Mock(), Mock()
+        with patch(batching.__name__ + '.CallAfter') as call_after:
+            batcher.marshal(one)
+            batcher.marshal(two, True)
+            batcher.marshal(one, True)
+            batcher.marshal(two)
+
+            assert call_after.call_count == 1
+            assert not one.receive.called
+
+            call_after.call_args[0][0]()
+            batcher.marshal(one)
+
+            assert call_after.call_count == 2
+
+        assert one.receive.call_args_list == [call(True)]
+        assert two.receive.call_args_list == [call(True)]
+
+    def test_marshal_skips_discarded_binding(self):
+        """should not update binding discarded or destroyed before GUI thread received it"""
+        batcher = UpdateBatcher(timer = self.clock)
+        discarded, destroyed = Mock(), Mock()
+        destroyed.bound = False
+        with patch(batching.__name__ + '.CallAfter') as call_after:
+            batcher.marshal(discarded)
+            batcher.marshal(destroyed)
+            batcher.discard(discarded)
+
+            call_after.call_args[0][0]()
+
+        assert not discarded.receive.called
+        assert not destroyed.receive.called
+
+
+class ViewModel(BindableEntity):
+
+    def __init__(self):
+        super().__init__()
+        self.value = 0
+        self.child = None
+
+
+@fixture
+def batched_binding_fixture(request):
+    with patch(batching.__name__ + '.GetApp') as get_app:
+        request.cls.vm = ViewModel()
+        request.cls.callback = Mock()
+        yield get_app
+    get_update_batcher().flush()
+
+
+@mark.usefixtures(batched_binding_fixture.__name__)
+class BatchedExpressionBindingTests:
+    """BatchedExpressionBinding tests"""
+
+    vm: ViewModel
+    callback: Mock
+
+    def _bind(self, expression: str = 'vm.value', batched: bool = False) -> BatchedExpressionBinding:
+        binding = BatchedExpressionBinding(self.callback, Expression(expression), NodeGlobals({'vm': self.vm}),
+                                           batched)
+        binding.bind()
+        self.callback.reset_mock()
+        return binding
+
+    def test_updates_target_immediately(self):
+        """should update target on every change if binding is not batched"""
+        self._bind()
+
+        for value in range(1, 4):
+            self.vm.value = value
+
+        assert self.callback.call_args_list == [call(1), call(2), call(3)]
+
+    def test_batched(self):
+        """should update target once with latest value if binding is batched"""
+        self._bind(batched = True)
+
+        for value in range(1, 4):
+            self.vm.value = value
+
+        assert not self.callback.called
+
+        get_update_batcher().flush()
+
+        assert self.callback.call_args_list == [call(3)]
+
+    def test_batch_updates(self):
+        """should update not batched binding once on batch exit"""
+        self._bind()
+
+        with batch_updates():
+            for value in range(1, 4):
+                self.vm.value = value
+            assert not self.callback.called
+
+        assert self.callback.call_args_list == [call(3)]
+
+    def test_rebinds_bindable_change(self):
+        """should subscribe to new bindable value"""
+        self.vm.child = ViewModel()
+        self._bind('vm.child.value', batched = True)
+
+        self.vm.child = ViewModel()
+        get_update_batcher().flush()
+        self.callback.reset_mock()
+        self.vm.child.value = 5
+        get_update_batcher().flush()
+
+        assert self.callback.call_args_list == [call(5)]
+
+    def test_marshals_worker_thread_changes(self):
+        """should update target once on GUI thread with latest value changed in worker thread"""
+        self._bind()
+        with patch(batching.__name__ + '.IsMainThread', lambda: current_thread() is main_thread()):
+            with patch(batching.__name__ + '.CallAfter') as call_after:
+                threads = [Thread(target = self._set_values, args = (index * 100, )) for index in range(4)]
+                for thread in threads:
+                    thread.start()
+                for thread in threads:
+                    thread.join()
+
+                assert not self.callback.called
+                assert call_after.call_count == 1
+
+                call_after.call_args[0][0]()
+                get_update_batcher().flush()
+
+        assert self.callback.call_count == 1
+        assert self.callback.call_args == call(self.vm.value)
+
+    def _set_values(self, start: int):
+        for value in range(start, start + 100):
+            self.vm.value = value
+
+    def test_destroy(self):
+        """should not update destroyed binding"""
+        binding = self._bind(batched = True)
+        self.vm.value = 1
+
+        binding.destroy()
+        get_update_batcher().flush()
+
+        assert not self.callback.called
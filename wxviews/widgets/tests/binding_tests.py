@@ -1,16 +1,26 @@
-from unittest.mock import Mock, call
+from threading import Thread, current_thread, main_thread
+from unittest.mock import Mock, call, patch
 
-from pytest import fixture, mark
-from pyviews.binding.binder import BindingContext
+from pytest import fixture, mark, raises
+from pyviews.binding.binder import Binder, BindingContext
 from pyviews.binding.twoways import TwoWaysBinding
-from pyviews.core.binding import BindableEntity
+from pyviews.core.binding import BindableEntity, BindingError
 from pyviews.core.rendering import Node, NodeGlobals
-from pyviews.core.xml import XmlAttr
+from pyviews.core.xml import XmlAttr, XmlNode
 from pyviews.pipes import call_set_attr
-from wx import EVT_CHECKBOX, EVT_TEXT, CheckBox, TextCtrl
-
-from wxviews.widgets.binding import (EventBinding, bind_check_and_expression, bind_text_and_expression,
-                                     check_control_and_property)
+from wx import EVT_CHECKBOX, EVT_KILL_FOCUS, EVT_TEXT, EVT_TEXT_ENTER, CheckBox, TextCtrl
+
+from wxviews.containers import For, If
+from wxviews.core.tracing import tracing
+from wxviews.widgets import batching
+from wxviews.widgets import binding as binding_module
+from wxviews.widgets.batching import BatchedExpressionBinding, MarshalledExpressionBinding, get_update_batcher
+from wxviews.widgets.sharing import SharedBinding
+from wxviews.widgets.binding import (BINDING_NAMESPACE, BindingOptions, DeferredEventBinding, EventBinding,
+                                     bind_check_and_expression, bind_setter_to_batched_expression,
+                                     bind_text_and_expression, check_control_and_property, check_wx_node,
+                                     create_event_binding, get_binding_options, use_events_binding)
+from wxviews.sizers import SizerNode
 from wxviews.widgets.rendering import WxNode
 
 
@@ -19,14 +29,19 @@ class EventHandlerStub:
     def __init__(self, event):
         self._handler = None
         self._event = event
+        self.handlers = {}
 
     def Bind(self, event, handler):
         if event == self._event:
             self._handler = handler
+        else:
+            self.handlers[event] = handler
 
     def Unbind(self, event, handler = None):
         if event == self._event and self._handler == handler:
             self._handler = None
+        elif self.handlers.get(event) == handler:
+            del self.handlers[event]
 
 
 class TextEntryStub(EventHandlerStub, TextCtrl):
@@ -51,6 +66,25 @@ class TextEntryStub(EventHandlerStub, TextCtrl):
             self._handler(event)
 
 
+class EchoTextEntryStub(TextEntryStub):
+    """Raises text event when value is set like TextEntry.SetValue"""
+
+    @property
+    def Value(self):
+        return self._value
+
+    @Value.setter
+    def Value(self, value):
+        self._value = value
+        if self._handler is not None:
+            event = Mock()
+            event.GetString.side_effect = lambda: value
+            self._handler(event)
+
+    def ChangeValue(self, value):
+        self.Value = value
+
+
 class CheckBoxStub(EventHandlerStub, CheckBox):
 
     def __init__(self):
@@ -118,6 +152,194 @@ class EventBindingTests:
         evt_handler.ChangeValue(value)
         assert not target.on_change.called
 
+    @staticmethod
+    def test_suppress():
+        """should ignore events raised inside suppress() context"""
+        callback, evt_handler = Mock(), TextEntryStub()
+        binding = EventBinding(callback, evt_handler, EVT_TEXT)
+        binding.bind()
+
+        with binding.suppress():
+            evt_handler.ChangeValue('one')
+        evt_handler.ChangeValue('two')
+
+        assert callback.call_args_list == [call('two')]
+
+    @staticmethod
+    def test_traces_update():
+        """should record span of target update"""
+        evt_handler = TextEntryStub()
+        binding = EventBinding(Mock(), evt_handler, EVT_TEXT)
+        binding.bind()
+
+        with tracing() as tracer:
+            evt_handler.ChangeValue('value')
+
+        assert [event['name'] for event in tracer.events] == ['EventBinding']
+
+
+@fixture
+def deferred_binding_fixture(request):
+    with patch(binding_module.__name__ + '.CallLater') as call_later:
+        request.cls.call_later = call_later
+        request.cls.callback = Mock()
+        request.cls.evt_handler = TextEntryStub()
+        yield
+
+
+@mark.usefixtures('deferred_binding_fixture')
+class DeferredEventBindingTests:
+    """DeferredEventBinding class tests"""
+
+    call_later: Mock
+    callback: Mock
+    evt_handler: TextEntryStub
+
+    def _bind(self, **delays) -> DeferredEventBinding:
+        binding = DeferredEventBinding(self.callback, self.evt_handler, EVT_TEXT, **delays)
+        binding.bind()
+        return binding
+
+    def _fire_timer(self):
+        self.call_later.call_args[0][1]()
+
+    def test_debounces_updates(self):
+        """should pass last value after delay restarted by every event"""
+        binding = self._bind(debounce = 300)
+
+        for value in ['o', 'on', 'one']:
+            self.evt_handler.ChangeValue(value)
+
+        assert not self.callback.called
+        assert binding.pending
+        assert self.call_later.call_args == call(300, binding.flush)
+        assert self.call_later.return_value.Restart.call_args_list == [call(300), call(300)]
+
+        self._fire_timer()
+
+        assert self.callback.call_args_list == [call('one')]
+        assert not binding.pending
+
+    def test_throttles_updates(self):
+        """should pass last value once per delay"""
+        binding = self._bind(throttle = 300)
+        self.call_later.return_value.IsRunning.return_value = True
+
+        for value in ['o', 'on', 'one']:
+            self.evt_handler.ChangeValue(value)
+        self._fire_timer()
+
+        assert self.call_later.call_count == 1
+        assert not self.call_later.return_value.Restart.called
+        assert self.callback.call_args_list == [call('one')]
+        assert not binding.pending
+
+    @mark.parametrize('event', [EVT_KILL_FOCUS, EVT_TEXT_ENTER])
+    def test_commits_pending_value(self, event):
+        """should pass pending value on kill focus and text enter"""
+        binding = self._bind()
+        evt = Mock()
+
+        self.evt_handler.ChangeValue('one')
+        self.evt_handler.ChangeValue('two')
+        assert not self.callback.called
+
+        self.evt_handler.handlers[event](evt)
+
+        assert self.callback.call_args_list == [call('two')]
+        assert evt.Skip.called
+        assert not binding.pending
+        assert not self.call_later.called
+
+    def test_suppress(self):
+        """should drop pending value and ignore events raised inside suppress() context"""
+        binding = self._bind(debounce = 300)
+        self.evt_handler.ChangeValue('one')
+
+        with binding.suppress():
+            self.evt_handler.ChangeValue('two')
+
+        assert not binding.pending
+        assert self.call_later.return_value.Stop.called
+        binding.flush()
+        assert not self.callback.called
+
+    def test_flush_without_pending_value(self):
+        """flush() should not update target if there is no pending value"""
+        binding = self._bind(debounce = 300)
+
+        binding.flush()
+
+        assert not self.callback.called
+
+    def test_destroy(self):
+        """should unbind events and drop pending value"""
+        binding = self._bind(debounce = 300)
+        self.evt_handler.ChangeValue('one')
+
+        binding.destroy()
+
+        assert self.call_later.return_value.Stop.called
+        assert not binding.pending
+        assert self.evt_handler.handlers == {}
+        self.evt_handler.ChangeValue('two')
+        assert not self.callback.called
+
+
+def _get_binding_context(attrs: list, **context) -> BindingContext:
+    xml_node = XmlNode('wx', 'TextCtrl', attrs = attrs)
+    return BindingContext(node = WxNode(TextEntryStub(), xml_node, NodeGlobals({'delay': 200})), **context)
+
+
+@mark.parametrize('attrs, expected', [
+    ([], BindingOptions()),
+    ([XmlAttr('Value', '{{vm.text}}')], BindingOptions()),
+    ([XmlAttr('debounce', '300', BINDING_NAMESPACE)], BindingOptions(debounce = 300)),
+    ([XmlAttr('throttle', '{delay}', BINDING_NAMESPACE)], BindingOptions(throttle = 200)),
+    ([XmlAttr('commit', 'true', BINDING_NAMESPACE)], BindingOptions(commit = True)),
+    ([XmlAttr('commit', '{False}', BINDING_NAMESPACE)], BindingOptions()),
+    ([XmlAttr('batch', 'True', BINDING_NAMESPACE)], BindingOptions(batch = True)),
+    ([XmlAttr('share', 'true', BINDING_NAMESPACE)], BindingOptions(share = True))
+]) # yapf: disable
+def test_get_binding_options(attrs, expected):
+    """should return options set by attributes with binding namespace"""
+    assert get_binding_options(_get_binding_context(attrs)) == expected
+
+
+def test_get_binding_options_from_context():
+    """should return options passed by binding rule"""
+    options = BindingOptions(debounce = 100)
+    context = _get_binding_context([XmlAttr('debounce', '300', BINDING_NAMESPACE)], binding_options = options)
+
+    assert get_binding_options(context) is options
+
+
+@mark.parametrize('attrs', [
+    [XmlAttr('delay', '300', BINDING_NAMESPACE)],
+    [XmlAttr('debounce', 'value', BINDING_NAMESPACE)],
+    [XmlAttr('debounce', '-1', BINDING_NAMESPACE)],
+    [XmlAttr('commit', 'yes', BINDING_NAMESPACE)],
+    [XmlAttr('debounce', '300', BINDING_NAMESPACE), XmlAttr('throttle', '300', BINDING_NAMESPACE)]
+]) # yapf: disable
+def test_get_binding_options_raises(attrs):
+    """should raise BindingError for invalid options"""
+    with raises(BindingError):
+        get_binding_options(_get_binding_context(attrs))
+
+
+@mark.parametrize('options, binding_type', [
+    (BindingOptions(), EventBinding),
+    (BindingOptions(debounce = 300), DeferredEventBinding),
+    (BindingOptions(throttle = 300), DeferredEventBinding),
+    (BindingOptions(commit = True), DeferredEventBinding),
+    (BindingOptions(batch = True), EventBinding)
+]) # yapf: disable
+def test_create_event_binding(options, binding_type):
+    """should create deferred binding if options require it"""
+    binding = create_event_binding(Mock(), TextEntryStub(), EVT_TEXT, options)
+
+    assert type(binding) is binding_type # pylint: disable=unidiomatic-typecheck
+
 
 class TextViewModel(BindableEntity):
 
@@ -126,10 +348,69 @@ class TextViewModel(BindableEntity):
         self.text_value = value
 
 
+@mark.parametrize('attrs, batched, binding_type', [
+    ([], False, BatchedExpressionBinding),
+    ([XmlAttr('share', 'true', BINDING_NAMESPACE)], False, SharedBinding),
+    ([XmlAttr('batch', 'true', BINDING_NAMESPACE)], True, BatchedExpressionBinding),
+    ([XmlAttr('batch', 'true', BINDING_NAMESPACE), XmlAttr('share', 'true', BINDING_NAMESPACE)], True,
+     BatchedExpressionBinding)
+]) # yapf: disable
+def test_bind_setter_to_batched_expression(attrs, batched, binding_type):
+    """should bind setter to shared expression if binding is shared or update it by update batcher if it is batched"""
+    node = WxNode(Mock(), XmlNode('wx', 'Gauge', attrs = attrs), NodeGlobals({'vm': TextViewModel(1)}))
+    setter = Mock()
+    context = BindingContext(node = node, xml_attr = XmlAttr('Value'), setter = setter,
+                             expression_body = 'vm.text_value')
+
+    with patch(batching.__name__ + '.GetApp'):
+        binding = bind_setter_to_batched_expression(context)
+        node.node_globals['vm'].text_value = 2
+        updated = setter.call_args_list[1:]
+        get_update_batcher().flush()
+    binding.destroy()
+
+    assert isinstance(binding, binding_type)
+    assert setter.call_args_list[0] == call(node, 'Value', 1)
+    assert updated == ([] if batched else [call(node, 'Value', 2)])
+    assert setter.call_args == call(node, 'Value', 2)
+
+
+@mark.parametrize('node_type, attr, value', [
+    (If, 'condition', True),
+    (For, 'items', ['item'])
+]) # yapf: disable
+def test_container_binding_is_marshalled(node_type, attr, value):
+    """should apply container binding changed in worker thread on GUI thread without batching"""
+    binder = Binder()
+    use_events_binding(binder = binder)
+    node = node_type(XmlNode('wxviews', node_type.__name__), NodeGlobals({'vm': TextViewModel()}))
+    threads = []
+    setter = Mock(side_effect = lambda *_: threads.append(current_thread()))
+    with patch(batching.__name__ + '.IsMainThread', lambda: current_thread() is main_thread()):
+        with patch(batching.__name__ + '.CallAfter') as call_after:
+            with patch.object(node, 'add_binding', wraps = node.add_binding) as add_binding:
+                binder.bind('oneway', BindingContext(node = node, xml_attr = XmlAttr(attr), setter = setter,
+                                                     expression_body = 'vm.text_value'))
+            worker = Thread(target = setattr, args = (node.node_globals['vm'], 'text_value', value))
+            worker.start()
+            worker.join()
+
+            assert setter.call_count == 1
+
+            call_after.call_args[0][0]()
+
+    binding = add_binding.call_args[0][0]
+    assert isinstance(binding, MarshalledExpressionBinding)
+    assert not isinstance(binding, BatchedExpressionBinding)
+    assert setter.call_args == call(node, attr, value)
+    assert threads == [main_thread(), main_thread()]
+    node.destroy()
+
+
 @fixture
 def text_binding_fixture(request):
     text, vm = TextEntryStub(), TextViewModel()
-    node = WxNode(text, Mock(), NodeGlobals({'vm': vm}))
+    node = WxNode(text, XmlNode('wx', 'TextCtrl'), NodeGlobals({'vm': vm}))
 
     context = BindingContext()
     context.node = node
@@ -185,6 +466,81 @@ class BindTextAndExpressionTests:
 
         assert self.vm.text_value == new_value
 
+    def test_commits_control_value(self):
+        """should update expression on commit if commit option is set"""
+        self.context['binding_options'] = BindingOptions(commit = True)
+        self.vm.text_value = 'one'
+
+        bind_text_and_expression(self.context)
+        self.text.ChangeValue('two')
+
+        assert self.vm.text_value == 'one'
+
+        self.text.handlers[EVT_KILL_FOCUS](Mock())
+
+        assert self.vm.text_value == 'two'
+
+
+class CountingViewModel(TextViewModel):
+
+    def __init__(self, value = None):
+        self.sets = 0
+        super().__init__(value)
+
+    def __setattr__(self, key, value):
+        if key == 'text_value':
+            self.sets += 1
+        super().__setattr__(key, value)
+
+
+@fixture
+def echo_binding_fixture(request):
+    text, vm, setter = EchoTextEntryStub(), CountingViewModel('one'), Mock(side_effect = call_set_attr)
+    node = WxNode(text, XmlNode('wx', 'TextCtrl'), NodeGlobals({'vm': vm}))
+    context = BindingContext(node = node, xml_attr = XmlAttr('Value'), setter = setter,
+                             expression_body = 'vm.text_value')
+    bind_text_and_expression(context)
+    vm.sets = 0
+    setter.reset_mock()
+
+    request.cls.text = text
+    request.cls.vm = vm
+    request.cls.setter = setter
+
+
+@mark.usefixtures('echo_binding_fixture')
+class EchoSuppressionTests:
+    """Two ways binding echo suppression tests"""
+
+    text: EchoTextEntryStub
+    vm: CountingViewModel
+    setter: Mock
+
+    def test_view_model_change_is_not_echoed(self):
+        """should not pass text event raised by setter back to expression"""
+        self.vm.text_value = 'two'
+
+        assert self.text.Value == 'two'
+        assert self.setter.call_count == 1
+        assert self.vm.sets == 1
+
+    def test_control_change_is_not_echoed(self):
+        """should not set value received from control back to control"""
+        self.text.ChangeValue('two')
+
+        assert self.vm.text_value == 'two'
+        assert self.vm.sets == 1
+        assert not self.setter.called
+
+    def test_equal_value_is_not_set(self):
+        """should not set value equal to control value"""
+        self.text.Value = 'two'
+        self.vm.sets = 0
+
+        self.vm.text_value = 'two'
+
+        assert not self.setter.called
+
 
 class CheckViewModel(BindableEntity):
 
@@ -196,7 +552,7 @@ class CheckViewModel(BindableEntity):
 @fixture
 def check_binding_fixture(request):
     checkbox, vm = CheckBoxStub(), CheckViewModel()
-    node = WxNode(checkbox, Mock(), NodeGlobals({'vm': vm}))
+    node = WxNode(checkbox, XmlNode('wx', 'CheckBox'), NodeGlobals({'vm': vm}))
 
     context = BindingContext()
     context.node = node
@@ -280,3 +636,14 @@ def test_check_control_and_property(control_type, binding_context, expected):
     actual = check_control_and_property(control_type, BindingContext(**binding_context))
 
     assert actual == expected
+
+
+@mark.parametrize('node, expected', [
+    (WxNode(Mock(), Mock()), True),
+    (SizerNode(Mock(), Mock()), True),
+    (Node(Mock()), False),
+    (None, False)
+]) # yapf: disable
+def test_check_wx_node(node, expected):
+    """should return true if binding target is wx node"""
+    assert check_wx_node(BindingContext(node = node)) == expected
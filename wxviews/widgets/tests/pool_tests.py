@@ -0,0 +1,130 @@
+from unittest.mock import Mock
+
+from pytest import mark
+from pyviews.core.xml import XmlNode
+from wx import Button, Frame, Window
+
+from wxviews.widgets.pool import WidgetPool, get_pool_key, get_widget_pool, use_widget_pool
+
+
+def _create_widget(parent = None):
+    widget = Mock()
+    widget.IsBeingDeleted.return_value = False
+    widget.GetParent.return_value = parent
+    widget.GetContainingSizer.return_value = None
+    return widget
+
+
+class WidgetPoolTests:
+    """WidgetPool tests"""
+
+    @staticmethod
+    def test_put_hides_and_detaches_widget():
+        """put() should detach widget from sizer and hide it"""
+        widget = _create_widget()
+        sizer = Mock()
+        widget.GetContainingSizer.return_value = sizer
+
+        result = WidgetPool().put('key', widget)
+
+        assert result
+        assert sizer.Detach.call_args[0] == (widget,)
+        assert widget.Hide.called
+
+    @staticmethod
+    def test_take_returns_stored_widget():
+        """take() should return and show stored widget for same key and parent"""
+        parent = Mock()
+        widget = _create_widget(parent)
+        pool = WidgetPool()
+        pool.put('key', widget)
+
+        assert pool.take('other', parent) is None
+        assert pool.take('key', parent) is widget
+        assert widget.Show.called
+        assert pool.size == 0
+
+    @staticmethod
+    def test_take_skips_deleted_widgets():
+        """take() should not return deleted widget"""
+        parent = Mock()
+        widget = _create_widget(parent)
+        pool = WidgetPool()
+        pool.put('key', widget)
+        widget.IsBeingDeleted.side_effect = RuntimeError()
+
+        assert pool.take('key', parent) is None
+        assert pool.size == 0
+
+    @staticmethod
+    def test_take_checks_parent():
+        """take() should not return widget of other parent"""
+        widget = _create_widget(Mock())
+        pool = WidgetPool()
+        pool.put('key', widget)
+
+        assert pool.take('key', Mock()) is None
+        assert widget.Destroy.called
+
+    @staticmethod
+    def test_evicts_least_recently_stored():
+        """should destroy least recently stored widgets above max size"""
+        widgets = [_create_widget() for _ in range(3)]
+        pool = WidgetPool(max_size = 2)
+
+        for widget in widgets:
+            pool.put('key', widget)
+
+        assert pool.size == 2
+        assert widgets[0].Destroy.called
+        assert not any(widget.Destroy.called for widget in widgets[1:])
+
+    @staticmethod
+    def test_does_not_store_with_zero_size():
+        """put() should return False if pool is disabled"""
+        widget = _create_widget()
+
+        assert not WidgetPool(max_size = 0).put('key', widget)
+        assert not widget.Hide.called
+
+    @staticmethod
+    def test_clear():
+        """clear() should destroy stored widgets"""
+        widget = _create_widget()
+        pool = WidgetPool()
+        pool.put('key', widget)
+
+        pool.clear()
+
+        assert widget.Destroy.called
+        assert pool.size == 0
+
+
+@mark.parametrize('inst_type, parent, args, pooled', [
+    (Button, Mock(), {'label': 'text'}, True),
+    (Button, None, {}, False),
+    (Frame, Mock(), {}, False),
+    (Mock, Mock(), {}, False),
+    (Button, Mock(), {'choices': ['one']}, False)
+]) # yapf: disable
+def test_get_pool_key(inst_type, parent, args, pooled):
+    """get_pool_key() should return key only for child windows with hashable args"""
+    xml_node = XmlNode('wx', inst_type.__name__)
+
+    key = get_pool_key(inst_type, parent, xml_node, args)
+
+    assert (key is not None) == pooled
+    if pooled:
+        assert key == get_pool_key(inst_type, parent, xml_node, dict(args))
+        assert issubclass(inst_type, Window)
+
+
+@mark.usefixtures('container_fixture')
+def test_use_widget_pool():
+    """use_widget_pool() should register pool"""
+    assert get_widget_pool() is None
+
+    pool = use_widget_pool(10)
+
+    assert get_widget_pool() is pool
+    assert pool.max_size == 10
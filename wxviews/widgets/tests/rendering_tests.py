@@ -1,11 +1,14 @@
 from typing import cast
-from unittest.mock import Mock, call
+from unittest.mock import Mock, call, patch
 
 from pytest import mark, raises
-from pyviews.core.rendering import XmlNode
+from pyviews.core.rendering import NodeGlobals, XmlNode
 from wx import EVT_BUTTON, EVT_MENU
 
 from wxviews.core.rendering import WxRenderingContext
+from wxviews.sizers import set_sizer_to_parent
+from wxviews.widgets import rendering
+from wxviews.widgets.pool import use_widget_pool
 from wxviews.widgets.rendering import WxNode, get_root, store_root
 
 
@@ -22,6 +25,16 @@ class WidgetNodeTests:
 
         assert instance.Destroy.called
 
+    @staticmethod
+    def test_destroy_cancels_queued_children():
+        """should remove queued children from progressive rendering"""
+        node = WxNode(Mock(), XmlNode('', ''))
+
+        with patch(rendering.__name__ + '.cancel') as cancel:
+            node.destroy()
+
+        assert cancel.call_args == call(node)
+
     @staticmethod
     @mark.parametrize('event, callback, args', [
         (EVT_MENU, lambda evt: None, {}),
@@ -38,6 +51,112 @@ class WidgetNodeTests:
 
         assert node.instance.Bind.call_args == call(event, callback, **args)
 
+    @staticmethod
+    def test_unbind_all():
+        """should unbind handlers bound by bind()"""
+        node = WxNode(Mock(), XmlNode('', ''))
+        node.bind(EVT_MENU, print, id = 105)
+
+        node.unbind_all()
+        node.unbind_all()
+
+        assert node.instance.Unbind.call_args_list == [call(EVT_MENU, handler = print, id = 105)]
+
+    @staticmethod
+    @mark.usefixtures('container_fixture')
+    def test_destroy_puts_instance_to_pool():
+        """should unbind handlers and store instance to pool instead of destroying"""
+        pool = Mock()
+        with patch(rendering.__name__ + '.get_widget_pool') as get_widget_pool:
+            get_widget_pool.return_value = pool
+            node = WxNode(Mock(), XmlNode('', ''))
+            node.pool_key = 'key'
+            node.bind(EVT_MENU, print)
+
+            node.destroy()
+
+        assert pool.put.call_args == call('key', node.instance)
+        assert node.instance.Unbind.called
+        assert not node.instance.Destroy.called
+
+    @staticmethod
+    def test_destroy_not_pooled():
+        """should destroy instance if pool rejected it"""
+        pool = Mock()
+        pool.put.return_value = False
+        with patch(rendering.__name__ + '.get_widget_pool') as get_widget_pool:
+            get_widget_pool.return_value = pool
+            node = WxNode(Mock(), XmlNode('', ''))
+            node.pool_key = 'key'
+
+            node.destroy()
+
+        assert node.instance.Destroy.called
+
+
+@mark.usefixtures('container_fixture')
+class CreateWidgetNodeTests:
+    """create_widget_node() tests"""
+
+    @staticmethod
+    def _get_context(parent):
+        return WxRenderingContext({
+            'xml_node': XmlNode('wx', 'Button'),
+            'parent': parent,
+            'node_globals': NodeGlobals()
+        })
+
+    def test_creates_widget(self):
+        """should create widget with parent if pool is not used"""
+        parent = Mock()
+        with patch(rendering.__name__ + '.get_node_type') as get_node_type:
+            node = rendering.create_widget_node(self._get_context(parent))
+
+        assert node.pool_key is None
+        assert node.instance is get_node_type.return_value.return_value
+        assert get_node_type.return_value.call_args == call(parent)
+
+    def test_takes_widget_from_pool(self):
+        """should reuse pooled widget of same xml node and parent"""
+        use_widget_pool()
+        parent = Mock()
+        context = self._get_context(parent)
+        pooled = Mock()
+        pooled.IsBeingDeleted.return_value = False
+        pooled.GetParent.return_value = parent
+        pooled.GetContainingSizer.return_value = None
+        with patch(rendering.__name__ + '.get_node_type') as get_node_type:
+            get_node_type.return_value = Mock(side_effect = lambda *_: pooled)
+            with patch(rendering.__name__ + '.get_pool_key') as get_pool_key:
+                get_pool_key.return_value = 'key'
+                first = rendering.create_widget_node(context)
+                first.destroy()
+                get_node_type.return_value.side_effect = lambda *_: Mock()
+
+                second = rendering.create_widget_node(context)
+
+        assert second.instance is pooled
+        assert pooled.Show.called
+
+
+def test_render_wx_children_context():
+    """should not pass parent sizer and styles to child of window, so nested sizer is set to child window"""
+    node = WxNode(Mock(), XmlNode('wx', 'Panel'), node_globals = NodeGlobals())
+    context = WxRenderingContext({'parent': Mock(), 'sizer': Mock(), 'node_styles': NodeGlobals()})
+    with patch(rendering.__name__ + '.render_children_progressively') as render_children:
+        rendering.render_wx_children(node, context)
+    get_child_context = render_children.call_args[0][2]
+    sizer_node = Mock()
+
+    child_context = get_child_context(XmlNode('wx', 'BoxSizer'), node, context)
+    set_sizer_to_parent(sizer_node, child_context)
+
+    assert child_context.parent is node.instance
+    assert 'sizer' not in child_context
+    assert 'node_styles' not in child_context
+    assert node.instance.SetSizer.call_args == call(sizer_node.instance, True)
+    assert not context.parent.SetSizer.called
+
 
 def test_root():
     """store_root should set WidgetNode.Root to passed node"""
@@ -1,10 +1,12 @@
-from unittest.mock import Mock, call
+from unittest.mock import Mock, call, patch
 
 import wx
 from pytest import fixture, mark
 from pyviews.core.rendering import NodeGlobals
 from wx.lib.newevent import NewEvent
 
+from wxviews.core import layout
+from wxviews.core.layout import flush_layout
 from wxviews.widgets import setters
 from wxviews.widgets.rendering import WxNode
 
@@ -54,7 +56,10 @@ class ShowTests:
         """should call Show"""
         self.sizer.IsShown.side_effect = lambda i: shown if self.node.instance == i else not shown
 
-        setters.show(self.node, 'sizer', value)
+        self.sizer.GetContainingWindow.return_value = None
+        with patch(layout.__name__ + '.CallAfter'):
+            setters.show(self.node, 'sizer', value)
+        flush_layout()
 
         if called:
             assert self.sizer.Show.call_args == call(self.node.instance, show = value)
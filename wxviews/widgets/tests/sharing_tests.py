@@ -0,0 +1,161 @@
+from unittest.mock import Mock, call
+
+from pytest import fixture, mark, raises
+from pyviews.core.binding import BindableEntity
+from pyviews.core.expression import ExpressionError
+from pyviews.core.rendering import Node, NodeGlobals
+
+from wxviews.core.globals import ChildGlobals
+from wxviews.widgets import sharing
+from wxviews.widgets.sharing import SharedBinding
+
+
+class ViewModel(BindableEntity):
+
+    def __init__(self, value = 0):
+        super().__init__()
+        self.value = value
+
+
+def _create_globals(parent: dict) -> ChildGlobals:
+    node_globals = ChildGlobals(parent)
+    Node(Mock(), node_globals)
+    return node_globals
+
+
+@fixture
+def sharing_fixture(request):
+    vm = ViewModel()
+    evaluate = Mock(side_effect = lambda value: value)
+    request.cls.vm = vm
+    request.cls.evaluate = evaluate
+    request.cls.root = NodeGlobals({'vm': vm, 'evaluate': evaluate})
+    request.cls.bindings = []
+    yield
+    for binding in request.cls.bindings:
+        binding.destroy()
+    assert not sharing._SHARED
+
+
+@mark.usefixtures(sharing_fixture.__name__)
+class SharedBindingTests:
+    """SharedBinding tests"""
+
+    vm: ViewModel
+    evaluate: Mock
+    root: NodeGlobals
+    bindings: list
+
+    def _bind(self, node_globals: dict, body: str = 'evaluate(vm.value)') -> Mock:
+        callback = Mock()
+        binding = SharedBinding(callback, body, node_globals)
+        binding.bind()
+        self.bindings.append(binding)
+        return callback
+
+    def test_evaluates_once(self):
+        """should evaluate expression once for bindings with same expression and scope"""
+        parent = _create_globals(self.root)
+        callbacks = [self._bind(_create_globals(parent)) for _ in range(5)]
+        self.evaluate.reset_mock()
+
+        self.vm.value = 1
+
+        assert self.evaluate.call_count == 1
+        assert all(callback.call_args_list == [call(0), call(1)] for callback in callbacks)
+        assert len({id(binding.shared) for binding in self.bindings}) == 1
+        assert self.bindings[0].shared.targets == 5
+
+    @mark.parametrize('bodies', [
+        ['evaluate(vm.value)', 'evaluate(vm.value + 0)'],
+        ['evaluate(vm.value) and node', 'evaluate(vm.value) and node']
+    ]) # yapf: disable
+    def test_evaluates_different_expressions(self, bodies):
+        """should evaluate different expressions or expressions using node separately"""
+        for body in bodies:
+            self._bind(_create_globals(self.root), body)
+        self.evaluate.reset_mock()
+
+        self.vm.value = 1
+
+        assert self.evaluate.call_count == 2
+
+    def test_evaluates_different_scopes(self):
+        """should evaluate expression separately for globals with own values"""
+        callbacks = []
+        for value in [1, 2]:
+            node_globals = _create_globals(self.root)
+            node_globals['vm'] = ViewModel(value)
+            callbacks.append(self._bind(node_globals, 'vm.value'))
+
+        assert [callback.call_args for callback in callbacks] == [call(1), call(2)]
+
+    def test_destroy(self):
+        """should unbind expression when all bindings are destroyed"""
+        callback = self._bind(_create_globals(self.root))
+        self._bind(_create_globals(self.root))
+        shared = self.bindings[0].shared
+
+        self.bindings[1].destroy()
+        self.vm.value = 1
+
+        assert shared.targets == 1
+        assert callback.call_args == call(1)
+
+        self.bindings[0].destroy()
+        callback.reset_mock()
+        self.vm.value = 2
+
+        assert not callback.called
+        assert not sharing._SHARED
+
+    def test_moves_binding_to_new_scope(self):
+        """should bind to another shared expression if parent globals are copied"""
+        parent = _create_globals(self.root)
+        callback = self._bind(_create_globals(parent), 'vm.value')
+        self._bind(_create_globals(self.root), 'vm.value')
+        parent['vm'] = ViewModel(5)
+
+        self.vm.value = 1
+
+        assert callback.call_args == call(5)
+        assert self.bindings[0].shared.scope is parent
+        assert self.bindings[1].shared.scope is self.root
+
+    def test_moves_binding_shadowed_by_node_globals(self):
+        """should bind to node globals if node sets value used by expression"""
+        node_globals = _create_globals(_create_globals(self.root))
+        callback = self._bind(node_globals, 'vm.value')
+
+        node_globals['vm'] = ViewModel(5)
+
+        assert callback.call_args_list == [call(0), call(5)]
+        assert self.bindings[0].shared.scope is node_globals
+
+    def test_moves_binding_shadowed_by_parent_globals(self):
+        """should bind to parent globals if parent sets value used by expression"""
+        parent = _create_globals(self.root)
+        callback = self._bind(_create_globals(parent), 'vm.value')
+
+        parent['vm'] = ViewModel(5)
+
+        assert callback.call_args_list == [call(0), call(5)]
+        assert self.bindings[0].shared.scope is parent
+
+    def test_ignores_not_used_keys(self):
+        """should not rebind if key not used by expression is set"""
+        node_globals = _create_globals(self.root)
+        callback = self._bind(node_globals, 'vm.value')
+
+        node_globals['other'] = 1
+
+        assert callback.call_args_list == [call(0)]
+
+    def test_raises_expression_error(self):
+        """should not keep shared expression if expression can't be evaluated"""
+        binding = SharedBinding(Mock(), 'vm.value +', _create_globals(self.root))
+
+        with raises(ExpressionError):
+            binding.bind()
+
+        assert not sharing._SHARED